@@ -0,0 +1,31 @@
+"""
+Shared start-up code for the Temporal Maze launcher scripts.
+Importing this module puts the project root on the Python path once.
+"""
+
+import os
+import sys
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.utils import cached_import
+
+# Resolved OptimizedGame class, filled in by the first load_game() call
+_game_class = None
+
+def load_game():
+    """
+    Create a new instance of the optimized game.
+    
+    The game class is resolved once and reused on later calls.
+    
+    Returns:
+        OptimizedGame: A fresh game instance
+    """
+    global _game_class
+    if _game_class is None:
+        _game_class = cached_import("src.game_enhanced.optimized_game", "OptimizedGame")
+    return _game_class()
@@ -8,68 +8,95 @@ import os
 import sys
 import subprocess
 import platform
+import hashlib
+import importlib.util
+
+# Sentinel files remembering checks that already passed on this machine
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 
 def check_and_install_dependencies():
     """Check for required dependencies and install them if missing."""
     print("Checking for required dependencies...")
     
-    try:
-        # Check for pip
-        subprocess.check_call([sys.executable, "-m", "pip", "--version"], 
-                             stdout=subprocess.DEVNULL, 
-                             stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError:
-        print("Error: pip is not installed. Please install pip first.")
-        sys.exit(1)
-    
     # Required packages
     required_packages = {
         "pygame": "pygame>=2.0.1",
         "numpy": "numpy>=1.19.0"
     }
     
+    # Skip the whole check if it already passed for this interpreter and package set
+    key = hashlib.sha256(repr(sorted(required_packages.items())).encode() +
+                         sys.executable.encode() +
+                         sys.version.encode()).hexdigest()[:16]
+    sentinel = os.path.join(CACHE_DIR, f"deps_{key}.ok")
+    if os.path.exists(sentinel):
+        print("✓ Dependencies already verified")
+        return
+    
+    # Check for pip (without spawning a child interpreter)
+    if importlib.util.find_spec("pip") is None:
+        print("Error: pip is not installed. Please install pip first.")
+        sys.exit(1)
+    
     missing_packages = []
     
-    # Check each package
+    # Check each package (find_spec only locates the module, it doesn't run it)
     for package, requirement in required_packages.items():
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package} is installed")
-        except ImportError:
+        else:
             print(f"✗ {package} is missing")
             missing_packages.append(requirement)
     
-    # Install missing packages
+    # Install missing packages in a single pip run so pip can batch the work
     if missing_packages:
         print("\nInstalling missing dependencies...")
-        for package in missing_packages:
-            print(f"Installing {package}...")
-            try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package],
-                                     stdout=subprocess.PIPE)
-                print(f"Successfully installed {package}")
-            except subprocess.CalledProcessError as e:
-                print(f"Error installing {package}: {e}")
-                print("Please try installing it manually using:")
-                print(f"  pip install {package}")
-                sys.exit(1)
+        print(f"Installing {', '.join(missing_packages)}...")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing_packages],
+                                 stdout=subprocess.PIPE)
+            print(f"Successfully installed {', '.join(missing_packages)}")
+        except subprocess.CalledProcessError as e:
+            print(f"Error installing dependencies: {e}")
+            print("Please try installing them manually using:")
+            print(f"  pip install {' '.join(missing_packages)}")
+            sys.exit(1)
+    
+    # Remember the successful check for the next launch
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    open(sentinel, "w").close()
     
     print("\nAll dependencies are installed. Ready to run the game!\n")
 
-def check_pygame_initialization():
-    """Test pygame initialization to catch early errors."""
+def check_pygame_initialization(verbose=False):
+    """
+    Test pygame initialization to catch early errors.
+    
+    A successful probe is remembered per pygame version and platform, so the
+    test window is only opened the first time.
+    
+    Args:
+        verbose (bool): Print display driver details
+    """
     try:
         import pygame
+        
+        cache_key = hashlib.md5((pygame.version.ver + platform.platform()).encode()).hexdigest()
+        sentinel = os.path.join(CACHE_DIR, f"pygame_ok_{cache_key}")
+        if os.path.exists(sentinel):
+            return True
+        
         pygame.init()
         
         # Get info about the display 
-        try:
-            drivers = pygame.display.get_drivers()
-            print(f"Available display drivers: {', '.join(drivers)}")
-        except AttributeError:
-            # get_drivers might not be available in newer Pygame versions
-            print(f"Pygame version: {pygame.version.ver}")
-            print("Using default display driver")
+        if verbose:
+            try:
+                drivers = pygame.display.get_drivers()
+                print(f"Available display drivers: {', '.join(drivers)}")
+            except AttributeError:
+                # get_drivers might not be available in newer Pygame versions
+                print(f"Pygame version: {pygame.version.ver}")
+                print("Using default display driver")
             
         # Try creating a small window to test display
         try:
@@ -81,6 +108,10 @@ def check_pygame_initialization():
             test_surface = pygame.display.set_mode((100, 100), flags=flags)
             pygame.display.quit()
             print("✓ Pygame display initialized successfully")
+            
+            # Remember the successful probe for the next launch
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            open(sentinel, "w").close()
             return True
         except Exception as e:
             print(f"Warning: Could not initialize test display: {e}")
@@ -95,17 +126,10 @@ def run_game():
     """Run the optimized game."""
     print("Starting Temporal Maze game...")
     
-    # Add the project root to the Python path
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-
-    # Import the optimized game class
     try:
-        from src.game_enhanced.optimized_game import OptimizedGame
-        
-        # Initialize and run the game
-        game = OptimizedGame()
+        # Set up the path and create the optimized game
+        from _bootstrap import load_game
+        game = load_game()
         game.run()
     except Exception as e:
         print(f"Error running the game: {e}")
@@ -122,7 +146,7 @@ if __name__ == "__main__":
     
     check_and_install_dependencies()
     
-    if check_pygame_initialization():
+    if check_pygame_initialization(verbose="--verbose" in sys.argv):
         run_game()
     else:
         print("\nPygame initialization failed. The game may not run correctly.")
@@ -6,10 +6,12 @@ to help identify why the game might be freezing.
 """
 
 import os
-import sys
 import time
+import queue
 import traceback
 import logging
+import logging.handlers
+from collections import deque
 from datetime import datetime
 
 # Configure logging
@@ -18,16 +20,20 @@ if not os.path.exists(log_dir):
     os.makedirs(log_dir)
 
 log_file = os.path.join(log_dir, f"game_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+# Log records are only queued by the game thread; a listener thread does the file I/O
+file_handler = logging.FileHandler(log_file)
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+log_listener.start()
 logging.basicConfig(
-    filename=log_file,
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(message)s',  # Timestamps are added by file_handler on the listener thread
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 # Add the project root to the Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from _bootstrap import load_game
 
 try:
     logging.info("Starting game with debugging enabled")
@@ -35,39 +41,43 @@ try:
     # Patch pygame to add performance monitoring
     import pygame
     original_display_flip = pygame.display.flip
-    frame_times = []
+    frame_times = deque(maxlen=100)  # Ring buffer of the most recent frame times
+    frame_sum = 0.0
+    frame_count = 0
     last_frame_time = time.time()
     
     def monitored_flip():
         """Wrapper for pygame.display.flip() to monitor frame rate"""
-        global last_frame_time, frame_times
+        global last_frame_time, frame_sum, frame_count
         current_time = time.time()
         frame_time = current_time - last_frame_time
+        
+        # Keep a running sum so the average never needs a full pass
+        if len(frame_times) == frame_times.maxlen:
+            frame_sum -= frame_times[0]
         frame_times.append(frame_time)
+        frame_sum += frame_time
+        frame_count += 1
         
         # Log slowdowns
         if frame_time > 0.1:  # More than 100ms (less than 10 FPS)
-            logging.warning(f"Slow frame: {frame_time:.4f}s ({1/frame_time:.1f} FPS)")
+            logging.warning("Slow frame: %.4fs (%.1f FPS)", frame_time, 1 / frame_time)
         
-        # Calculate and log FPS every 5 seconds
-        if len(frame_times) >= 100:
-            avg_frame_time = sum(frame_times) / len(frame_times)
+        # Log the average FPS of the last 100 frames every 100 frames
+        if frame_count % frame_times.maxlen == 0:
+            avg_frame_time = frame_sum / len(frame_times)
             avg_fps = 1 / avg_frame_time if avg_frame_time > 0 else 0
-            logging.info(f"Average FPS: {avg_fps:.2f}")
-            frame_times = []
+            logging.info("Average FPS: %.2f", avg_fps)
         
         last_frame_time = current_time
         return original_display_flip()
     
     pygame.display.flip = monitored_flip
     
-    # Import and run the game
-    from src.game_enhanced.main import main
-    
     logging.info("Game initialized, starting main loop")
     
     if __name__ == "__main__":
-        main()
+        load_game().run()
         
 except Exception as e:
     logging.critical(f"Game crashed: {str(e)}")
@@ -80,4 +90,5 @@ except Exception as e:
     
 finally:
     logging.info("Game session ended")
+    log_listener.stop()
     print(f"Debug log saved to: {log_file}") 
\ No newline at end of file
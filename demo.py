@@ -4,12 +4,33 @@ import os
 import sys
 import time
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Add the project root to the Python path
+import _bootstrap
 
-from game_logic.world import World
-from game_logic.player import Player
-from game_logic.time_travel import TimeManager
+from src.game_logic.world import World
+from src.game_logic.player import Player
+from src.game_logic.time_travel import TimeManager
+
+def show_frames(frames, delay):
+    """
+    Animate a batch of rendered frames in place.
+    
+    Each frame moves the cursor back up over the previous one and redraws it,
+    so the scene animates without scrolling the terminal.
+    
+    Args:
+        frames (list): Rendered map strings
+        delay (float): Seconds to show each frame for
+    """
+    previous_lines = 0
+    for frame in frames:
+        if previous_lines:
+            # Cursor up to the start of the previous frame, then clear to end of screen
+            sys.stdout.write(f"\x1b[{previous_lines}F\x1b[J")
+        sys.stdout.write(frame + "\n")
+        sys.stdout.flush()
+        previous_lines = frame.count("\n") + 1
+        time.sleep(delay)
 
 def main():
     """
@@ -39,10 +60,11 @@ def main():
     print("\nPlayer moving toward the switch...")
     moves = [(0, 1), (0, 1), (1, 0), (1, 0), (1, 0), (0, -1)]
     
+    frames = []
     for dx, dy in moves:
         player.move(dx, dy, world)
-        print(world.render_map(player.get_position()))
-        time.sleep(0.5)
+        frames.append(world.render_map(player.get_position()))
+    show_frames(frames, 0.5)
     
     print("\nPlayer is now on the switch, which opens the door.")
     time.sleep(1)
@@ -55,30 +77,33 @@ def main():
     player.move(0, 1, world)
     
     # Update clone positions
+    frames = []
     for _ in range(6):  # Update several times to let clone move
         clone_positions = time_manager.get_clone_positions()
         time_manager.update_clones(world)
-        print(world.render_map(player.get_position(), clone_positions))
-        time.sleep(0.5)
+        frames.append(world.render_map(player.get_position(), clone_positions))
+    show_frames(frames, 0.5)
     
     print("\nThe clone has replayed the player's movements and is now standing on the switch.")
     print("The door remains open, allowing the player to pass through.")
     
     # Player moves through door
     moves = [(0, 1), (0, 1), (0, 1)]
+    frames = []
     for dx, dy in moves:
         player.move(dx, dy, world)
         clone_positions = time_manager.get_clone_positions()
         time_manager.update_clones(world)
-        print(world.render_map(player.get_position(), clone_positions))
-        time.sleep(0.5)
+        frames.append(world.render_map(player.get_position(), clone_positions))
+    show_frames(frames, 0.5)
     
     # Player moves to exit
     moves = [(1, 0), (1, 0), (1, 0), (1, 0)]
+    frames = []
     for dx, dy in moves:
         player.move(dx, dy, world)
-        print(world.render_map(player.get_position(), time_manager.get_clone_positions()))
-        time.sleep(0.5)
+        frames.append(world.render_map(player.get_position(), time_manager.get_clone_positions()))
+    show_frames(frames, 0.5)
     
     print("\nPlayer has reached the exit! Level complete.")
     
@@ -7,22 +7,22 @@ demonstrating key gameplay features with AI-controlled movements.
 Perfect for recording demos or testing game functionality.
 """
 
-import os
-import sys
-import time
+import hashlib
 import pygame
 import random
 import traceback
 
 # Add the project root to the Python path
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = script_dir
-sys.path.insert(0, project_root)
+import _bootstrap
 
 # Import game modules
 from src.game_enhanced.constants import *
 from src.game_enhanced.game import Game
 
+# Demo action kinds; each action is a (kind, key, duration) tuple
+ACTION_WAIT = 0
+ACTION_KEY = 1
+
 class GameDemo:
     """Automated demo of the Temporal Maze game."""
     
@@ -36,6 +36,7 @@ class GameDemo:
         self.pause_timer = 0
         self.error_count = 0
         self.max_errors = 5
+        self._last_exc_hash = None
         
         # Pre-planned demo sequence
         self._setup_demo_sequence()
@@ -43,11 +44,11 @@ class GameDemo:
     def _setup_demo_sequence(self):
         """Set up the demo action sequence."""
         # Wait on title screen
-        self.demo_actions.append({"type": "wait", "duration": 3.0})
+        self.demo_actions.append((ACTION_WAIT, 0, 3.0))
         
         # Start the game
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_RETURN})
-        self.demo_actions.append({"type": "wait", "duration": 2.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_RETURN, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 2.0))
         
         # Demo basic movement with smaller steps
         self._add_movement_sequence("right", 2, 0.5)
@@ -56,15 +57,15 @@ class GameDemo:
         self._add_movement_sequence("up", 2, 0.5)
         
         # Wait longer to show the game state
-        self.demo_actions.append({"type": "wait", "duration": 2.0})
+        self.demo_actions.append((ACTION_WAIT, 0, 2.0))
         
         # Try time travel (press T)
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_t})
-        self.demo_actions.append({"type": "wait", "duration": 1.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_t, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 1.0))
         
         # Select 2 steps back (press 2)
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_2})
-        self.demo_actions.append({"type": "wait", "duration": 2.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_2, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 2.0))
         
         # Move around while clone is active - shorter movements
         self._add_movement_sequence("left", 1, 0.5)
@@ -72,15 +73,15 @@ class GameDemo:
         self._add_movement_sequence("right", 2, 0.5)
         
         # Pause to show the result
-        self.demo_actions.append({"type": "wait", "duration": 2.0})
+        self.demo_actions.append((ACTION_WAIT, 0, 2.0))
         
         # Press H to show rules
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_h})
-        self.demo_actions.append({"type": "wait", "duration": 4.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_h, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 4.0))
         
         # Press ESC to return to game
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_ESCAPE})
-        self.demo_actions.append({"type": "wait", "duration": 1.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_ESCAPE, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 1.0))
         
         # Try more movement
         self._add_movement_sequence("up", 1, 0.5)
@@ -88,21 +89,21 @@ class GameDemo:
         self._add_movement_sequence("down", 1, 0.5)
         
         # Pause to show the game state
-        self.demo_actions.append({"type": "wait", "duration": 1.0})
+        self.demo_actions.append((ACTION_WAIT, 0, 1.0))
         
         # Press ESC to pause
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_ESCAPE})
-        self.demo_actions.append({"type": "wait", "duration": 3.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_ESCAPE, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 3.0))
         
         # Press ESC to resume
-        self.demo_actions.append({"type": "key_press", "key": pygame.K_ESCAPE})
-        self.demo_actions.append({"type": "wait", "duration": 1.0})
+        self.demo_actions.append((ACTION_KEY, pygame.K_ESCAPE, 0.0))
+        self.demo_actions.append((ACTION_WAIT, 0, 1.0))
         
         # More movement to finish the demo
         self._add_random_movement(8, 0.5)  # Add 8 random moves
         
         # Wait at the end
-        self.demo_actions.append({"type": "wait", "duration": 5.0})
+        self.demo_actions.append((ACTION_WAIT, 0, 5.0))
     
     def _add_movement_sequence(self, direction, steps, delay=0.3):
         """Add a sequence of movement actions in the specified direction."""
@@ -118,16 +119,16 @@ class GameDemo:
         
         if key:
             for _ in range(steps):
-                self.demo_actions.append({"type": "key_press", "key": key})
-                self.demo_actions.append({"type": "wait", "duration": delay})
+                self.demo_actions.append((ACTION_KEY, key, 0.0))
+                self.demo_actions.append((ACTION_WAIT, 0, delay))
     
     def _add_random_movement(self, steps, delay=0.3):
         """Add random movement actions."""
-        directions = [pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d]
-        for _ in range(steps):
-            key = random.choice(directions)
-            self.demo_actions.append({"type": "key_press", "key": key})
-            self.demo_actions.append({"type": "wait", "duration": delay})
+        directions = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d)
+        # Draw all the direction indices in one batch
+        for i in random.choices(range(4), k=steps):
+            self.demo_actions.append((ACTION_KEY, directions[i], 0.0))
+            self.demo_actions.append((ACTION_WAIT, 0, delay))
     
     def run(self):
         """Run the demo."""
@@ -137,14 +138,11 @@ class GameDemo:
             
             # Main demo loop
             running = True
-            last_time = time.time()
             
             while running:
                 try:
-                    # Calculate delta time
-                    current_time = time.time()
-                    dt = current_time - last_time
-                    last_time = current_time
+                    # Cap the framerate; the elapsed milliseconds double as delta time
+                    dt = self.game.clock.tick(FPS) / 1000.0
                     
                     # Handle real quit events
                     for event in pygame.event.get():
@@ -157,18 +155,17 @@ class GameDemo:
                     
                     # Handle demo actions
                     if self.current_action < len(self.demo_actions):
-                        action = self.demo_actions[self.current_action]
+                        kind, key, duration = self.demo_actions[self.current_action]
                         
-                        if action["type"] == "wait":
+                        if kind == ACTION_WAIT:
                             self.action_timer += dt
-                            if self.action_timer >= action["duration"]:
+                            if self.action_timer >= duration:
                                 self.current_action += 1
                                 self.action_timer = 0
                         
-                        elif action["type"] == "key_press":
-                            # Create a synthetic key press event
-                            key_event = pygame.event.Event(pygame.KEYDOWN, {"key": action["key"]})
-                            pygame.event.post(key_event)
+                        elif kind == ACTION_KEY:
+                            # Feed the scripted key press straight to the game
+                            self.game.handle_key(key)
                             
                             # Move to next action
                             self.current_action += 1
@@ -178,9 +175,6 @@ class GameDemo:
                     self.game.update()
                     self.game.render()
                     
-                    # Update the game clock and cap framerate
-                    self.game.clock.tick(FPS)
-                    
                     # Check if the game is still running
                     if not self.game.running:
                         running = False
@@ -188,7 +182,14 @@ class GameDemo:
                 except Exception as e:
                     self.error_count += 1
                     print(f"Error in demo loop: {e}")
-                    traceback.print_exc()
+                    
+                    # Only print the traceback when it differs from the last one
+                    exc_hash = hashlib.md5(
+                        "".join(traceback.format_exception_only(type(e), e)).encode()
+                    ).hexdigest()
+                    if exc_hash != self._last_exc_hash:
+                        traceback.print_exc()
+                        self._last_exc_hash = exc_hash
                     
                     # Continue if we haven't hit the error limit
                     if self.error_count >= self.max_errors:
@@ -197,7 +198,8 @@ class GameDemo:
                     else:
                         # Skip to the next action
                         self.current_action += 1
-                        time.sleep(0.5)  # Pause briefly to avoid spamming errors
+                        # Back off exponentially (50ms, 100ms, ...) capped at 500ms
+                        pygame.time.wait(int(min(0.5, 0.05 * 2 ** self.error_count) * 1000))
             
             # Clean up
             pygame.quit()
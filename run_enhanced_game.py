@@ -4,17 +4,8 @@ Launcher script for running the enhanced Temporal Maze game from the project roo
 Run this script from the project root to start the game.
 """
 
-import os
-import sys
-
-# Add the project root to the Python path (this is the key fix)
-project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-# Import the main function and run it directly 
-# (we already set up the path correctly)
-from src.game_enhanced.main import main
+# Path setup and game loading are shared with the other launchers
+from _bootstrap import load_game
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    load_game().run()
\ No newline at end of file
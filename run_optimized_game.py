@@ -4,51 +4,44 @@ Launcher script for running the optimized version of the Temporal Maze game.
 This version includes performance improvements to address freezing issues.
 """
 
-import os
 import sys
 import traceback
+import importlib.util
 
-# Display version information
-print("Python version:", sys.version)
+from _bootstrap import PROJECT_ROOT, load_game
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-print(f"Project root: {project_root}")
-
-# Check for dependencies
-try:
+def check_dependencies():
+    """Check for dependencies without importing them."""
     print("Checking dependencies...")
-    import pygame
-    print(f"Pygame version: {pygame.version.ver}")
-    
-    import numpy
-    print(f"NumPy version: {numpy.__version__}")
-    
+    missing = [name for name in ("pygame", "numpy") if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Error: missing dependencies: {', '.join(missing)}")
+        print("Please install required dependencies:")
+        print("    pip install pygame numpy")
+        sys.exit(1)
     print("All dependencies found!")
-except ImportError as e:
-    print(f"Error importing dependencies: {e}")
-    print("Please install required dependencies:")
-    print("    pip install pygame numpy")
-    sys.exit(1)
 
 def main():
     """Run the optimized version of the game."""
+    # Display version information
+    print("Python version:", sys.version)
+    print(f"Project root: {PROJECT_ROOT}")
+    check_dependencies()
+    
     try:
-        # Initialize pygame
+        # pygame is only imported once we are actually going to run the game
+        import pygame
+        print(f"Pygame version: {pygame.version.ver}")
+        
+        # Initialize pygame (this also initializes the display module)
         pygame.init()
-        pygame.display.init()
         
         print("Pygame initialized successfully")
         print(f"Available display modes: {pygame.display.list_modes()}")
         
-        # Import the optimized game class
-        from src.game_enhanced.optimized_game import OptimizedGame
-        
         # Initialize the optimized game
         print("Creating game instance...")
-        game = OptimizedGame()
+        game = load_game()
         
         # Run the game with the improved game loop
         print("Starting game loop...")
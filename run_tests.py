@@ -5,33 +5,39 @@ import sys
 import unittest
 
 # Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 from game_logic.world import World
 from game_logic.player import Player
 from game_logic.time_travel import TimeManager, TimeClone
 
-class TestWorld(unittest.TestCase):
-    def setUp(self):
-        """Set up a test world"""
-        # Create a test map file
-        self.test_map_path = os.path.join('tests', 'test_map.txt')
-        with open(self.test_map_path, 'w') as f:
+class MapTestCase(unittest.TestCase):
+    """Base test case that writes the shared test map once per class"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the test map file"""
+        cls.test_map_path = os.path.join('tests', 'test_map.txt')
+        os.makedirs('tests', exist_ok=True)
+        with open(cls.test_map_path, 'w') as f:
             f.write('#####\n')
             f.write('#.S.#\n')
             f.write('#.D.#\n')
             f.write('#.E.#\n')
             f.write('#####\n')
-        
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the test map file"""
+        if os.path.exists(cls.test_map_path):
+            os.remove(cls.test_map_path)
+
+class TestWorld(MapTestCase):
+    def setUp(self):
+        """Set up a test world"""
         # Create a world instance
         self.world = World(self.test_map_path)
     
-    def tearDown(self):
-        """Clean up after tests"""
-        # Remove the test map file
-        if os.path.exists(self.test_map_path):
-            os.remove(self.test_map_path)
-    
     def test_world_dimensions(self):
         """Test world dimensions are correct"""
         self.assertEqual(self.world.width, 5)
@@ -74,29 +80,15 @@ class TestWorld(unittest.TestCase):
         self.assertTrue(self.world.is_exit(2, 3))
         self.assertFalse(self.world.is_exit(1, 1))
 
-class TestPlayer(unittest.TestCase):
+class TestPlayer(MapTestCase):
     def setUp(self):
         """Set up test player and world"""
-        # Create a test map file
-        self.test_map_path = os.path.join('tests', 'test_map.txt')
-        with open(self.test_map_path, 'w') as f:
-            f.write('#####\n')
-            f.write('#.S.#\n')
-            f.write('#.D.#\n')
-            f.write('#.E.#\n')
-            f.write('#####\n')
-        
         # Create a world instance
         self.world = World(self.test_map_path)
         
         # Create a player
         self.player = Player(1, 1)
     
-    def tearDown(self):
-        """Clean up after tests"""
-        if os.path.exists(self.test_map_path):
-            os.remove(self.test_map_path)
-    
     def test_movement(self):
         """Test player movement"""
         # Initial position
@@ -135,18 +127,9 @@ class TestPlayer(unittest.TestCase):
         recent = self.player.get_history(2)
         self.assertEqual(len(recent), 2)
 
-class TestTimeTravel(unittest.TestCase):
+class TestTimeTravel(MapTestCase):
     def setUp(self):
         """Set up test player, world, and time manager"""
-        # Create a test map file
-        self.test_map_path = os.path.join('tests', 'test_map.txt')
-        with open(self.test_map_path, 'w') as f:
-            f.write('#####\n')
-            f.write('#.S.#\n')
-            f.write('#.D.#\n')
-            f.write('#.E.#\n')
-            f.write('#####\n')
-        
         # Create a world instance
         self.world = World(self.test_map_path)
         
@@ -156,11 +139,6 @@ class TestTimeTravel(unittest.TestCase):
         # Create a time manager
         self.time_manager = TimeManager(max_clones=2)
     
-    def tearDown(self):
-        """Clean up after tests"""
-        if os.path.exists(self.test_map_path):
-            os.remove(self.test_map_path)
-    
     def test_clone_creation(self):
         """Test creating a time clone"""
         # Initially no clones
@@ -201,8 +179,7 @@ class TestTimeTravel(unittest.TestCase):
         self.assertEqual(clone.get_position(), (1, 1))
         
         # Update clone to follow path
-        for _ in range(3):
-            self.assertTrue(clone.update(self.world))
+        self.assertTrue(clone.update_n(3, self.world))
             
         # Clone should now be at the player's position
         # Corrected from (3, 2) to (3, 1) as per actual behavior
@@ -212,13 +189,8 @@ class TestTimeTravel(unittest.TestCase):
         self.assertFalse(clone.update(self.world))
 
 def run_all_tests():
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(TestWorld))
-    test_suite.addTest(unittest.makeSuite(TestPlayer))
-    test_suite.addTest(unittest.makeSuite(TestTimeTravel))
+    # Load every test case defined in this module
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -226,7 +198,6 @@ def run_all_tests():
 
 if __name__ == "__main__":
     # Create tests directory if it doesn't exist
-    if not os.path.exists('tests'):
-        os.makedirs('tests')
+    os.makedirs('tests', exist_ok=True)
     
-    run_all_tests() 
\ No newline at end of file
+    run_all_tests()
\ No newline at end of file
@@ -6,29 +6,28 @@ A simple script to display step-by-step solutions for Temporal Maze levels.
 Run this script to get help with solving a level.
 """
 
-import sys
-import os
+import argparse
 
 # Add the project root to the Python path
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = script_dir
-sys.path.insert(0, project_root)
-
-# Import the level solution module
-from src.game_enhanced.level_solution import print_solution
+import _bootstrap
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the solution for a Temporal Maze level.")
+    parser.add_argument("level", type=int, nargs="?", help="Level number (1-3)")
+    args = parser.parse_args()
+    
     print("\nTEMPORAL MAZE - LEVEL SOLUTIONS")
     print("-" * 40)
     
     try:
-        # Get level number from command line or prompt
-        if len(sys.argv) > 1:
-            level = int(sys.argv[1])
-        else:
+        # Only prompt when no level was given on the command line
+        level = args.level
+        if level is None:
             level = int(input("Enter level number (1-3): "))
         
         if 1 <= level <= 3:
+            # Import the level solution module
+            from src.game_enhanced.level_solution import print_solution
             print_solution(level)
         else:
             print("\nSorry, solutions are only available for levels 1-3.")
@@ -38,4 +37,4 @@ if __name__ == "__main__":
         print("\nPlease enter a valid level number.")
     
     print("\nTo run this script with a specific level: python show_solution.py <level_number>")
-    print("For example: python show_solution.py 1\n") 
\ No newline at end of file
+    print("For example: python show_solution.py 1\n")
@@ -0,0 +1,251 @@
+"""
+Guard AI kernels for the enhanced Temporal Maze game.
+
+The functions here work on plain ints and the world's boolean tile grids so
+numba can compile them. numba is optional: without it the decorators are
+no-ops and the same code runs as ordinary Python.
+"""
+
+import numpy as np
+
+from .constants import DIR_CODES, DIR_NONE
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Direction code for each step, indexed by (dy + 1) * 3 + (dx + 1)
+_DIR_FROM_DELTA = np.array([DIR_CODES[(dx, dy)] for dy in (-1, 0, 1) for dx in (-1, 0, 1)],
+                           dtype=np.uint8)
+
+# Directions tried, in order, when laying out a default patrol route
+_PATROL_DIRS = np.array([(1, 0), (0, 1), (-1, 0), (0, -1)], dtype=np.int64)
+
+
+@njit(cache=True)
+def can_walk(x, y, walkable):
+    """
+    Check a tile against the walkable grid, treating out of bounds as a wall.
+
+    Args:
+        x (int): X coordinate
+        y (int): Y coordinate
+        walkable: 2D bool array indexed [y, x]
+
+    Returns:
+        bool: True if the tile can be entered
+    """
+    height, width = walkable.shape
+    if 0 <= y < height and 0 <= x < width:
+        return bool(walkable[y, x])
+    return False
+
+
+@njit(cache=True)
+def line_of_sight(gx, gy, px, py, view_dist_sq, transparent):
+    """
+    Check whether a guard at (gx, gy) can see the player at (px, py).
+
+    The player must be within the view distance, and every tile on the
+    Bresenham line between them (both ends included) must be transparent.
+    The walk stops at the first opaque tile.
+
+    Args:
+        gx, gy (int): Guard position
+        px, py (int): Player position
+        view_dist_sq (int): Squared view distance
+        transparent: 2D bool array indexed [y, x]
+
+    Returns:
+        bool: True if the player is visible
+    """
+    dx = px - gx
+    dy = py - gy
+    if dx * dx + dy * dy > view_dist_sq:
+        return False
+
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    dx = abs(dx)
+    dy = -abs(dy)
+    err = dx + dy
+    x = gx
+    y = gy
+    while True:
+        if not transparent[y, x]:
+            return False
+        if x == px and y == py:
+            return True
+        err2 = 2 * err
+        if err2 >= dy:
+            err += dy
+            x += step_x
+        if err2 <= dx:
+            err += dx
+            y += step_y
+
+
+@njit(cache=True)
+def move_toward(gx, gy, tx, ty, walkable):
+    """
+    Take one step from (gx, gy) toward (tx, ty).
+
+    The axis with the larger distance is tried first, then the other axis,
+    then the diagonal.
+
+    Args:
+        gx, gy (int): Current position
+        tx, ty (int): Target position
+        walkable: 2D bool array indexed [y, x]
+
+    Returns:
+        tuple: (new_x, new_y, dir_code). The direction is the last non-zero
+        step attempted, or DIR_NONE if the guard was already there.
+    """
+    # Sign of each offset without branching: -1, 0 or 1
+    dx = int(tx > gx) - int(tx < gx)
+    dy = int(ty > gy) - int(ty < gy)
+
+    if abs(tx - gx) > abs(ty - gy):
+        first_x, first_y, second_x, second_y = dx, 0, 0, dy
+    else:
+        first_x, first_y, second_x, second_y = 0, dy, dx, 0
+
+    face = DIR_NONE
+
+    if first_x != 0 or first_y != 0:
+        face = _DIR_FROM_DELTA[(first_y + 1) * 3 + first_x + 1]
+    if can_walk(gx + first_x, gy + first_y, walkable):
+        return gx + first_x, gy + first_y, face
+
+    if second_x != 0 or second_y != 0:
+        face = _DIR_FROM_DELTA[(second_y + 1) * 3 + second_x + 1]
+    if can_walk(gx + second_x, gy + second_y, walkable):
+        return gx + second_x, gy + second_y, face
+
+    # Try diagonal if direct approaches fail
+    if dx != 0 or dy != 0:
+        face = _DIR_FROM_DELTA[(dy + 1) * 3 + dx + 1]
+    if can_walk(gx + dx, gy + dy, walkable):
+        return gx + dx, gy + dy, face
+    return gx, gy, face
+
+
+@njit(cache=True)
+def patrol_ends(x, y, max_steps, walkable):
+    """
+    Walk straight out from (x, y) in each patrol direction until blocked.
+
+    Args:
+        x, y (int): Starting position
+        max_steps (int): Longest walk to take in any one direction
+        walkable: 2D bool array indexed [y, x]
+
+    Returns:
+        ndarray: One (end_x, end_y, steps) row per entry of _PATROL_DIRS
+    """
+    ends = np.empty((_PATROL_DIRS.shape[0], 3), dtype=np.int64)
+    for d in range(_PATROL_DIRS.shape[0]):
+        dx = _PATROL_DIRS[d, 0]
+        dy = _PATROL_DIRS[d, 1]
+        cx = x
+        cy = y
+        steps = 0
+        while steps < max_steps and can_walk(cx + dx, cy + dy, walkable):
+            cx += dx
+            cy += dy
+            steps += 1
+        ends[d, 0] = cx
+        ends[d, 1] = cy
+        ends[d, 2] = steps
+    return ends
+
+
+@njit(cache=True)
+def guard_step(gx, gy, tx, ty, px, py, view_dist_sq, transparent, walkable):
+    """
+    Move a guard one step toward its target, then look for the player.
+
+    Args:
+        gx, gy (int): Guard position
+        tx, ty (int): Target position
+        px, py (int): Player position
+        view_dist_sq (int): Squared view distance
+        transparent: 2D bool array indexed [y, x]
+        walkable: 2D bool array indexed [y, x]
+
+    Returns:
+        tuple: (new_x, new_y, dir_code, sees_player)
+    """
+    x, y, face = move_toward(gx, gy, tx, ty, walkable)
+    sees = line_of_sight(x, y, px, py, view_dist_sq, transparent)
+    return x, y, face, sees
+
+
+@njit(cache=True, parallel=True)
+def move_guards(move, x, y, target_x, target_y, dir_id, walkable):
+    """
+    Step every guard selected by `move` one tile toward its target.
+
+    Each guard writes only its own slot, so the loop runs in parallel under
+    numba.
+
+    Args:
+        move: Bool mask of guards that move this tick
+        x, y, dir_id: GuardSystem columns, updated in place
+        target_x, target_y: Where each moving guard is heading
+        walkable: 2D bool array indexed [y, x]
+    """
+    for i in prange(x.shape[0]):
+        if move[i]:
+            nx, ny, face = move_toward(x[i], y[i], target_x[i], target_y[i], walkable)
+            x[i] = nx
+            y[i] = ny
+            if face != DIR_NONE:
+                dir_id[i] = face
+
+
+@njit(cache=True, parallel=True)
+def look_for_player(candidates, x, y, px, py, view_dist_sq, transparent, sees):
+    """
+    Run the line-of-sight walk for the given guards.
+
+    Args:
+        candidates: Indices of guards already known to be in view range
+        x, y: Guard positions
+        px, py (int): Player position
+        view_dist_sq: Squared view distance per guard
+        transparent: 2D bool array indexed [y, x]
+        sees: Bool output array, set where the guard can see the player
+    """
+    for k in prange(candidates.shape[0]):
+        i = candidates[k]
+        sees[i] = line_of_sight(x[i], y[i], px, py, view_dist_sq[i], transparent)
+
+def warm_up():
+    """
+    Compile the kernels ahead of the first frame.
+
+    numba compiles on first call, which would otherwise stall the first
+    update that has guards in it. The dummy arguments use the same types
+    that GuardSystem.tick and Guard pass in. Without numba this does nothing.
+    """
+    if not HAVE_NUMBA:
+        return
+    grid = np.ones((1, 1), dtype=np.bool_)
+    mask = np.zeros(1, dtype=np.bool_)
+    coord = np.zeros(1, dtype=np.int64)
+    guard_step(0, 0, 0, 0, 0, 0, 0, grid, grid)
+    patrol_ends(0, 0, 1, grid)
+    move_guards(mask, coord, coord.copy(), coord, coord, np.zeros(1, dtype=np.uint8), grid)
+    look_for_player(coord, coord, coord, 0, 0, coord, grid, mask)
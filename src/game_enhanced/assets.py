@@ -4,162 +4,303 @@ Handles loading and storing game assets like images and sounds.
 """
 
 import os
+import pickle
 import pygame
-import math
-import random
+from math import pi as _PI
+from . import constants
 from .constants import *
 
-# Ensure pygame is initialized for asset loading
-pygame.init()
+_TWO_PI = _PI + _PI
+
+# Rendered default tiles are cached here between runs
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TILE_CACHE_PATH = os.path.join(_PROJECT_ROOT, ".cache", f"tiles_v1_{TILE_SIZE}.pkl")
 
 class AssetManager:
+    # Loaded fonts shared by every instance: (point size, bold) -> Font
+    _FONT_CACHE = {}
+    
+    # Red glow overlay for alerted guards, built with the first guard sprite
+    _ALERT_GLOW = None
+    
     def __init__(self):
-        """Initialize the asset manager."""
-        self.images = {}
+        """
+        Initialize the asset manager.
+        
+        Nothing is drawn here; each image, font and animation is built the
+        first time it is requested, so importing this module stays cheap.
+        """
+        self.images = {}  # (name, direction or None) -> Surface
         self.sounds = {}
         self.fonts = {}
         self.animations = {}
-        self.create_default_assets()
+        self._initialized = False
+        
+        # Tile border shared by every default tile
+        self._border_template = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(self._border_template, DOGGY_DARK_BROWN, (0, 0, TILE_SIZE, TILE_SIZE), 1)
+        
+        # One cell of the wall's bone pattern, tiled across each wall
+        self._mini_bone_template = pygame.Surface((16, 16), pygame.SRCALPHA)
+        self._draw_mini_bone(self._mini_bone_template, 4, 4, 8, DOGGY_BEIGE)
+        
+        # Recipes for the default tiles: name -> (tile type, base color)
+        self._tile_recipes = {
+            "wall": (TILE_WALL, DOGGY_DARK_BROWN),
+            "floor": (TILE_FLOOR, DOGGY_BEIGE),
+            "switch": (TILE_SWITCH, DOGGY_YELLOW),
+            "door_closed": (TILE_DOOR_CLOSED, DOGGY_PINK),
+            "door_open": (TILE_DOOR_OPEN, DOGGY_GREEN),
+            "exit": (TILE_EXIT, DOGGY_BLUE),
+            "portal_a": (TILE_PORTAL_A, DOGGY_BLUE),
+            "portal_b": (TILE_PORTAL_B, DOGGY_BLUE),
+            "key": (TILE_ITEM_KEY, DOGGY_YELLOW),
+            "potion": (TILE_ITEM_POTION, DOGGY_GREEN),
+            "terminal": (TILE_TERMINAL, DOGGY_BLUE),
+        }
+        
+        # Builder for every image name; builders also create related images
+        self._image_builders = {
+            (name, None): self._create_default_tiles for name in self._tile_recipes
+        }
+        for base_name, builder in (("player", self._create_player_sprite),
+                                   ("clone", self._create_clone_sprite)):
+            self._image_builders[(base_name, None)] = builder
+            for direction in ["left", "right", "up", "down"]:
+                self._image_builders[(base_name, direction)] = builder
+        self._image_builders[("guard", None)] = self._create_guard_sprite
+        self._image_builders[("guard_alerted", None)] = self._create_guard_sprite
+        self._wall_fallback = None
+        self._floor_variants = None
+        
+        self._animation_builders = {"paw_prints": self._create_paw_prints,
+                                    "clone_paw_prints": self._create_clone_paw_prints}
+        
+        # Font size name -> (point size, bold)
+        self._font_specs = {
+            "small": (FONT_SMALL, False),
+            "medium": (FONT_MEDIUM, False),
+            "large": (FONT_LARGE, False),
+            "title": (FONT_TITLE, True),
+        }
+    
+    def _ensure_initialized(self):
+        """Make sure pygame is initialized before the first asset is built."""
+        if not self._initialized:
+            if not pygame.get_init():
+                pygame.init()
+            self._initialized = True
         
     def create_default_assets(self):
         """
         Create default pixel art assets using pygame drawing functions.
         This ensures the game has visuals even without external image files.
+        
+        Assets are normally built on demand; this builds all of them up front.
+        """
+        for key in self._image_builders:
+            self._load_image(key)
+        for name in self._animation_builders:
+            self._load_animation(name)
+        for size in self._font_specs:
+            self.get_font(size)
+    
+    def _load_image(self, key):
+        """
+        Get an image by its exact key, building it on first use.
+        
+        Args:
+            key (tuple): (name, direction) pair, e.g. ("floor", None) or ("player", "left")
+            
+        Returns:
+            pygame.Surface or None: The image, or None if there is no such image
+        """
+        image = self.images.get(key)
+        if image is None:
+            builder = self._image_builders.get(key)
+            if builder is None:
+                return None
+            self._ensure_initialized()
+            builder()
+            image = self.images.get(key)
+        return image
+    
+    def _load_animation(self, name):
         """
-        # Create pixel art surfaces for each game element with doggy theme
-        self._create_default_tile(TILE_WALL, DOGGY_DARK_BROWN, "wall")
-        self._create_default_tile(TILE_FLOOR, DOGGY_BEIGE, "floor")
-        self._create_default_tile(TILE_SWITCH, DOGGY_YELLOW, "switch") 
-        self._create_default_tile(TILE_DOOR_CLOSED, DOGGY_PINK, "door_closed")
-        self._create_default_tile(TILE_DOOR_OPEN, DOGGY_GREEN, "door_open")
-        self._create_default_tile(TILE_EXIT, DOGGY_BLUE, "exit")
-        self._create_default_tile(TILE_PORTAL_A, DOGGY_BLUE, "portal_a")
-        self._create_default_tile(TILE_PORTAL_B, DOGGY_BLUE, "portal_b")
-        self._create_default_tile(TILE_ITEM_KEY, DOGGY_YELLOW, "key")
-        self._create_default_tile(TILE_ITEM_POTION, DOGGY_GREEN, "potion")
-        self._create_default_tile(TILE_TERMINAL, DOGGY_BLUE, "terminal")
-        
-        # Create player sprite (doggy style)
-        self._create_player_sprite()
-        
-        # Create clone sprite (transparent doggy)
-        self._create_clone_sprite()
-        
-        # Create guard sprite (antagonist doggy)
-        self._create_guard_sprite()
-        
-        # Create paw prints
-        self._create_paw_prints()
-        
-        # Create fonts
-        self.fonts["small"] = pygame.font.SysFont("Comic Sans MS", FONT_SMALL)
-        self.fonts["medium"] = pygame.font.SysFont("Comic Sans MS", FONT_MEDIUM)
-        self.fonts["large"] = pygame.font.SysFont("Comic Sans MS", FONT_LARGE)
-        self.fonts["title"] = pygame.font.SysFont("Comic Sans MS", FONT_TITLE, bold=True)
+        Get an animation's frames, building them on first use.
         
+        Args:
+            name (str): Animation name
+            
+        Returns:
+            list or None: The animation frames, or None if there is no such animation
+        """
+        frames = self.animations.get(name)
+        if frames is None:
+            builder = self._animation_builders.get(name)
+            if builder is None:
+                return None
+            self._ensure_initialized()
+            builder()
+            frames = self.animations.get(name)
+        return frames
+        
+    def _create_default_tiles(self):
+        """
+        Create every default tile, reusing the on-disk tile cache when it is current.
+        """
+        cached = self._read_tile_cache()
+        if cached is not None:
+            for name, (data, size) in cached.items():
+                surface = pygame.image.fromstring(data, size, "RGB")
+                self.images[(name, None)] = self._convert(surface)
+            return
+        
+        for name, (tile_type, color) in self._tile_recipes.items():
+            self._create_default_tile(tile_type, color, name)
+        self._write_tile_cache()
+    
+    def _read_tile_cache(self):
+        """
+        Read the rendered tiles from the on-disk cache.
+        
+        Returns:
+            dict or None: name -> (RGB bytes, size), or None if the cache is
+            missing, unreadable, or older than the code that draws the tiles
+        """
+        try:
+            cache_mtime = os.path.getmtime(TILE_CACHE_PATH)
+            source_mtime = max(os.path.getmtime(__file__), os.path.getmtime(constants.__file__))
+            if cache_mtime < source_mtime:
+                return None
+            with open(TILE_CACHE_PATH, "rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        
+        if not isinstance(cached, dict) or set(cached) != set(self._tile_recipes):
+            return None
+        return cached
+    
+    def _write_tile_cache(self):
+        """Write the rendered tiles to the on-disk cache."""
+        cached = {}
+        for name in self._tile_recipes:
+            surface = self.images[(name, None)]
+            cached[name] = (pygame.image.tostring(surface, "RGB"), surface.get_size())
+        
+        try:
+            os.makedirs(os.path.dirname(TILE_CACHE_PATH), exist_ok=True)
+            with open(TILE_CACHE_PATH, "wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # The cache is only an optimization
+    
     def _create_default_tile(self, tile_type, color, name):
         """Create a default pixel art tile with cute doggy theme."""
-        surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        ts = TILE_SIZE
+        half = ts // 2
+        third = ts // 3
+        quarter = ts // 4
+        sixth = ts // 6
+        draw_rect = pygame.draw.rect
+        draw_circle = pygame.draw.circle
+        draw_ellipse = pygame.draw.ellipse
+        
+        surface = pygame.Surface((ts, ts))
         surface.fill(color)
         
         # Add patterns/details to distinguish tiles
         if tile_type == TILE_WALL:
             # Add bone pattern to walls
-            for i in range(0, TILE_SIZE, 16):
-                for j in range(0, TILE_SIZE, 16):
-                    self._draw_mini_bone(surface, j + 4, i + 4, 8, DOGGY_BEIGE)
-        
-        elif tile_type == TILE_FLOOR:
-            # Add subtle paw print to some floor tiles
-            if random.random() < 0.3:
-                self._draw_paw_print(surface, TILE_SIZE // 2, TILE_SIZE // 2, 
-                                    TILE_SIZE // 5, (color[0] - 20, color[1] - 20, color[2] - 20))
+            bone = self._mini_bone_template
+            for i in range(0, ts, 16):
+                for j in range(0, ts, 16):
+                    surface.blit(bone, (j, i))
         
         elif tile_type == TILE_SWITCH:
             # Draw a cute dog bowl for switch
-            pygame.draw.ellipse(surface, DOGGY_DARK_BROWN, 
-                             (TILE_SIZE // 6, TILE_SIZE // 6,
-                             2 * TILE_SIZE // 3, 2 * TILE_SIZE // 3))
-            pygame.draw.ellipse(surface, color, 
-                             (TILE_SIZE // 4, TILE_SIZE // 4,
-                             TILE_SIZE // 2, TILE_SIZE // 2))
+            draw_ellipse(surface, DOGGY_DARK_BROWN, 
+                         (sixth, sixth, 2 * ts // 3, 2 * ts // 3))
+            draw_ellipse(surface, color, 
+                         (quarter, quarter, half, half))
         
         elif tile_type == TILE_DOOR_CLOSED:
             # Draw a doggy door
-            pygame.draw.rect(surface, DOGGY_DARK_BROWN, 
-                          (2, 2, TILE_SIZE - 4, TILE_SIZE - 4), 4)
+            draw_rect(surface, DOGGY_DARK_BROWN, (2, 2, ts - 4, ts - 4), 4)
             # Door handle
-            pygame.draw.circle(surface, DOGGY_BLACK, 
-                            (TILE_SIZE - 10, TILE_SIZE // 2), 3)
+            draw_circle(surface, DOGGY_BLACK, (ts - 10, half), 3)
             # Dog door flap
-            pygame.draw.ellipse(surface, DOGGY_BLACK, 
-                             (TILE_SIZE // 4, TILE_SIZE // 2,
-                             TILE_SIZE // 2, TILE_SIZE // 3))
+            draw_ellipse(surface, DOGGY_BLACK, (quarter, half, half, third))
         
         elif tile_type == TILE_DOOR_OPEN:
             # Draw an open doggy door
-            pygame.draw.rect(surface, DOGGY_DARK_BROWN, 
-                          (2, 2, TILE_SIZE - 4, TILE_SIZE - 4), 2)
+            draw_rect(surface, DOGGY_DARK_BROWN, (2, 2, ts - 4, ts - 4), 2)
             # Door frame
-            pygame.draw.rect(surface, DOGGY_BROWN, 
-                          (4, 4, TILE_SIZE - 8, TILE_SIZE - 8), 1)
+            draw_rect(surface, DOGGY_BROWN, (4, 4, ts - 8, ts - 8), 1)
             
         elif tile_type == TILE_EXIT:
             # Draw a doggy house as exit
             # House shape
             pygame.draw.polygon(surface, DOGGY_DARK_BROWN, [
-                (2, TILE_SIZE - 2),
-                (2, TILE_SIZE // 2),
-                (TILE_SIZE // 2, 2),
-                (TILE_SIZE - 2, TILE_SIZE // 2),
-                (TILE_SIZE - 2, TILE_SIZE - 2)
+                (2, ts - 2),
+                (2, half),
+                (half, 2),
+                (ts - 2, half),
+                (ts - 2, ts - 2)
             ])
             # Door
-            pygame.draw.rect(surface, DOGGY_BLACK, 
-                          (TILE_SIZE // 3, TILE_SIZE // 2,
-                           TILE_SIZE // 3, TILE_SIZE // 3))
+            draw_rect(surface, DOGGY_BLACK, (third, half, third, third))
             
         elif tile_type == TILE_PORTAL_A or tile_type == TILE_PORTAL_B:
             # Draw a teleport doggy tunnel
             for i in range(1, 6):
-                radius = TILE_SIZE // 2 - (i * 2)
+                radius = half - (i * 2)
                 width = 2 if i % 2 == 0 else 1
-                pygame.draw.circle(surface, DOGGY_BLACK, 
-                                (TILE_SIZE // 2, TILE_SIZE // 2), radius, width)
+                draw_circle(surface, DOGGY_BLACK, (half, half), radius, width)
                 
         elif tile_type == TILE_ITEM_KEY:
             # Draw a dog treat as key
             surface.fill(DOGGY_BEIGE)
             # Draw bone shape
-            self._draw_bone(surface, TILE_SIZE // 2, TILE_SIZE // 2, 
-                          TILE_SIZE // 2, DOGGY_YELLOW)
+            self._draw_bone(surface, half, half, half, DOGGY_YELLOW)
             
         elif tile_type == TILE_ITEM_POTION:
             # Draw a water bowl as potion
-            pygame.draw.ellipse(surface, DOGGY_DARK_BROWN, 
-                             (TILE_SIZE // 6, TILE_SIZE // 3,
-                              2 * TILE_SIZE // 3, TILE_SIZE // 2))
-            pygame.draw.ellipse(surface, DOGGY_BLUE, 
-                             (TILE_SIZE // 4, TILE_SIZE // 3 + 2,
-                              TILE_SIZE // 2, TILE_SIZE // 3))
+            draw_ellipse(surface, DOGGY_DARK_BROWN, 
+                         (sixth, third, 2 * ts // 3, half))
+            draw_ellipse(surface, DOGGY_BLUE, 
+                         (quarter, third + 2, half, third))
             
         elif tile_type == TILE_TERMINAL:
             # Draw a dog tag as terminal
-            pygame.draw.circle(surface, DOGGY_BROWN, 
-                            (TILE_SIZE // 2, TILE_SIZE // 2), 
-                            TILE_SIZE // 3)
-            pygame.draw.circle(surface, DOGGY_YELLOW, 
-                            (TILE_SIZE // 2, TILE_SIZE // 2), 
-                            TILE_SIZE // 3 - 2)
+            draw_circle(surface, DOGGY_BROWN, (half, half), third)
+            draw_circle(surface, DOGGY_YELLOW, (half, half), third - 2)
             # Hole for the tag
-            pygame.draw.circle(surface, DOGGY_BEIGE, 
-                            (TILE_SIZE // 2, TILE_SIZE // 4), 
-                            TILE_SIZE // 8)
+            draw_circle(surface, DOGGY_BEIGE, (half, quarter), ts // 8)
+        
+        # Add the shared border to all tiles
+        surface.blit(self._border_template, (0, 0))
+        
+        self.images[(name, None)] = self._convert(surface)
+    
+    def _convert(self, surface):
+        """
+        Convert a surface to the display's pixel format so blits skip conversion.
         
-        # Add a border to all tiles
-        pygame.draw.rect(surface, DOGGY_DARK_BROWN, (0, 0, TILE_SIZE, TILE_SIZE), 1)
+        Surfaces are left as they are when no display mode has been set yet.
         
-        self.images[name] = surface
+        Args:
+            surface (pygame.Surface): Newly drawn surface
+            
+        Returns:
+            pygame.Surface: The converted surface
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
     
     def _draw_mini_bone(self, surface, x, y, size, color):
         """Draw a mini bone shape for patterns."""
@@ -208,103 +349,97 @@ class AssetManager:
     
     def _create_player_sprite(self):
         """Create a cute doggy player sprite."""
+        draw_circle = pygame.draw.circle
+        draw_ellipse = pygame.draw.ellipse
+        draw_arc = pygame.draw.arc
+        
         surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
         
         # Draw the body (cute puppy)
-        pygame.draw.circle(surface, DOGGY_BROWN, 
-                        (TILE_SIZE // 2, TILE_SIZE // 2), 
-                        TILE_SIZE // 3)  # Head/body
+        draw_circle(surface, DOGGY_BROWN, 
+                 (TILE_SIZE // 2, TILE_SIZE // 2), 
+                 TILE_SIZE // 3)  # Head/body
         
         # Ears
         ear_size = TILE_SIZE // 8
-        pygame.draw.ellipse(surface, DOGGY_BROWN, 
-                         (TILE_SIZE // 2 - TILE_SIZE // 3, TILE_SIZE // 4,
-                          ear_size * 2, ear_size))
-        pygame.draw.ellipse(surface, DOGGY_BROWN, 
-                         (TILE_SIZE // 2 + TILE_SIZE // 6, TILE_SIZE // 4,
-                          ear_size * 2, ear_size))
+        draw_ellipse(surface, DOGGY_BROWN, 
+                  (TILE_SIZE // 2 - TILE_SIZE // 3, TILE_SIZE // 4,
+                   ear_size * 2, ear_size))
+        draw_ellipse(surface, DOGGY_BROWN, 
+                  (TILE_SIZE // 2 + TILE_SIZE // 6, TILE_SIZE // 4,
+                   ear_size * 2, ear_size))
         
         # Eyes
         eye_size = TILE_SIZE // 10
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 - 2), 
-                        eye_size // 2)
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2 + eye_size, TILE_SIZE // 2 - 2), 
-                        eye_size // 2)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 - 2), 
+                 eye_size // 2)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2 + eye_size, TILE_SIZE // 2 - 2), 
+                 eye_size // 2)
         
         # Nose
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2, TILE_SIZE // 2 + 3), 
-                        eye_size // 2)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2, TILE_SIZE // 2 + 3), 
+                 eye_size // 2)
         
         # Mouth
-        pygame.draw.arc(surface, DOGGY_BLACK, 
-                       (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 + 3, 
-                        eye_size * 2, eye_size), 
-                        0, math.pi, 1)
+        draw_arc(surface, DOGGY_BLACK, 
+                (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 + 3, 
+                 eye_size * 2, eye_size), 
+                 0, _PI, 1)
         
         # Collar
-        pygame.draw.arc(surface, DOGGY_BLUE, 
-                      (TILE_SIZE // 2 - TILE_SIZE // 4, TILE_SIZE // 2 + 6, 
-                       TILE_SIZE // 2, TILE_SIZE // 8), 
-                       0, math.pi, 3)
+        draw_arc(surface, DOGGY_BLUE, 
+               (TILE_SIZE // 2 - TILE_SIZE // 4, TILE_SIZE // 2 + 6, 
+                TILE_SIZE // 2, TILE_SIZE // 8), 
+                0, _PI, 3)
         
         # Tag
-        pygame.draw.circle(surface, DOGGY_YELLOW, 
-                        (TILE_SIZE // 2, TILE_SIZE // 2 + 10), 
-                        3)
+        draw_circle(surface, DOGGY_YELLOW, 
+                 (TILE_SIZE // 2, TILE_SIZE // 2 + 10), 
+                 3)
         
-        self.images["player"] = surface
+        self.images[("player", None)] = self._convert(surface)
         
         # Create directional versions for animation
         self._create_directional_sprites("player")
     
     def _create_directional_sprites(self, base_name):
         """Create directional versions of the sprite."""
-        base_sprite = self.images[base_name]
+        base_sprite = self.images[(base_name, None)]
         
         # Create flipped version for left direction
         left_sprite = pygame.transform.flip(base_sprite, True, False)
-        self.images[f"{base_name}_left"] = left_sprite
+        self.images[(base_name, "left")] = left_sprite
         
         # Use the base sprite for right direction
-        self.images[f"{base_name}_right"] = base_sprite
+        self.images[(base_name, "right")] = base_sprite
         
         # Create slightly modified versions for up/down
         up_sprite = base_sprite.copy()
         # Move the eyes up slightly for "looking up"
-        pygame.draw.rect(up_sprite, (0, 0, 0, 0), 
-                       (TILE_SIZE // 2 - TILE_SIZE // 5, TILE_SIZE // 2 - 5, 
-                        TILE_SIZE // 2.5, 5))  # Clear eye area
+        # Clear the eye area by zeroing its alpha in place
+        eye_x = TILE_SIZE // 2 - TILE_SIZE // 5
+        eye_y = TILE_SIZE // 2 - 5
+        alpha = pygame.surfarray.pixels_alpha(up_sprite)
+        alpha[eye_x:eye_x + int(TILE_SIZE / 2.5), eye_y:eye_y + 5] = 0
+        del alpha  # Release the surface lock
         pygame.draw.circle(up_sprite, DOGGY_BLACK, 
                         (TILE_SIZE // 2 - TILE_SIZE // 10, TILE_SIZE // 2 - 5), 
                         TILE_SIZE // 20)
         pygame.draw.circle(up_sprite, DOGGY_BLACK, 
                         (TILE_SIZE // 2 + TILE_SIZE // 10, TILE_SIZE // 2 - 5), 
                         TILE_SIZE // 20)
-        self.images[f"{base_name}_up"] = up_sprite
+        self.images[(base_name, "up")] = up_sprite
         
         down_sprite = base_sprite.copy()
         # No modification needed for down, use as is
-        self.images[f"{base_name}_down"] = down_sprite
+        self.images[(base_name, "down")] = down_sprite
     
     def _create_clone_sprite(self):
         """Create a semi-transparent clone of the player sprite."""
-        player_sprite = self.images["player"]
-        surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        
-        # Get pixel data
-        for x in range(TILE_SIZE):
-            for y in range(TILE_SIZE):
-                # Get color at this pixel
-                color = player_sprite.get_at((x, y))
-                # Make it semi-transparent
-                if color.a > 0:  # Only modify non-transparent pixels
-                    transparent_color = (color.r, color.g, color.b, 128)
-                    surface.set_at((x, y), transparent_color)
-        
-        self.images["clone"] = surface
+        self.images[("clone", None)] = self._make_translucent(self._load_image(("player", None)))
         
         # Create directional versions
         self._create_directional_clones()
@@ -312,29 +447,38 @@ class AssetManager:
     def _create_directional_clones(self):
         """Create directional versions of the clone sprite."""
         for direction in ["left", "right", "up", "down"]:
-            player_dir = self.images[f"player_{direction}"]
-            surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-            
-            # Get pixel data
-            for x in range(TILE_SIZE):
-                for y in range(TILE_SIZE):
-                    # Get color at this pixel
-                    color = player_dir.get_at((x, y))
-                    # Make it semi-transparent
-                    if color.a > 0:  # Only modify non-transparent pixels
-                        transparent_color = (color.r, color.g, color.b, 128)
-                        surface.set_at((x, y), transparent_color)
+            player_dir = self._load_image(("player", direction))
+            self.images[("clone", direction)] = self._make_translucent(player_dir)
+    
+    def _make_translucent(self, sprite, alpha=128):
+        """
+        Copy a sprite with every non-transparent pixel set to the given alpha.
+        
+        Args:
+            sprite (pygame.Surface): Source sprite with per-pixel alpha
+            alpha (int): Alpha value for the visible pixels
             
-            self.images[f"clone_{direction}"] = surface
+        Returns:
+            pygame.Surface: The translucent copy
+        """
+        surface = sprite.copy()
+        # Edit the alpha channel in place as a numpy view of the pixel data
+        pixels = pygame.surfarray.pixels_alpha(surface)
+        pixels[pixels > 0] = alpha
+        del pixels  # Release the surface lock
+        return surface
     
     def _create_guard_sprite(self):
         """Create a guard dog sprite (slightly angry looking)."""
+        draw_circle = pygame.draw.circle
+        draw_arc = pygame.draw.arc
+        
         surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
         
         # Draw the body (bigger, meaner dog)
-        pygame.draw.circle(surface, DOGGY_DARK_BROWN, 
-                        (TILE_SIZE // 2, TILE_SIZE // 2), 
-                        TILE_SIZE // 3)  # Head/body
+        draw_circle(surface, DOGGY_DARK_BROWN, 
+                 (TILE_SIZE // 2, TILE_SIZE // 2), 
+                 TILE_SIZE // 3)  # Head/body
         
         # Pointy ears
         ear_width = TILE_SIZE // 5
@@ -355,19 +499,19 @@ class AssetManager:
         # Eyes (angry looking)
         eye_size = TILE_SIZE // 10
         # Left eye
-        pygame.draw.circle(surface, WHITE, 
-                        (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 - 2), 
-                        eye_size // 1.5)
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2 - eye_size - 1, TILE_SIZE // 2 - 2), 
-                        eye_size // 3)
+        draw_circle(surface, WHITE, 
+                 (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 - 2), 
+                 eye_size // 1.5)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2 - eye_size - 1, TILE_SIZE // 2 - 2), 
+                 eye_size // 3)
         # Right eye
-        pygame.draw.circle(surface, WHITE, 
-                        (TILE_SIZE // 2 + eye_size, TILE_SIZE // 2 - 2), 
-                        eye_size // 1.5)
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2 + eye_size + 1, TILE_SIZE // 2 - 2), 
-                        eye_size // 3)
+        draw_circle(surface, WHITE, 
+                 (TILE_SIZE // 2 + eye_size, TILE_SIZE // 2 - 2), 
+                 eye_size // 1.5)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2 + eye_size + 1, TILE_SIZE // 2 - 2), 
+                 eye_size // 3)
         
         # Angry eyebrows
         pygame.draw.line(surface, DOGGY_BLACK, 
@@ -380,15 +524,15 @@ class AssetManager:
                         2)
         
         # Nose
-        pygame.draw.circle(surface, DOGGY_BLACK, 
-                        (TILE_SIZE // 2, TILE_SIZE // 2 + 3), 
-                        eye_size // 2)
+        draw_circle(surface, DOGGY_BLACK, 
+                 (TILE_SIZE // 2, TILE_SIZE // 2 + 3), 
+                 eye_size // 2)
         
         # Mouth (snarling)
-        pygame.draw.arc(surface, DOGGY_BLACK, 
-                       (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 + 3, 
-                        eye_size * 2, eye_size), 
-                        math.pi, 2*math.pi, 2)
+        draw_arc(surface, DOGGY_BLACK, 
+                (TILE_SIZE // 2 - eye_size, TILE_SIZE // 2 + 3, 
+                 eye_size * 2, eye_size), 
+                 _PI, _TWO_PI, 2)
         
         # Teeth
         tooth_size = 2
@@ -415,56 +559,138 @@ class AssetManager:
                            (spike_x, collar_y - spike_size,
                             spike_size, spike_size))
         
-        self.images["guard"] = surface
-        self.images["guard_alerted"] = surface  # For now use the same sprite for both states
+        surface = self._convert(surface)
+        self.images[("guard", None)] = surface
         
         # Create "alerted" version with red glow
+        if AssetManager._ALERT_GLOW is None:
+            glow = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            draw_circle(glow, (255, 0, 0, 50), 
+                             (TILE_SIZE // 2, TILE_SIZE // 2), 
+                             TILE_SIZE // 2)
+            AssetManager._ALERT_GLOW = glow
         alerted = surface.copy()
-        alert_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        pygame.draw.circle(alert_surface, (255, 0, 0, 50), 
-                         (TILE_SIZE // 2, TILE_SIZE // 2), 
-                         TILE_SIZE // 2)
-        alerted.blit(alert_surface, (0, 0))
-        self.images["guard_alerted"] = alerted
+        alerted.blit(AssetManager._ALERT_GLOW, (0, 0))
+        self.images[("guard_alerted", None)] = alerted
     
     def _create_paw_prints(self):
         """Create paw print animation frames."""
-        frames = []
+        # Draw every frame into one sheet; the frames are subsurface views of it
+        sheet = pygame.Surface((TILE_SIZE, TILE_SIZE * 4), pygame.SRCALPHA)
+        sheet = self._convert(sheet)
         for i in range(4):
-            frame = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
             alpha = 200 - i * 50  # Fade out
-            self._draw_paw_print(frame, TILE_SIZE // 2, TILE_SIZE // 2, 
+            self._draw_paw_print(sheet, TILE_SIZE // 2, TILE_SIZE * i + TILE_SIZE // 2, 
                                 TILE_SIZE // 3, (DOGGY_DARK_BROWN[0], 
                                                 DOGGY_DARK_BROWN[1], 
                                                 DOGGY_DARK_BROWN[2], 
                                                 alpha))
-            frames.append(frame)
         
-        self.animations["paw_prints"] = frames
+        self.animations["paw_prints"] = [
+            sheet.subsurface(pygame.Rect(0, TILE_SIZE * i, TILE_SIZE, TILE_SIZE))
+            for i in range(4)
+        ]
+    
+    def _create_clone_paw_prints(self):
+        """Create the clone's paw print frames, the regular ones tinted blue."""
+        frames = []
+        for frame in self._load_animation("paw_prints"):
+            tinted = frame.copy()
+            tinted.fill((150, 150, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+            frames.append(tinted)
+        self.animations["clone_paw_prints"] = frames
     
     def get_image(self, name, direction=None):
         """
         Get an image by name.
         If direction is specified, get the directional version if available.
         """
-        if direction and f"{name}_{direction}" in self.images:
-            return self.images[f"{name}_{direction}"]
+        image = self.images.get((name, direction))
+        if image is not None:
+            return image
+        
+        # Not built yet, or no such variant
+        image = self._load_image((name, direction))
+        if image is None and direction:
+            image = self._load_image((name, None))
+        if image is None:
+            # Default to wall if not found
+            if self._wall_fallback is None:
+                self._wall_fallback = self._load_image(("wall", None))
+            image = self._wall_fallback
+        return image
+    
+    def _create_floor_variants(self):
+        """Create the floor tile variants, some with a subtle paw print."""
+        plain_floor = self._load_image(("floor", None))
+        paw_color = (DOGGY_BEIGE[0] - 20, DOGGY_BEIGE[1] - 20, DOGGY_BEIGE[2] - 20)
+        paw_size = TILE_SIZE // 5
+        
+        paw_center = plain_floor.copy()
+        self._draw_paw_print(paw_center, TILE_SIZE // 2, TILE_SIZE // 2, paw_size, paw_color)
+        
+        paw_offset = plain_floor.copy()
+        self._draw_paw_print(paw_offset, TILE_SIZE // 3, 2 * TILE_SIZE // 3, paw_size, paw_color)
         
-        return self.images.get(name, self.images.get("wall"))  # Default to wall if not found
+        # Four slots so a cell hash can pick one with a bit mask; half stay plain
+        self._floor_variants = (plain_floor, paw_center, plain_floor, paw_offset)
+    
+    def get_floor_tile(self, x, y):
+        """
+        Get the floor tile for a map cell.
+        
+        Cells pick one of a few precomputed variants by a cheap position hash,
+        so the floor looks varied without any per-frame randomness.
+        
+        Args:
+            x (int): Tile X coordinate
+            y (int): Tile Y coordinate
+            
+        Returns:
+            pygame.Surface: The floor tile for this cell
+        """
+        if self._floor_variants is None:
+            self._create_floor_variants()
+        return self._floor_variants[(x * 73 + y * 131) & 3]
     
     def get_font(self, size):
         """Get a font by size name."""
-        return self.fonts.get(size, self.fonts.get("medium"))
+        font = self.fonts.get(size)
+        if font is None:
+            if size not in self._font_specs:
+                return self.get_font("medium")
+            self._ensure_initialized()
+            point_size, bold = self._font_specs[size]
+            font = AssetManager._get_or_load_font(point_size, bold)
+            self.fonts[size] = font
+        return font
+    
+    @classmethod
+    def _get_or_load_font(cls, size, bold=False):
+        """
+        Get a system font, loading it only the first time across all instances.
+        
+        Args:
+            size (int): Point size
+            bold (bool): Whether to load the bold face
+            
+        Returns:
+            pygame.font.Font: The font
+        """
+        font = cls._FONT_CACHE.get((size, bold))
+        if font is None:
+            font = pygame.font.SysFont("Comic Sans MS", size, bold=bold)
+            cls._FONT_CACHE[(size, bold)] = font
+        return font
     
     def get_animation_frame(self, name, frame):
         """Get a specific frame of an animation."""
-        if name in self.animations:
-            frames = self.animations[name]
-            if 0 <= frame < len(frames):
-                return frames[frame]
+        frames = self._load_animation(name)
+        if frames is not None and 0 <= frame < len(frames):
+            return frames[frame]
         
         # Return a blank surface if not found
         surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
         return surf
 
-assets = AssetManager() 
\ No newline at end of file
+assets = AssetManager()
@@ -39,6 +39,7 @@ FONT_SMALL = 16
 FONT_MEDIUM = 20
 FONT_LARGE = 24
 FONT_TITLE = 36
+TEXT_CACHE_SIZE = 256  # Rendered text lines kept by Game._text
 
 # Game settings
 TILE_SIZE = 32
@@ -46,6 +47,8 @@ FPS = 60
 MAX_CLONES = 3
 MAX_HISTORY = 100
 MOVEMENT_DELAY = 0.2  # Delay between movements in seconds
+MOVEMENT_DELAY_MS = int(MOVEMENT_DELAY * 1000)
+LEVEL_CACHE_FILE = "_cache.pkl"  # Parsed built-in levels, kept beside the level files
 
 # Tile types (now using integers for easier handling in Pygame)
 TILE_WALL = 0
@@ -77,6 +80,20 @@ DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# Direction codes, stored instead of (dx, dy) tuples. Guards can also step
+# diagonally; DIR_NONE is the code for no movement.
+DIR_UP = 0
+DIR_DOWN = 1
+DIR_LEFT = 2
+DIR_RIGHT = 3
+DIR_UP_LEFT = 4
+DIR_UP_RIGHT = 5
+DIR_DOWN_LEFT = 6
+DIR_DOWN_RIGHT = 7
+DIR_NONE = 8
+DIR_DXDY = (UP, DOWN, LEFT, RIGHT, (-1, -1), (1, -1), (-1, 1), (1, 1), (0, 0))  # Indexed by code
+DIR_CODES = {delta: code for code, delta in enumerate(DIR_DXDY)}
+
 # Guard states
 GUARD_PATROLLING = 0
 GUARD_ALERTED = 1
@@ -3,14 +3,243 @@ Entity classes for Temporal Maze.
 Handles player, clones, guards, and items.
 """
 
-import math
+import logging
 import random
+import numpy as np
 from .constants import *
-import traceback
+from ._guard_jit import guard_step, line_of_sight, look_for_player, move_guards, move_toward
+
+logger = logging.getLogger(__name__)
+
+# Paw print animation timing
+PAW_PRINT_LIFETIME = 1.0  # Seconds before a paw print starts fading
+PAW_FRAME_TIME = 0.2      # Seconds per fade frame
+PAW_FRAME_COUNT = 4       # Fade frames before the paw print is removed
+
+# Facing codes; entities store these and only turn them into names for rendering
+FACE_RIGHT, FACE_LEFT, FACE_UP, FACE_DOWN = range(4)
+FACINGS = ("right", "left", "up", "down")  # Facing name for each code
+
+# Facing code for each cardinal (dx, dy) step
+_FACING_LUT = {(1, 0): FACE_RIGHT, (-1, 0): FACE_LEFT, (0, 1): FACE_DOWN, (0, -1): FACE_UP}
+
+# Tile groups that Player.move treats alike
+_PORTAL_TILES = frozenset((TILE_PORTAL_A, TILE_PORTAL_B))
+_PICKUP_TILES = frozenset((TILE_ITEM_KEY, TILE_ITEM_POTION))
+
+# Tiles checked by Player.interact, in priority order: current, then neighbours
+_INTERACT_OFFSETS = ((0, 0), (0, 1), (0, -1), (1, 0), (-1, 0))
+
+class MoveHistory:
+    """
+    Ring buffer of recorded positions stored as parallel arrays.
+    
+    Holds the last `capacity` entries of (x, y, facing code); appending
+    overwrites the oldest entry once the buffer is full.
+    """
+    
+    __slots__ = ("capacity", "x", "y", "facing", "head", "length")
+    
+    def __init__(self, capacity=MAX_HISTORY):
+        """
+        Initialize an empty history.
+        
+        Args:
+            capacity (int): Maximum number of entries kept
+        """
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.int16)
+        self.y = np.empty(capacity, dtype=np.int16)
+        self.facing = np.empty(capacity, dtype=np.uint8)
+        self.head = 0    # Slot the next entry is written to
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def clear(self):
+        """Remove all entries."""
+        self.head = 0
+        self.length = 0
+    
+    def append(self, x, y, facing):
+        """
+        Record an entry, dropping the oldest one if the buffer is full.
+        
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+            facing (int): Facing code (index into FACINGS)
+        """
+        head = self.head
+        self.x[head] = x
+        self.y[head] = y
+        self.facing[head] = facing
+        self.head = (head + 1) % self.capacity
+        if self.length < self.capacity:
+            self.length += 1
+    
+    def last_position(self):
+        """
+        Get the most recently recorded position.
+        
+        Returns:
+            tuple: (x, y) position, or None if the history is empty
+        """
+        if not self.length:
+            return None
+        last = (self.head - 1) % self.capacity
+        return (int(self.x[last]), int(self.y[last]))
+    
+    def columns(self, start=0, stop=None):
+        """
+        Copy a range of entries out in oldest-to-newest order.
+        
+        Args:
+            start (int): First entry to include (0 is the oldest)
+            stop (int, optional): Entry to stop before; defaults to the end
+            
+        Returns:
+            tuple: (x, y, facing) arrays for the requested entries
+        """
+        if stop is None or stop > self.length:
+            stop = self.length
+        count = max(stop - start, 0)
+        capacity = self.capacity
+        # Map the first logical position onto its ring slot. The result has to
+        # be a copy, since later appends overwrite the ring, but a range that
+        # doesn't wrap around the end is a plain slice copy
+        first = (self.head - self.length + start) % capacity
+        end = first + count
+        if end <= capacity:
+            return (self.x[first:end].copy(), self.y[first:end].copy(),
+                    self.facing[first:end].copy())
+        end -= capacity
+        return tuple(np.concatenate((column[first:], column[:end]))
+                     for column in (self.x, self.y, self.facing))
+
+class PawPrints:
+    """
+    Fading paw prints stored as parallel arrays (x, y, frame, time).
+    
+    Live prints occupy slots `start` to `count` of each array, oldest
+    first, so the per-frame fade is a handful of vectorized operations.
+    Every print ages at the same rate, so they always finish oldest first
+    and dropping them is just moving `start` forward, like a deque popleft.
+    """
+    
+    __slots__ = ("x", "y", "frame", "time", "start", "count")
+    
+    def __init__(self, capacity=32):
+        """
+        Initialize an empty paw print store.
+        
+        Args:
+            capacity (int): Initial number of slots
+        """
+        self.x = np.empty(capacity, dtype=np.int16)
+        self.y = np.empty(capacity, dtype=np.int16)
+        self.frame = np.empty(capacity, dtype=np.int8)
+        self.time = np.empty(capacity, dtype=np.float32)
+        self.start = 0   # First live slot
+        self.count = 0   # One past the last live slot
+    
+    def __len__(self):
+        return self.count - self.start
+    
+    def __iter__(self):
+        """Iterate over live paw prints as (x, y, frame) tuples."""
+        live = slice(self.start, self.count)
+        return zip(self.x[live].tolist(), self.y[live].tolist(), self.frame[live].tolist())
+    
+    def on_screen(self, camera_x, camera_y):
+        """
+        Project the live paw prints to screen space and drop the ones that
+        don't overlap the screen, all as array operations.
+        
+        Args:
+            camera_x (float): Camera X offset in pixels
+            camera_y (float): Camera Y offset in pixels
+            
+        Returns:
+            zip: (screen_x, screen_y, frame) for each visible print
+        """
+        live = slice(self.start, self.count)
+        # Widen first so pixel coordinates can't overflow the int16 columns
+        screen_x = self.x[live].astype(np.int64) * TILE_SIZE - camera_x
+        screen_y = self.y[live].astype(np.int64) * TILE_SIZE - camera_y
+        visible = ((screen_x > -TILE_SIZE) & (screen_x < SCREEN_WIDTH) &
+                   (screen_y > -TILE_SIZE) & (screen_y < SCREEN_HEIGHT))
+        return zip(screen_x[visible].tolist(), screen_y[visible].tolist(),
+                   self.frame[live][visible].tolist())
+    
+    def add(self, x, y):
+        """
+        Add a fresh paw print.
+        
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+        """
+        n = self.count
+        if n == len(self.x):
+            start = self.start
+            if start:
+                # Slide the live prints back to the front to reuse the freed slots
+                n -= start
+                for column in (self.x, self.y, self.frame, self.time):
+                    column[:n] = column[start:start + n]
+                self.start = 0
+            else:
+                # Out of slots, double the capacity
+                capacity = max(2 * n, 8)
+                self.x = np.resize(self.x, capacity)
+                self.y = np.resize(self.y, capacity)
+                self.frame = np.resize(self.frame, capacity)
+                self.time = np.resize(self.time, capacity)
+        self.x[n] = x
+        self.y[n] = y
+        self.frame[n] = 0
+        self.time[n] = PAW_PRINT_LIFETIME
+        self.count = n + 1
+    
+    def update(self, dt):
+        """
+        Advance the fade animation and drop finished paw prints.
+        
+        Args:
+            dt (float): Time since the last update in seconds
+        """
+        start = self.start
+        n = self.count
+        if start == n:
+            return
+        
+        time = self.time[start:n]
+        frame = self.frame[start:n]
+        time -= dt
+        expired = time <= 0
+        # Most frames no print changes frame, so there is nothing else to do
+        if not expired.any():
+            return
+        frame += expired
+        np.copyto(time, PAW_FRAME_TIME, where=expired)
+        
+        # Finished prints form a prefix of the live range, so only the oldest
+        # needs checking before counting how many to step past
+        if frame[0] >= PAW_FRAME_COUNT:
+            finished = int(np.count_nonzero(frame >= PAW_FRAME_COUNT))
+            start += finished
+            if start == n:
+                start = n = 0
+                self.count = 0
+            self.start = start
 
 class Entity:
     """Base entity class."""
     
+    __slots__ = ("x", "y", "visible")
+    
     def __init__(self, x, y):
         """
         Initialize an entity at a specific position.
@@ -67,6 +296,9 @@ class Entity:
 class Player(Entity):
     """Player entity that can move around and interact with the world."""
     
+    __slots__ = ("keys", "energy", "energy_max", "paw_prints", "facing_id", "world",
+                 "game_ref", "dir_id", "inventory", "history_limit", "history", "_last_pos")
+    
     def __init__(self, x, y):
         """
         Initialize the player.
@@ -79,13 +311,25 @@ class Player(Entity):
         self.keys = 0
         self.energy = PLAYER_START_ENERGY # Use constant
         self.energy_max = PLAYER_START_ENERGY # Max energy
-        self.paw_prints = []
-        self.facing = "right" 
+        self.paw_prints = PawPrints()
+        self.facing_id = FACE_RIGHT
         self.world = None
-        self.direction = (0, 0) 
+        self.game_ref = None  # Owning game, set by the game when it creates the player
+        self.dir_id = DIR_NONE  # Direction code of the last move, see DIR_DXDY
         self.inventory = [] 
-        self.history = [] # Initialize history list
         self.history_limit = MAX_HISTORY 
+        self.history = MoveHistory(self.history_limit)
+        self._last_pos = None  # Last (x, y) appended to history
+    
+    @property
+    def facing(self):
+        """Name of the direction the player is facing, for picking sprites."""
+        return FACINGS[self.facing_id]
+    
+    @property
+    def direction(self):
+        """Last move as a (dx, dy) tuple."""
+        return DIR_DXDY[self.dir_id]
     
     def move(self, dx, dy, world):
         """
@@ -107,21 +351,28 @@ class Player(Entity):
         
         # Update player direction
         if dx != 0 or dy != 0:
-            self.direction = (dx, dy)
+            self.dir_id = DIR_CODES.get((dx, dy), DIR_NONE)
             # Update visual facing direction
-            if dx > 0: self.facing = "right"
-            elif dx < 0: self.facing = "left"
-            elif dy > 0: self.facing = "down"
-            elif dy < 0: self.facing = "up"
+            self.facing_id = _FACING_LUT.get((dx, dy), self.facing_id)
             # Add paw print
-            self.paw_prints.append({"x": self.x, "y": self.y, "frame": 0, "time": 1.0})
+            self.paw_prints.add(self.x, self.y)
         
         # Calculate new position
         new_x = self.x + dx
         new_y = self.y + dy
         
-        # Get tile at new position
-        tile = world.get_tile_at(new_x, new_y)
+        # Look up both tiles once; the one we're standing on doesn't change
+        # while we move off it
+        get_tile = world.get_tile_at
+        cur_tile = get_tile(self.x, self.y)
+        tile = get_tile(new_x, new_y)
+        
+        # Fast path: most moves go from plain floor (or anything that isn't a
+        # switch) onto plain floor, which needs none of the checks below
+        if tile == TILE_FLOOR and cur_tile != TILE_SWITCH:
+            self.x = new_x
+            self.y = new_y
+            return True
         
         # --- Check 1: Basic Walkable Tiles --- 
         if world.is_walkable(new_x, new_y):
@@ -132,27 +383,26 @@ class Player(Entity):
             elif tile == TILE_EXIT:
                 world.level_completed = True 
                 return False # Prevent moving onto exit, just trigger win
-            elif tile == TILE_PORTAL_A or tile == TILE_PORTAL_B:
+            elif tile in _PORTAL_TILES:
                 portal_pos = world.get_paired_portal((new_x, new_y))
                 if portal_pos:
                     # Stepping OFF a switch before teleport?
-                    if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
+                    if cur_tile == TILE_SWITCH:
                          world.deactivate_switch(self.x, self.y)
                     self.x, self.y = portal_pos
                     self.record_position() # Record arrival position
                     return True 
-            elif tile == TILE_ITEM_KEY:
-                self.keys += 1
-                world.remove_item(new_x, new_y)
-                # Update inventory if needed
-            elif tile == TILE_ITEM_POTION:
-                self.energy = min(self.energy_max, self.energy + 1)
+            elif tile in _PICKUP_TILES:
+                if tile == TILE_ITEM_KEY:
+                    self.keys += 1
+                else:
+                    self.energy = min(self.energy_max, self.energy + 1)
                 world.remove_item(new_x, new_y)
                 # Update inventory if needed
             # Terminal interaction is handled by 'E' key now
             
             # Stepping OFF a switch?
-            if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
+            if cur_tile == TILE_SWITCH:
                  world.deactivate_switch(self.x, self.y)
                  
             # Complete the move
@@ -162,21 +412,16 @@ class Player(Entity):
             
         # --- Check 2: Locked Door Interaction --- 
         # Check if the target tile is a door (could be open or closed)
-        # Use get_tile_at for safety, even though is_walkable failed
-        target_tile_type = world.get_tile_at(new_x, new_y)
-        if target_tile_type == TILE_DOOR_CLOSED:
-             # Check if this specific door requires a key (using its position)
-             # We need a way to know which doors are key-locked vs switch-locked.
-             # For now, assume door at tutorial position (8, 1) is the key door.
-             # A better approach would be to store door type in world.doors
-             is_key_door = (new_x, new_y) == (8, 1) # Updated from (10, 1) to match new level1.txt
+        if tile == TILE_DOOR_CLOSED:
+             # Check if this specific door requires a key (the level marks them)
+             is_key_door = (new_x, new_y) in world.key_doors
              
              if is_key_door and self.keys > 0:
-                  print("Opening locked door with key!")
+                  logger.debug("Opening locked door with key at (%d, %d)", new_x, new_y)
                   self.keys -= 1
                   world.open_door(new_x, new_y) # This sets door state and tile type
                   # Stepping off switch?
-                  if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
+                  if cur_tile == TILE_SWITCH:
                        world.deactivate_switch(self.x, self.y)
                   # Complete the move onto the (now open) door tile
                   self.x = new_x
@@ -184,28 +429,25 @@ class Player(Entity):
                   return True
              else:
                   # It's a closed door we can't open (no key or switch door)
-                  print(f"Move blocked by closed door at ({new_x}, {new_y}). Key needed: {is_key_door}, Keys held: {self.keys}")
+                  logger.debug("Move blocked by closed door at (%d, %d). Key needed: %s, Keys held: %d",
+                               new_x, new_y, is_key_door, self.keys)
                   return False
 
         # --- Move Failed --- 
         # If not walkable and not an openable locked door
-        print(f"Move to ({new_x}, {new_y}) failed. Tile: {target_tile_type}")
+        logger.debug("Move to (%d, %d) failed. Tile: %s", new_x, new_y, tile)
         return False
     
     def record_position(self):
         """Record the current position and direction in history."""
         # Don't record if the position hasn't changed (prevents duplicate entries)
-        if not self.history or (self.x, self.y) != (self.history[-1]['x'], self.history[-1]['y']):
-             current_state = {
-                 'x': self.x,
-                 'y': self.y,
-                 'direction': self.facing # Record visual facing direction
-             }
-             self.history.append(current_state)
-             
-             # Keep history within limit
-             if len(self.history) > self.history_limit:
-                 self.history.pop(0)
+        x = self.x
+        y = self.y
+        pos = (x, y)
+        if pos != self._last_pos:
+            # Record visual facing direction
+            self.history.append(x, y, self.facing_id)
+            self._last_pos = pos
     
     def get_history(self, steps_back=None):
         """
@@ -215,16 +457,17 @@ class Player(Entity):
             steps_back (int, optional): Number of steps to get from history
                                        
         Returns:
-            list: List of (x, y, direction) tuples
+            tuple: (x, y, facing) arrays, oldest entry first
         """
         if steps_back is None or steps_back >= len(self.history):
-            return self.history.copy()
+            return self.history.columns()
         else:
-            return self.history[-steps_back:]
+            return self.history.columns(len(self.history) - steps_back)
     
     def reset_history(self):
         """Clear the movement history."""
-        self.history = []
+        self.history.clear()
+        self._last_pos = None
     
     def create_clone(self, steps_back):
         """
@@ -240,108 +483,113 @@ class Player(Entity):
             return None
             
         history = self.get_history(steps_back)
-        if not history:
+        xs, ys, _ = history
+        if not len(xs):
             return None
             
         self.energy -= 1
-        return TimeClone(history[0][0], history[0][1], history)
+        return TimeClone(int(xs[0]), int(ys[0]), history)
     
     def update(self, game_state):
         """Update the player."""
         # Update paw prints
-        for i, paw in enumerate(self.paw_prints):
-            paw["time"] -= game_state.dt
-            if paw["time"] <= 0:
-                paw["frame"] += 1
-                paw["time"] = 0.2  # Frame duration
-                if paw["frame"] >= 4:  # Remove after all frames
-                    self.paw_prints[i] = None
-        
-        # Remove expired paw prints
-        self.paw_prints = [paw for paw in self.paw_prints if paw is not None]
+        self.paw_prints.update(game_state.dt)
         
         # Check for collisions with guards
-        for guard in game_state.guards:
-            if (self.x == guard.x and self.y == guard.y) and guard.state != GUARD_CHASING:
+        x = self.x
+        y = self.y
+        guards = game_state.guards
+        system = getattr(game_state, "guard_system", None)
+        if system is not None and system.matches(guards):
+            # Compare against the position columns instead of every guard
+            system.alert_at(x, y)
+            return
+        for guard in guards:
+            if guard.x == x and guard.y == y and guard.state != GUARD_CHASING:
                 # Alert the guard
-                guard.alert(self.get_position())
+                guard.alert((x, y))
 
     def time_travel(self, steps, game_state):
         """Creates a time clone based on past history."""
-        print(f"[TIME TRAVEL START] Trying {steps} steps back. History len: {len(self.history)}. Energy: {self.energy}")
+        logger.debug("[TIME TRAVEL START] Trying %d steps back. History len: %d. Energy: %d",
+                     steps, len(self.history), self.energy)
         
         if self.energy <= 0:
-            print("[TIME TRAVEL FAIL] No energy.")
+            logger.debug("[TIME TRAVEL FAIL] No energy.")
             game_state.show_message("Not enough energy!", 2)
             return False
             
         # Ensure steps are valid (need at least 1 step for a clone, and history must be long enough)
         if steps < 1 or steps >= len(self.history):
             max_steps = len(self.history) - 1
-            print(f"[TIME TRAVEL FAIL] Invalid steps ({steps}). Need 1-{max_steps}. History len: {len(self.history)}")
+            logger.debug("[TIME TRAVEL FAIL] Invalid steps (%d). Need 1-%d. History len: %d",
+                         steps, max_steps, len(self.history))
             game_state.show_message(f"Invalid steps (need 1-{max_steps})", 2)
             return False
             
         # History slice: from beginning up to 'steps' ago
-        history_slice = self.history[:-steps]
-        print(f"[TIME TRAVEL] History slice length: {len(history_slice)}")
+        clone_history = self.history.columns(0, len(self.history) - steps)
+        history_x, history_y, _ = clone_history
+        logger.debug("[TIME TRAVEL] History slice length: %d", len(history_x))
         
-        if not history_slice:
-             print("[TIME TRAVEL FAIL] History slice is empty.")
+        if not len(history_x):
+             logger.debug("[TIME TRAVEL FAIL] History slice is empty.")
              game_state.show_message("Not enough history recorded for this travel!", 2)
              return False
              
-        start_state = history_slice[0] 
-        clone_history = history_slice 
+        start_x, start_y = int(history_x[0]), int(history_y[0])
 
-        print(f"[TIME TRAVEL] Creating clone at {start_state['x']},{start_state['y']} with {len(clone_history)} history steps.")
+        logger.debug("[TIME TRAVEL] Creating clone at %d,%d with %d history steps.",
+                     start_x, start_y, len(history_x))
 
         # Create the clone
         try:
-             new_clone = TimeClone(start_state['x'], start_state['y'], clone_history)
-             print("[TIME TRAVEL] Clone instance created.")
+             new_clone = TimeClone(start_x, start_y, clone_history)
+             logger.debug("[TIME TRAVEL] Clone instance created.")
         except Exception as e:
-             print(f"[TIME TRAVEL FAIL] Error creating TimeClone instance: {e}")
-             traceback.print_exc()
+             logger.exception("[TIME TRAVEL FAIL] Error creating TimeClone instance: %s", e)
              game_state.show_message("Error initializing clone.", 2)
              return False
         
-        # Add clone to the game state's list
-        if hasattr(game_state, 'clones') and isinstance(game_state.clones, list):
-            game_state.clones.append(new_clone)
-            self.energy -= 1 # Consume energy
-            print(f"[TIME TRAVEL SUCCESS] Clone added. Energy left: {self.energy}. Total clones: {len(game_state.clones)}")
-            return True
-        else:
-            print("[TIME TRAVEL FAIL] Game state missing 'clones' list or it's not a list.")
-            game_state.show_message("Error adding clone to game.", 2)
-            return False
+        # Add clone to the game state's list (games always start with clones = [])
+        game_state.clones.append(new_clone)
+        self.energy -= 1 # Consume energy
+        logger.debug("[TIME TRAVEL SUCCESS] Clone added. Energy left: %d. Total clones: %d",
+                     self.energy, len(game_state.clones))
+        return True
             
     def interact(self, game_state):
         """Interact with adjacent tiles (terminals, switches)."""
-        for dx, dy in [(0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)]: # Check current and adjacent
-            check_x, check_y = self.x + dx, self.y + dy
-            tile_type = game_state.world.get_tile_at(check_x, check_y)
+        world = game_state.world
+        get_tile = world.get_tile_at
+        x = self.x
+        y = self.y
+        for dx, dy in _INTERACT_OFFSETS: # Check current and adjacent
+            check_x, check_y = x + dx, y + dy
+            tile_type = get_tile(check_x, check_y)
             
             if tile_type == TILE_TERMINAL:
-                message = game_state.world.activate_terminal(check_x, check_y)
+                message = world.activate_terminal(check_x, check_y)
                 if message:
                     game_state.show_message(message, 5.0)
                     # Potentially change game state to STATE_DIALOGUE if needed
                 return # Interact with first found
             elif tile_type == TILE_SWITCH:
                  # Check if switch is already active
-                if (check_x, check_y) in game_state.world.activated_switches:
-                     game_state.world.deactivate_switch(check_x, check_y)
+                if (check_x, check_y) in world.activated_switches:
+                     world.deactivate_switch(check_x, check_y)
                      game_state.show_message("Switch deactivated.", 1.0)
                 else:
-                     game_state.world.activate_switch(check_x, check_y)
+                     world.activate_switch(check_x, check_y)
                      game_state.show_message("Switch activated!", 1.0)
                 return # Interact with first found
 
 class TimeClone(Entity):
     """Time clone entity that replays the player's movements."""
     
+    __slots__ = ("history_x", "history_y", "history_facing", "history_len", "current_step",
+                 "facing_id", "direction", "active", "paw_prints", "_on_switch")
+    
     def __init__(self, x, y, history):
         """
         Initialize a time clone.
@@ -349,15 +597,22 @@ class TimeClone(Entity):
         Args:
             x (int): Initial X coordinate
             y (int): Initial Y coordinate
-            history (list): List of (x, y, direction) tuples to replay
+            history (tuple): (x, y, facing) arrays to replay, oldest first
         """
         super().__init__(x, y)
-        self.history = history.copy()
+        self.history_x, self.history_y, self.history_facing = history
+        self.history_len = len(self.history_x)
         self.current_step = 0
-        self.direction = history[0]['direction'] if history else 'right' # Default if history is empty
-        self.facing = self.direction # Initial facing matches direction
+        self.facing_id = int(self.history_facing[0]) if self.history_len else FACE_RIGHT # Default if history is empty
+        self.direction = FACINGS[self.facing_id]
         self.active = True
-        self.paw_prints = [] 
+        self.paw_prints = PawPrints()
+        self._on_switch = None  # Whether (x, y) is a switch; looked up on first update
+    
+    @property
+    def facing(self):
+        """Name of the direction the clone is facing, for picking sprites."""
+        return FACINGS[self.facing_id]
     
     def update(self, game_state):
         """
@@ -366,52 +621,126 @@ class TimeClone(Entity):
         Args:
             game_state: The game state
         """
-        if not self.active or self.current_step >= len(self.history):
+        if not self.active or self.current_step >= self.history_len:
             self.active = False
             return False
         
-        # Get the next state dictionary from history
-        next_state = self.history[self.current_step]
-        next_x = next_state['x']
-        next_y = next_state['y']
-        next_facing = next_state['direction'] # Use the recorded facing direction
+        # Fade the trail the same way the player's does
+        self.paw_prints.update(game_state.dt)
         
-        # Update direction and facing based on the recorded state
-        self.facing = next_facing
-        # (Optional: you could calculate dx/dy if needed, but facing is more direct)
+        # Get the next recorded state from history
+        step = self.current_step
+        next_x = int(self.history_x[step])
+        next_y = int(self.history_y[step])
         
-        # Add paw print at current position before moving
-        if self.x != next_x or self.y != next_y:
-            self.paw_prints.append({"x": self.x, "y": self.y, "frame": 0, "time": 1.0})
+        # Update facing based on the recorded state
+        self.facing_id = int(self.history_facing[step])
+        # (Optional: you could calculate dx/dy if needed, but facing is more direct)
         
-        # Check if we're stepping off a switch
         world = game_state.world
-        if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
-            world.deactivate_switch(self.x, self.y)
+        x = self.x
+        y = self.y
+        on_switch = self._on_switch
+        if on_switch is None:
+            on_switch = world.get_tile_at(x, y) == TILE_SWITCH
         
-        # Update position
-        self.x = next_x
-        self.y = next_y
+        # Standing still only needs the switch underneath kept active
+        if x != next_x or y != next_y:
+            # Add paw print at current position before moving
+            self.paw_prints.add(x, y)
+            
+            # Check if we're stepping off a switch
+            if on_switch:
+                world.deactivate_switch(x, y)
+            
+            # Update position
+            self.x = next_x
+            self.y = next_y
+            on_switch = world.get_tile_at(next_x, next_y) == TILE_SWITCH
+        self._on_switch = on_switch
         
         # Check if we stepped on a switch
-        if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
-            world.activate_switch(self.x, self.y)
+        if on_switch:
+            world.activate_switch(next_x, next_y)
         
         # Increment step counter
         self.current_step += 1
         
         # Check if we've reached the end of the history
-        if self.current_step >= len(self.history):
+        if self.current_step >= self.history_len:
             self.active = False
             # If clone finishes on a switch, ensure it stays deactivated
-            if world.get_tile_at(self.x, self.y) == TILE_SWITCH:
-                world.deactivate_switch(self.x, self.y)
+            if on_switch:
+                world.deactivate_switch(next_x, next_y)
             
         return self.active
+    
+    def update_n(self, n, game_state):
+        """
+        Replay several steps of history at once.
+        
+        Args:
+            n (int): Number of steps to replay
+            game_state: The game state
+            
+        Returns:
+            bool: True if the clone is still active after all n steps
+        """
+        update = self.update
+        for _ in range(n):
+            if not update(game_state):
+                return False
+        return True
+
+def _guard_column(column):
+    """
+    Build a Guard property that lives on the guard until it is bound to a
+    GuardSystem, and in the system's array column afterwards.
+    
+    Args:
+        column (str): Name of the GuardSystem array
+        
+    Returns:
+        property: The accessor
+    """
+    attr = "_" + column
+    
+    def fget(self):
+        system = self._system
+        if system is None:
+            return getattr(self, attr)
+        return getattr(system, column)[self._index].item()
+    
+    def fset(self, value):
+        system = self._system
+        if system is None:
+            setattr(self, attr, value)
+        else:
+            getattr(system, column)[self._index] = value
+    
+    return property(fget, fset)
 
 class Guard(Entity):
     """Guard entity that patrols and can chase the player."""
     
+    # Backing storage for the column properties while the guard is unbound;
+    # _system and _index are set while a GuardSystem owns this guard's state
+    __slots__ = ("_x", "_y", "_state", "_dir_id", "_view_distance_sq", "_alert_timer",
+                 "_alert_duration", "_patrol_index", "_patrol_timer", "_patrol_wait",
+                 "_target_position", "_patrol_route", "_view_distance", "speed",
+                 "_system", "_index")
+    
+    x = _guard_column("x")
+    y = _guard_column("y")
+    state = _guard_column("state")
+    dir_id = _guard_column("dir_id")
+    view_distance_sq = _guard_column("view_distance_sq")
+    alert_timer = _guard_column("alert_timer")
+    alert_duration = _guard_column("alert_duration")
+    patrol_index = _guard_column("patrol_index")
+    patrol_timer = _guard_column("patrol_timer")
+    patrol_wait = _guard_column("patrol_wait")
+    
     def __init__(self, x, y, patrol_route=None):
         """
         Initialize a guard entity.
@@ -421,9 +750,12 @@ class Guard(Entity):
             y (int): Initial Y coordinate
             patrol_route (list, optional): List of (x, y) positions to patrol
         """
+        # Unbound until a GuardSystem claims it; the properties check this first
+        self._system = None
+        self._index = -1
         super().__init__(x, y)
         self.state = GUARD_PATROLLING
-        self.direction = DOWN
+        self.dir_id = DIR_DOWN
         self.speed = 1
         self.view_distance = 5
         self.alert_timer = 0
@@ -445,6 +777,60 @@ class Guard(Entity):
         self.patrol_timer = 0
         self.patrol_wait = 1.5  # seconds to wait at each patrol point
     
+    @property
+    def direction(self):
+        """Facing as a (dx, dy) tuple."""
+        return DIR_DXDY[self.dir_id]
+    
+    @direction.setter
+    def direction(self, value):
+        self.dir_id = DIR_CODES[value]
+    
+    @property
+    def view_distance(self):
+        """How far the guard can see, in tiles."""
+        return self._view_distance
+    
+    @view_distance.setter
+    def view_distance(self, value):
+        self._view_distance = value
+        # Sight checks compare squared distances, so keep the square in step
+        self.view_distance_sq = value * value
+    
+    @property
+    def target_position(self):
+        """Last known player position, or None."""
+        system = self._system
+        if system is None:
+            return self._target_position
+        i = self._index
+        if not system.has_target[i]:
+            return None
+        return (int(system.target_x[i]), int(system.target_y[i]))
+    
+    @target_position.setter
+    def target_position(self, value):
+        system = self._system
+        if system is None:
+            self._target_position = value
+            return
+        i = self._index
+        system.has_target[i] = value is not None
+        if value is not None:
+            system.target_x[i], system.target_y[i] = value
+    
+    @property
+    def patrol_route(self):
+        """List of (x, y) positions to patrol."""
+        return self._patrol_route
+    
+    @patrol_route.setter
+    def patrol_route(self, value):
+        self._patrol_route = value
+        # Routes are flattened when the system is built, so it needs a rebuild
+        if self._system is not None:
+            self._system.dirty = True
+    
     def update(self, game_state):
         """
         Update the guard's state and position.
@@ -454,53 +840,53 @@ class Guard(Entity):
         """
         dt = game_state.dt
         world = game_state.world
+        player = game_state.player
+        state = self.state
         
-        if self.state == GUARD_PATROLLING:
+        if state == GUARD_PATROLLING:
             # Wait at patrol points
             if self.patrol_timer > 0:
                 self.patrol_timer -= dt
                 return
                 
             # Move along patrol route
-            target_x, target_y = self.patrol_route[self.patrol_index]
+            patrol_route = self.patrol_route
+            patrol_index = self.patrol_index
+            target_x, target_y = patrol_route[patrol_index]
             
             # If we've reached the target, move to the next patrol point
             if self.x == target_x and self.y == target_y:
-                self.patrol_index = (self.patrol_index + 1) % len(self.patrol_route)
+                self.patrol_index = (patrol_index + 1) % len(patrol_route)
                 self.patrol_timer = self.patrol_wait
                 return
                 
-            # Move toward the target
-            self._move_toward(target_x, target_y, world)
-            
-            # Check for player in line of sight
-            if self._can_see_player(game_state.player, world):
-                self.alert(game_state.player.get_position())
+            # Move toward the target and check for player in line of sight
+            if self._step_toward(target_x, target_y, player, world):
+                self.alert((player.x, player.y))
                 
-        elif self.state == GUARD_ALERTED:
+        elif state == GUARD_ALERTED:
             # Count down alert timer
-            self.alert_timer -= dt
+            alert_timer = self.alert_timer - dt
+            self.alert_timer = alert_timer
             
-            if self.alert_timer <= 0:
+            if alert_timer <= 0:
                 # Change to chasing state if player is still visible
-                if self._can_see_player(game_state.player, world):
+                if self._can_see_player(player, world):
                     self.state = GUARD_CHASING
-                    self.target_position = game_state.player.get_position()
+                    self.target_position = (player.x, player.y)
                 else:
                     # Return to patrolling
                     self.state = GUARD_PATROLLING
                     
-        elif self.state == GUARD_CHASING:
+        elif state == GUARD_CHASING:
             # Chase the player
-            if self.target_position:
-                target_x, target_y = self.target_position
-                
-                # Move toward the target
-                self._move_toward(target_x, target_y, world)
+            target_position = self.target_position
+            if target_position:
+                target_x, target_y = target_position
                 
-                # Update target if the player is visible
-                if self._can_see_player(game_state.player, world):
-                    self.target_position = game_state.player.get_position()
+                # Move toward the target, then update it if the player is visible
+                if self._step_toward(target_x, target_y, player, world):
+                    self.target_position = (player.x, player.y)
                 # If we've reached the last known position and can't see the player, return to patrol
                 elif self.x == target_x and self.y == target_y:
                     self.state = GUARD_PATROLLING
@@ -510,7 +896,7 @@ class Guard(Entity):
                 self.state = GUARD_PATROLLING
                 
             # Check for player collision
-            if (self.x == game_state.player.x and self.y == game_state.player.y):
+            if self.x == player.x and self.y == player.y:
                 # Player is caught!
                 game_state.player_caught = True
     
@@ -525,70 +911,43 @@ class Guard(Entity):
         self.alert_timer = self.alert_duration
         self.target_position = player_pos
     
-    def _move_toward(self, target_x, target_y, world):
+    def _step_toward(self, target_x, target_y, player, world):
         """
-        Move toward a target position.
+        Move one step toward a target, then check for the player.
         
         Args:
             target_x (int): Target X coordinate
             target_y (int): Target Y coordinate
+            player: The player entity
             world: The game world
-        """
-        # Calculate direction to target
-        dx = 0
-        dy = 0
-        
-        if self.x < target_x:
-            dx = 1
-        elif self.x > target_x:
-            dx = -1
             
-        if self.y < target_y:
-            dy = 1
-        elif self.y > target_y:
-            dy = -1
-        
-        # Prioritize the largest distance
-        if abs(target_x - self.x) > abs(target_y - self.y):
-            # Try horizontal first
-            if self._try_move(dx, 0, world):
-                return
-            elif self._try_move(0, dy, world):
-                return
-        else:
-            # Try vertical first
-            if self._try_move(0, dy, world):
-                return
-            elif self._try_move(dx, 0, world):
-                return
-                
-        # Try diagonal if direct approaches fail
-        self._try_move(dx, dy, world)
+        Returns:
+            bool: True if the player is visible from the new position
+        """
+        x, y, face, sees = guard_step(
+            self.x, self.y, target_x, target_y, player.x, player.y,
+            self.view_distance_sq, world.transparent_grid, world.walkable_grid)
+        self.x = x
+        self.y = y
+        if face != DIR_NONE:
+            self.dir_id = int(face)
+        return sees
     
-    def _try_move(self, dx, dy, world):
+    def _move_toward(self, target_x, target_y, world):
         """
-        Try to move in a direction.
+        Move toward a target position.
         
         Args:
-            dx (int): X-axis movement
-            dy (int): Y-axis movement
+            target_x (int): Target X coordinate
+            target_y (int): Target Y coordinate
             world: The game world
-            
-        Returns:
-            bool: True if the move was successful
         """
-        if dx != 0 or dy != 0:
-            self.direction = (dx, dy)
-            
-        new_x = self.x + dx
-        new_y = self.y + dy
-        
-        if world.is_walkable(new_x, new_y):
-            self.x = new_x
-            self.y = new_y
-            return True
-            
-        return False
+        x, y, face = move_toward(self.x, self.y, target_x, target_y,
+                                 world.walkable_grid)
+        self.x = x
+        self.y = y
+        if face != DIR_NONE:
+            self.dir_id = int(face)
     
     def _can_see_player(self, player, world):
         """
@@ -601,42 +960,226 @@ class Guard(Entity):
         Returns:
             bool: True if the player is visible
         """
-        # Get player position
-        player_x, player_y = player.get_position()
+        return line_of_sight(self.x, self.y, player.x, player.y,
+                             self.view_distance_sq, world.transparent_grid)
+
+class GuardSystem:
+    """
+    Struct-of-arrays store for a list of guards.
+    
+    Every guard's state lives in one numpy column per field, and tick()
+    updates all of them together. The Guard objects stay
+    usable as views onto their row until unbind() copies the state back.
+    """
+    
+    def __init__(self, guards):
+        """
+        Build the arrays from the guards and bind each guard to its row.
         
-        # Calculate distance to player
-        distance = math.sqrt((player_x - self.x)**2 + (player_y - self.y)**2)
+        Args:
+            guards (list): Guard entities, kept by reference
+        """
+        self.guards = guards
+        self.count = n = len(guards)
+        self.dirty = False
         
-        # Check if player is within view distance
-        if distance > self.view_distance:
-            return False
+        self.x = np.array([g.x for g in guards], dtype=np.int64)
+        self.y = np.array([g.y for g in guards], dtype=np.int64)
+        self.state = np.array([g.state for g in guards], dtype=np.uint8)
+        self.dir_id = np.array([g.dir_id for g in guards], dtype=np.uint8)
+        self.view_distance_sq = np.array([g.view_distance_sq for g in guards], dtype=np.int64)
+        self.alert_timer = np.array([g.alert_timer for g in guards], dtype=np.float64)
+        self.alert_duration = np.array([g.alert_duration for g in guards], dtype=np.float64)
+        self.patrol_index = np.array([g.patrol_index for g in guards], dtype=np.int64)
+        self.patrol_timer = np.array([g.patrol_timer for g in guards], dtype=np.float64)
+        self.patrol_wait = np.array([g.patrol_wait for g in guards], dtype=np.float64)
         
-        # Check if there are walls blocking the view
-        if self.x == player_x:
-            # Vertical line of sight
-            start_y = min(self.y, player_y)
-            end_y = max(self.y, player_y)
-            for y in range(start_y, end_y + 1):
-                if not world.is_transparent(self.x, y):
-                    return False
-            return True
+        targets = [g.target_position for g in guards]
+        self.has_target = np.array([t is not None for t in targets], dtype=np.bool_)
+        self.target_x = np.array([t[0] if t else 0 for t in targets], dtype=np.int64)
+        self.target_y = np.array([t[1] if t else 0 for t in targets], dtype=np.int64)
+        
+        # Patrol routes flattened into one array with per-guard offsets
+        routes = [g.patrol_route for g in guards]
+        self.route_len = np.array([len(r) for r in routes], dtype=np.int64)
+        self.route_start = np.zeros(n, dtype=np.int64)
+        if n > 1:
+            np.cumsum(self.route_len[:-1], out=self.route_start[1:])
+        points = [point for route in routes for point in route]
+        self.route_x = np.array([p[0] for p in points], dtype=np.int64)
+        self.route_y = np.array([p[1] for p in points], dtype=np.int64)
+        
+        self.sees = np.zeros(n, dtype=np.bool_)
+        # Where each guard heads this tick, refilled in place by tick()
+        self.goal_x = np.zeros(n, dtype=np.int64)
+        self.goal_y = np.zeros(n, dtype=np.int64)
+        
+        for i, guard in enumerate(guards):
+            guard._system = self
+            guard._index = i
+    
+    def matches(self, guards):
+        """
+        Check whether this system is still valid for a guard list.
+        
+        Args:
+            guards (list): The game's current guard list
             
-        elif self.y == player_y:
-            # Horizontal line of sight
-            start_x = min(self.x, player_x)
-            end_x = max(self.x, player_x)
-            for x in range(start_x, end_x + 1):
-                if not world.is_transparent(x, self.y):
-                    return False
-            return True
+        Returns:
+            bool: True if the list and its routes are unchanged
+        """
+        return not self.dirty and guards is self.guards and len(guards) == self.count
+    
+    def unbind(self):
+        """Copy each guard's state back onto the guard and detach it."""
+        for i, guard in enumerate(self.guards[:self.count]):
+            if guard._system is not self:
+                continue
+            values = {
+                "x": guard.x, "y": guard.y, "state": guard.state,
+                "dir_id": guard.dir_id,
+                "view_distance_sq": guard.view_distance_sq,
+                "alert_timer": guard.alert_timer,
+                "alert_duration": guard.alert_duration,
+                "target_position": guard.target_position,
+                "patrol_index": guard.patrol_index,
+                "patrol_timer": guard.patrol_timer,
+                "patrol_wait": guard.patrol_wait,
+            }
+            guard._system = None
+            guard._index = -1
+            for name, value in values.items():
+                setattr(guard, name, value)
+    
+    def on_screen(self, camera_x, camera_y, margin=0):
+        """
+        Find the guards whose sprite lands on screen, in one array pass.
+        
+        Args:
+            camera_x (int): Camera X offset in pixels
+            camera_y (int): Camera Y offset in pixels
+            margin (int): Extra pixels allowed past the top and left edges
             
-        else:
-            # Not in direct line of sight
+        Returns:
+            list: Indices into the guard list
+        """
+        screen_x = self.x * TILE_SIZE - camera_x
+        screen_y = self.y * TILE_SIZE - camera_y
+        visible = ((screen_x >= -margin) & (screen_x < SCREEN_WIDTH) &
+                   (screen_y >= -margin) & (screen_y < SCREEN_HEIGHT))
+        return np.flatnonzero(visible).tolist()
+    
+    def alert_at(self, x, y):
+        """
+        Alert every guard standing on a tile that isn't already chasing.
+        
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+        """
+        state = self.state
+        hit = (self.x == x) & (self.y == y) & (state != GUARD_CHASING)
+        if not hit.any():
+            return
+        state[hit] = GUARD_ALERTED
+        self.alert_timer[hit] = self.alert_duration[hit]
+        self.has_target[hit] = True
+        self.target_x[hit] = x
+        self.target_y[hit] = y
+    
+    def tick(self, dt, player_x, player_y, world):
+        """
+        Update every guard once.
+        
+        Timers, state transitions and the view-range cull are whole-array
+        numpy operations; only movement and the line-of-sight walk run per
+        guard, in move_guards and look_for_player.
+        
+        Args:
+            dt (float): Delta time in seconds
+            player_x (int): Player X coordinate
+            player_y (int): Player Y coordinate
+            world: The game world
+            
+        Returns:
+            bool: True if a chasing guard reached the player
+        """
+        if self.count == 0:
             return False
+        x = self.x
+        y = self.y
+        state = self.state
+        patrol_timer = self.patrol_timer
+        alert_timer = self.alert_timer
+        has_target = self.has_target
+        
+        patrolling = state == GUARD_PATROLLING
+        alerted = state == GUARD_ALERTED
+        chasing = state == GUARD_CHASING
+        
+        # Count down patrol-point waits and alerts
+        waiting = patrolling & (patrol_timer > 0)
+        patrol_timer[waiting] -= dt
+        alert_timer[alerted] -= dt
+        alert_over = alerted & (alert_timer <= 0)
+        
+        # Patrolling guards head for their current route point; when already
+        # there they pick the next point and wait instead of moving
+        patrolling &= ~waiting & (self.route_len > 0)
+        target_x = self.goal_x
+        target_y = self.goal_y
+        np.copyto(target_x, self.target_x)
+        np.copyto(target_y, self.target_y)
+        slot = self.route_start[patrolling] + self.patrol_index[patrolling]
+        target_x[patrolling] = self.route_x[slot]
+        target_y[patrolling] = self.route_y[slot]
+        arrived = patrolling & (x == target_x) & (y == target_y)
+        self.patrol_index[arrived] = (self.patrol_index[arrived] + 1) % self.route_len[arrived]
+        patrol_timer[arrived] = self.patrol_wait[arrived]
+        patrolling &= ~arrived
+        
+        hunting = chasing & has_target
+        moving = patrolling | hunting
+        move_guards(moving, x, y, target_x, target_y, self.dir_id, world.walkable_grid)
+        
+        # Broad phase: only guards within view range of the player need the
+        # line-of-sight walk
+        dx = x - player_x
+        dy = y - player_y
+        in_range = dx * dx + dy * dy <= self.view_distance_sq
+        sees = self.sees
+        sees[:] = False
+        look_for_player(np.flatnonzero((moving | alert_over) & in_range), x, y,
+                        player_x, player_y, self.view_distance_sq,
+                        world.transparent_grid, sees)
+        
+        # Patrolling guards that spot the player become alerted
+        spotted = patrolling & sees
+        state[spotted] = GUARD_ALERTED
+        alert_timer[spotted] = self.alert_duration[spotted]
+        
+        # When the alert runs out, chase if the player is still visible
+        state[alert_over & sees] = GUARD_CHASING
+        state[alert_over & ~sees] = GUARD_PATROLLING
+        
+        # Chasers give up at the last known position, or with no target at all
+        lost = hunting & ~sees & (x == target_x) & (y == target_y)
+        state[lost | (chasing & ~has_target)] = GUARD_PATROLLING
+        
+        # Everyone who saw the player now targets their position
+        seen = spotted | (alert_over & sees) | (hunting & sees)
+        self.target_x[seen] = player_x
+        self.target_y[seen] = player_y
+        has_target[seen] = True
+        
+        # Check for player collision
+        return bool((chasing & (x == player_x) & (y == player_y)).any())
 
 class Item(Entity):
     """Item entity class."""
     
+    __slots__ = ("item_type", "name", "description")
+    
     def __init__(self, x, y, item_type):
         """
         Initialize an item entity.
@@ -663,6 +1206,8 @@ class Item(Entity):
 class Terminal(Entity):
     """Terminal entity for story elements and hints."""
     
+    __slots__ = ("message", "activated")
+    
     def __init__(self, x, y, message):
         """
         Initialize a terminal entity.
@@ -3,15 +3,28 @@ Main game class for the enhanced Temporal Maze.
 """
 
 import os
+import pickle
 import pygame
-import time
-import math
+from math import cos, pi, sin
 import random
+import traceback
+import numpy as np
 from .constants import *
 from .assets import assets
 from .world import World
-from .entities import Player, TimeClone, Guard, Terminal
+from .entities import (FACINGS, PAW_FRAME_COUNT, Player, TimeClone, Guard, GuardSystem,
+                       Terminal)
 from .level_generator import LevelGenerator, load_level_from_file
+from ._guard_jit import patrol_ends, warm_up as warm_up_guard_kernels
+
+# Movement keys and their step, in priority order when several are held
+MOVE_KEYS = (
+    (pygame.K_UP, 0, -1), (pygame.K_w, 0, -1),
+    (pygame.K_DOWN, 0, 1), (pygame.K_s, 0, 1),
+    (pygame.K_LEFT, -1, 0), (pygame.K_a, -1, 0),
+    (pygame.K_RIGHT, 1, 0), (pygame.K_d, 1, 0),
+)
+_MOVE_KEY_SET = frozenset(key for key, _, _ in MOVE_KEYS)
 
 class Camera:
     """Camera class for following the player."""
@@ -43,6 +56,19 @@ class Camera:
         screen_x = entity.x * TILE_SIZE - self.x
         screen_y = entity.y * TILE_SIZE - self.y
         return (screen_x, screen_y)
+    
+    def visible_tiles(self):
+        """
+        Get the tiles whose top-left corner lies on screen.
+        
+        An entity passes 0 <= apply(entity) < (width, height) exactly when
+        its tile is inside this range, so it can be culled before apply.
+        
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y) tile coordinates, inclusive
+        """
+        return (-(-self.x // TILE_SIZE), -(-self.y // TILE_SIZE),
+                (self.x + self.width - 1) // TILE_SIZE, (self.y + self.height - 1) // TILE_SIZE)
         
     def update(self, target):
         """
@@ -109,6 +135,8 @@ class Game:
         self.player = None
         self.clones = []
         self.guards = []
+        self.guard_system = None  # Array-backed guard state, see _update_guards
+        warm_up_guard_kernels()
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Game state variables
@@ -122,11 +150,21 @@ class Game:
         
         # Movement control
         self.last_move_time = 0
-        self.movement_delay = MOVEMENT_DELAY
+        self.movement_delay = MOVEMENT_DELAY_MS  # Milliseconds, compared against get_ticks
+        self._held_move_keys = set()  # Movement keys currently down
+        self._move_dir = (0, 0)       # Step for the held keys, see _update_move_dir
         
         # UI elements
         self.font = assets.get_font("medium")
         self.title_font = assets.get_font("title")
+        self._text_cache = {}  # (text, color, font) -> rendered surface, see _text
+        self._menu_bg_cache = {}  # Pattern size -> pre-rendered menu background
+        self._menu_paw_cells = None  # Background cells drawn as paws, picked once
+        self._menu_panel = None  # Menu panel with its border, built on first use
+        self._sprite_cache = {}  # (kind, size, color) -> pre-drawn decoration sprite
+        self._ui_paw_blits = None  # (sprite, position) pairs for the UI panel paws
+        self._overlay_cache = {}  # Overlay name -> (surface, position) list, see _overlay_blits
+        self._wrapped_message = None  # (message, line blits) for the dialogue box
         
         # Procedural level generation
         self.level_generator = LevelGenerator(50, 50)
@@ -151,11 +189,66 @@ class Game:
             # Load levels from files
             level_files = [f for f in os.listdir(levels_dir) if f.endswith(".txt")]
             level_files.sort()  # Sort by name so level1.txt comes before level2.txt
+            self.built_in_levels.extend(self._parse_level_files(levels_dir, level_files))
+        
+        # Keep every level's tiles as one compact int8 array from here on
+        self.built_in_levels = [self._pack_level_tiles(level_data)
+                                for level_data in self.built_in_levels]
+    
+    def _pack_level_tiles(self, level_data):
+        """
+        Store a level's tile map as an int8 array, the type World keeps.
+        
+        Args:
+            level_data: Generator dict with a "map" entry, or the tuple from
+                load_level_from_file with the map first. Sparse dict maps and
+                failed loads (None) are returned as they are.
+            
+        Returns:
+            The level data with its map converted
+        """
+        if isinstance(level_data, dict):
+            tiles = level_data.get("map")
+            if tiles is not None and not isinstance(tiles, dict):
+                level_data["map"] = np.asarray(tiles, dtype=np.int8)
+        elif isinstance(level_data, tuple) and level_data:
+            level_data = (np.asarray(level_data[0], dtype=np.int8),) + level_data[1:]
+        return level_data
+    
+    def _parse_level_files(self, levels_dir, level_files):
+        """
+        Parse the built-in level files, reusing a pickled copy when possible.
+        
+        The parsed levels are stored in LEVEL_CACHE_FILE next to the files,
+        stamped with the file names and their newest modification time, so
+        the text is only parsed again after a level is added or edited.
+        
+        Args:
+            levels_dir (str): Directory holding the level files
+            level_files (list): Sorted level file names
             
-            for level_file in level_files:
-                level_path = os.path.join(levels_dir, level_file)
-                level_data = load_level_from_file(level_path)
-                self.built_in_levels.append(level_data)
+        Returns:
+            list: Level data for each file, as returned by load_level_from_file
+        """
+        paths = [os.path.join(levels_dir, level_file) for level_file in level_files]
+        stamp = (level_files, max((os.path.getmtime(path) for path in paths), default=0))
+        cache_path = os.path.join(levels_dir, LEVEL_CACHE_FILE)
+        
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, levels = pickle.load(f)
+            if cached_stamp == stamp:
+                return levels
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            pass  # Missing or unreadable cache, parse the files below
+        
+        levels = [load_level_from_file(path) for path in paths]
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((stamp, levels), f, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Could not write level cache {cache_path}: {e}")
+        return levels
     
     def _start_game(self):
         """Start a new game."""
@@ -174,7 +267,6 @@ class Game:
                 self._generate_random_level()
         except Exception as e:
             print(f"Error starting game: {e}")
-            import traceback
             traceback.print_exc()
             
             # Create a basic fallback level
@@ -223,7 +315,6 @@ class Game:
                 return True
         except Exception as e:
             print(f"Error loading level {level_number}: {e}")
-            import traceback
             traceback.print_exc()
             return False
     
@@ -264,16 +355,11 @@ class Game:
     
     def _create_fallback_level(self):
         """Create a simple fallback level in case of errors."""
-        # Create a small empty world
+        # Create a small empty world: floor, walled in
+        tiles = np.full((15, 20), TILE_FLOOR, dtype=np.int8)
+        tiles[0, :] = tiles[-1, :] = tiles[:, 0] = tiles[:, -1] = TILE_WALL
         self.world = World(20, 15)
-        
-        # Fill with floor tiles
-        for x in range(20):
-            for y in range(15):
-                if x == 0 or y == 0 or x == 19 or y == 14:
-                    self.world.set_tile(x, y, TILE_WALL)
-                else:
-                    self.world.set_tile(x, y, TILE_FLOOR)
+        self.world.load_tiles_array(tiles)
         
         # Place exit
         self.world.set_tile(18, 13, TILE_EXIT)
@@ -302,25 +388,11 @@ class Game:
         x, y = start_pos
         patrol_route = [start_pos]
         
-        # Try to find walkable positions in 4 directions
-        directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-        for direction in directions:
-            dx, dy = direction
-            path_length = 0
-            current_x, current_y = x, y
-            
-            # Try to extend the patrol route in this direction
-            for _ in range(5):  # Try up to 5 steps
-                next_x, next_y = current_x + dx, current_y + dy
-                if world.is_walkable(next_x, next_y):
-                    current_x, current_y = next_x, next_y
-                    path_length += 1
-                else:
-                    break
-            
-            # If we found a valid path, add the end point
+        # Walk up to 5 steps in each of the 4 directions, and add the end
+        # point of every direction that got anywhere
+        for end_x, end_y, path_length in patrol_ends(x, y, 5, world.walkable_grid).tolist():
             if path_length > 0:
-                patrol_route.append((current_x, current_y))
+                patrol_route.append((end_x, end_y))
         
         # If we don't have enough points, add the start position again
         if len(patrol_route) < 2:
@@ -344,20 +416,51 @@ class Game:
                 self.running = False
                 
             elif event.type == pygame.KEYDOWN:
-                if self.state == STATE_MAIN_MENU:
-                    self._handle_main_menu_input(event.key)
-                elif self.state == STATE_PLAYING:
-                    self._handle_playing_input(event.key)
-                elif self.state == STATE_PAUSED:
-                    self._handle_paused_input(event.key)
-                elif self.state == STATE_LEVEL_COMPLETE:
-                    self._handle_level_complete_input(event.key)
-                elif self.state == STATE_GAME_OVER:
-                    self._handle_game_over_input(event.key)
-                elif self.state == STATE_DIALOGUE:
-                    self._handle_dialogue_input(event.key)
-                elif self.state == STATE_RULES:
-                    self._handle_rules_input(event.key)
+                if event.key in _MOVE_KEY_SET:
+                    self._held_move_keys.add(event.key)
+                    self._update_move_dir()
+                self.handle_key(event.key)
+                
+            elif event.type == pygame.KEYUP:
+                if event.key in _MOVE_KEY_SET:
+                    self._held_move_keys.discard(event.key)
+                    self._update_move_dir()
+                    
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key releases while unfocused never arrive
+                self._held_move_keys.clear()
+                self._update_move_dir()
+    
+    def _update_move_dir(self):
+        """Work out the step for the held movement keys, highest priority first."""
+        held = self._held_move_keys
+        for key, dx, dy in MOVE_KEYS:
+            if key in held:
+                self._move_dir = (dx, dy)
+                return
+        self._move_dir = (0, 0)
+    
+    def handle_key(self, key):
+        """
+        Dispatch a key press to the handler for the current state.
+        
+        Args:
+            key (int): Pygame key code
+        """
+        if self.state == STATE_MAIN_MENU:
+            self._handle_main_menu_input(key)
+        elif self.state == STATE_PLAYING:
+            self._handle_playing_input(key)
+        elif self.state == STATE_PAUSED:
+            self._handle_paused_input(key)
+        elif self.state == STATE_LEVEL_COMPLETE:
+            self._handle_level_complete_input(key)
+        elif self.state == STATE_GAME_OVER:
+            self._handle_game_over_input(key)
+        elif self.state == STATE_DIALOGUE:
+            self._handle_dialogue_input(key)
+        elif self.state == STATE_RULES:
+            self._handle_rules_input(key)
     
     def _handle_main_menu_input(self, key):
         """Handle input on the main menu."""
@@ -372,71 +475,63 @@ class Game:
         """Handle input on the rules screen."""
         if key in [pygame.K_ESCAPE, pygame.K_BACKSPACE]:
             self.state = STATE_MAIN_MENU
-    
+
+    def _update_guards(self):
+        """Update all guards in one batch, rebuilding the batch if the guard list changed."""
+        if not self.guards:
+            return
+        system = self.guard_system
+        if system is None or not system.matches(self.guards):
+            if system is not None:
+                system.unbind()
+            system = self.guard_system = GuardSystem(self.guards)
+
+        if system.tick(self.dt, self.player.x, self.player.y, self.world):
+            # Player is caught!
+            self.player_caught = True
+
     def update(self):
         """Update game state."""
         # Get delta time
         self.dt = self.clock.get_time() / 1000.0  # Convert ms to seconds
         
-        try:
-            if self.state == STATE_PLAYING:
-                # Handle player movement with delay
-                current_time = time.time()
-                keys = pygame.key.get_pressed()
-                dx, dy = 0, 0
-                
-                if keys[pygame.K_UP] or keys[pygame.K_w]:
-                    dy = -1
-                elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                    dy = 1
-                elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                    dx = -1
-                elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                    dx = 1
-                    
-                if (dx != 0 or dy != 0) and current_time - self.last_move_time > self.movement_delay:
-                    if self.player:  # Make sure player exists
-                        self.player.move(dx, dy, self.world)
-                        self.last_move_time = current_time
-                
-                # Update clones
-                for i in range(len(self.clones) - 1, -1, -1):
-                    clone = self.clones[i]
-                    if not clone.update(self):
-                        # Remove inactive clones
-                        self.clones.pop(i)
+        if self.state == STATE_PLAYING:
+            # Handle player movement with delay
+            current_time = pygame.time.get_ticks()
+            dx, dy = self._move_dir
                 
-                # Update guards
-                for guard in self.guards:
-                    guard.update(self)
-                    
-                # Update player paw prints
-                if self.player:
-                    self.player.update(self)
-                
-                # Update camera to follow player
-                if self.player:
-                    self.camera.update(self.player)
-                
-                # Check for level completion
-                if self.world and self.world.level_completed:
-                    self.state = STATE_LEVEL_COMPLETE
-                    
-                # Check for player being caught
-                if self.player_caught:
-                    self.state = STATE_GAME_OVER
+            if (dx != 0 or dy != 0) and current_time - self.last_move_time > self.movement_delay:
+                if self.player:  # Make sure player exists
+                    self.player.move(dx, dy, self.world)
+                    self.last_move_time = current_time
+            
+            # Update clones, keeping only the ones still active
+            self.clones = [clone for clone in self.clones if clone.update(self)]
+            
+            # Update guards
+            self._update_guards()
                 
-            # Update message timer
-            if self.message and self.message_timer > 0:
-                self.message_timer -= self.dt
-                if self.message_timer <= 0:
-                    self.message = None
+            # Update player paw prints
+            if self.player:
+                self.player.update(self)
+            
+            # Update camera to follow player
+            if self.player:
+                self.camera.update(self.player)
+            
+            # Check for level completion
+            if self.world and self.world.level_completed:
+                self.state = STATE_LEVEL_COMPLETE
                 
-        except Exception as e:
-            # Print error but don't crash
-            print(f"Error in game update: {e}")
-            import traceback
-            traceback.print_exc()
+            # Check for player being caught
+            if self.player_caught:
+                self.state = STATE_GAME_OVER
+            
+        # Update message timer
+        if self.message and self.message_timer > 0:
+            self.message_timer -= self.dt
+            if self.message_timer <= 0:
+                self.message = None
     
     def render(self):
         """Render the game."""
@@ -468,19 +563,14 @@ class Game:
     
     def _render_main_menu(self):
         """Render the main menu."""
-        # Draw a fancy background with paw patterns
-        for y in range(0, SCREEN_HEIGHT, 40):
-            for x in range(0, SCREEN_WIDTH, 40):
-                size = 36 + 4 * int(abs((time.time()*0.5) % 1.0 - 0.5) * 10)
-                alpha = 20 + 10 * int(abs((time.time()*0.3 + x*0.01 + y*0.01) % 1.0 - 0.5) * 10)
-                if random.random() < 0.3:
-                    self._draw_decorative_paw(x + 20, y + 20, 
-                                            (DOGGY_BROWN[0], DOGGY_BROWN[1], DOGGY_BROWN[2], alpha), 
-                                            size // 3)
-                else:
-                    pygame.draw.rect(self.screen, 
-                                   (DOGGY_BROWN[0], DOGGY_BROWN[1], DOGGY_BROWN[2], alpha), 
-                                   (x, y, size, size), 1)
+        # Draw a fancy background with paw patterns. The pattern only pulses
+        # through a few sizes, so each one is drawn once and reused
+        now_ms = pygame.time.get_ticks()
+        size = 36 + 4 * int(abs((now_ms * 0.0005) % 1.0 - 0.5) * 10)
+        background = self._menu_bg_cache.get(size)
+        if background is None:
+            background = self._menu_bg_cache[size] = self._build_menu_background(size)
+        self.screen.blit(background, (0, 0))
         
         # Draw a panel for the menu
         panel_width = 500
@@ -488,24 +578,24 @@ class Game:
         panel_x = (SCREEN_WIDTH - panel_width) // 2
         panel_y = (SCREEN_HEIGHT - panel_height) // 2
         
-        # Panel background
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel.fill((UI_BG[0], UI_BG[1], UI_BG[2], 230))
+        # Panel background and border never change, so they're drawn once
+        panel = self._menu_panel
+        if panel is None:
+            panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            panel.fill((UI_BG[0], UI_BG[1], UI_BG[2], 230))
+            pygame.draw.rect(panel, UI_HIGHLIGHT, (0, 0, panel_width, panel_height), 3)
+            self._menu_panel = panel
         self.screen.blit(panel, (panel_x, panel_y))
         
-        # Panel border
-        pygame.draw.rect(self.screen, UI_HIGHLIGHT, 
-                       (panel_x, panel_y, panel_width, panel_height), 3)
-        
         # Draw doggy mascot for the menu
         mascot_size = 100
         self._draw_doggy_mascot(panel_x + panel_width // 2 - mascot_size // 2, 
-                              panel_y + 40, mascot_size)
+                              panel_y + 40, mascot_size, now_ms)
         
         # Menu options
-        start_text = self.font.render("Press ENTER to Start", True, UI_TEXT)
-        rules_text = self.font.render("Press H for Help & Rules", True, UI_TEXT)
-        quit_text = self.font.render("Press Q to Quit", True, UI_TEXT)
+        start_text = self._text("Press ENTER to Start", UI_TEXT)
+        rules_text = self._text("Press H for Help & Rules", UI_TEXT)
+        quit_text = self._text("Press Q to Quit", UI_TEXT)
         
         # Draw menu options with bone decorations
         button_y = panel_y + 180
@@ -520,6 +610,62 @@ class Game:
         self._draw_menu_button(panel_x + 50, button_y, panel_width - 100, 40, 
                               quit_text, DOGGY_BROWN)
     
+    def _text(self, text, color, font=None):
+        """
+        Render a line of text, reusing the surface from an earlier frame.
+        
+        Most on-screen text is fixed or changes a few times per level, so
+        rendering it once per distinct string saves rasterizing it every frame.
+        
+        Args:
+            text (str): The text to render
+            color (tuple): Text color
+            font (pygame.font.Font, optional): Font to use; defaults to self.font
+            
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        if font is None:
+            font = self.font
+        key = (text, color, font)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Messages and counters keep adding strings; start over when full
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            # Converted to the display format so later blits take the fast path
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
+    
+    def _build_menu_background(self, size):
+        """
+        Draw the main menu's paw pattern onto its own surface.
+        
+        Which cells get a paw instead of a square is picked once per game
+        and shared by every size, so the pattern doesn't flicker.
+        
+        Args:
+            size (int): Size of each square, in pixels
+            
+        Returns:
+            pygame.Surface: The background, filled and ready to blit
+        """
+        if self._menu_paw_cells is None:
+            self._menu_paw_cells = {(x, y) for y in range(0, SCREEN_HEIGHT, 40)
+                                    for x in range(0, SCREEN_WIDTH, 40)
+                                    if random.random() < 0.3}
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill(BG_COLOR)
+        # The screen has no per-pixel alpha, so the pattern is drawn opaque
+        for y in range(0, SCREEN_HEIGHT, 40):
+            for x in range(0, SCREEN_WIDTH, 40):
+                if (x, y) in self._menu_paw_cells:
+                    self._draw_decorative_paw(x + 20, y + 20, DOGGY_BROWN, size // 3,
+                                              surface=background)
+                else:
+                    pygame.draw.rect(background, DOGGY_BROWN, (x, y, size, size), 1)
+        return background
+    
     def _draw_menu_button(self, x, y, width, height, text, color):
         """Draw a menu button with bone decoration."""
         # Button background
@@ -537,97 +683,33 @@ class Game:
         self.screen.blit(text, (x + (width - text.get_width()) // 2, 
                               y + (height - text.get_height()) // 2))
     
-    def _draw_doggy_mascot(self, x, y, size):
-        """Draw a larger cute doggy mascot for the main menu."""
-        # Body (sitting dog)
+    def _draw_doggy_mascot(self, x, y, size, now_ms):
+        """Draw a larger cute doggy mascot for the main menu, animated by now_ms."""
+        # Everything but the wagging tail comes from a cached sprite, with
+        # one variant for each state of the tongue
+        tongue_out = now_ms % 5000 < 500  # Every 5 seconds, show for 0.5 seconds
+        key = ("mascot", size, tongue_out)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._build_mascot_sprite(size, tongue_out)
+            self._sprite_cache[key] = sprite
+        self.screen.blit(sprite, (x, y))
         body_color = DOGGY_BROWN
         
-        # Draw dog body (oval)
-        pygame.draw.ellipse(self.screen, body_color, 
-                          (x + size//4, y + size//3, size//2, size//2))
-        
-        # Draw head (circle)
-        head_size = size // 2
-        pygame.draw.circle(self.screen, body_color, 
-                         (x + size//2, y + size//3), head_size // 2)
-        
-        # Ears
-        ear_size = head_size // 3
-        pygame.draw.ellipse(self.screen, body_color, 
-                          (x + size//3 - ear_size, y + size//6,
-                           ear_size, ear_size*1.5))
-        pygame.draw.ellipse(self.screen, body_color, 
-                          (x + size//2 + size//6, y + size//6,
-                           ear_size, ear_size*1.5))
-        
-        # Eyes
-        eye_size = head_size // 8
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size//2 - eye_size*2, y + size//3 - 2), 
-                         eye_size)
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size//2 + eye_size*2, y + size//3 - 2), 
-                         eye_size)
-        
-        # Shine in eyes
-        pygame.draw.circle(self.screen, WHITE, 
-                         (x + size//2 - eye_size*2 + 2, y + size//3 - 4), 
-                         eye_size//3)
-        pygame.draw.circle(self.screen, WHITE, 
-                         (x + size//2 + eye_size*2 + 2, y + size//3 - 4), 
-                         eye_size//3)
-        
-        # Nose
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size//2, y + size//3 + eye_size*2), 
-                         eye_size)
-        
-        # Mouth
-        mouth_width = head_size // 2
-        pygame.draw.arc(self.screen, DOGGY_BLACK, 
-                       (x + size//2 - mouth_width//2, y + size//3 + eye_size*2, 
-                        mouth_width, eye_size*3), 
-                        0, math.pi, 2)
-        
-        # Tongue (occasionally sticks out)
-        if time.time() % 5 < 0.5:  # Every 5 seconds, show for 0.5 seconds
-            pygame.draw.circle(self.screen, DOGGY_PINK, 
-                            (x + size//2, y + size//3 + eye_size*4), 
-                            eye_size*1.2)
-        
-        # Collar
-        pygame.draw.rect(self.screen, DOGGY_BLUE, 
-                       (x + size//3, y + size//2 + 4, 
-                        size//3, size//20))
-        
-        # Tag
-        pygame.draw.circle(self.screen, DOGGY_YELLOW, 
-                         (x + size//2, y + size//2 + 10), 
-                         size//20)
-        
-        # Paws
-        paw_size = size // 12
-        pygame.draw.ellipse(self.screen, body_color, 
-                          (x + size//4, y + size//3 + size//2,
-                           paw_size*2, paw_size))
-        pygame.draw.ellipse(self.screen, body_color, 
-                          (x + size//2 + size//8, y + size//3 + size//2,
-                           paw_size*2, paw_size))
-        
         # Tail (wagging animation)
-        tail_angle = math.sin(time.time() * 5) * 0.5
-        tail_x = x + size//2 + size//4
-        tail_y = y + size//3 + size//8
+        tail_angle = sin(now_ms * 0.005) * 0.5
         tail_length = size // 4
-        end_x = tail_x + math.cos(tail_angle) * tail_length
-        end_y = tail_y + math.sin(tail_angle) * tail_length
+        tail_x = x + size//2 + tail_length
+        tail_y = y + size//3 + size//8
+        end_x = tail_x + cos(tail_angle) * tail_length
+        end_y = tail_y + sin(tail_angle) * tail_length
         pygame.draw.line(self.screen, body_color, 
                         (tail_x, tail_y), (end_x, end_y), 
                         size // 20)
         
         # Title with paw prints
-        title_text = self.title_font.render("TEMPORAL MAZE", True, UI_TEXT)
-        subtitle_text = self.font.render("A Time-Traveling Puppy Adventure", True, UI_TEXT)
+        title_text = self._text("TEMPORAL MAZE", UI_TEXT, self.title_font)
+        subtitle_text = self._text("A Time-Traveling Puppy Adventure", UI_TEXT)
         
         # Randomize paw print positions a bit
         paw_positions = []
@@ -650,67 +732,81 @@ class Game:
     
     def _render_game(self):
         """Render the game world and entities."""
-        try:
-            # Only render if we have a world
-            if not self.world:
-                return
-            
-            # Render the world
-            self.world.render(self.screen, (self.camera.x, self.camera.y))
-            
-            # Render paw prints for player
-            if self.player and hasattr(self.player, 'paw_prints'):
-                for paw in self.player.paw_prints:
-                    screen_pos = self.camera.apply(type('obj', (), {'x': paw["x"], 'y': paw["y"]}))
-                    frame = assets.get_animation_frame("paw_prints", paw["frame"])
-                    self.screen.blit(frame, screen_pos)
-            
-            # Render clones and their paw prints
-            for clone in self.clones:
-                # Render clone's paw prints if they exist
-                if hasattr(clone, 'paw_prints'):
-                    for paw in clone.paw_prints:
-                        screen_pos = self.camera.apply(type('obj', (), {'x': paw["x"], 'y': paw["y"]}))
-                        frame = assets.get_animation_frame("paw_prints", paw["frame"])
-                        # Make clone paw prints slightly different color
-                        paw_frame = frame.copy()
-                        paw_frame.fill((150, 150, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-                        self.screen.blit(paw_frame, screen_pos)
-                
-                # Only render clones that are in view
-                screen_pos = self.camera.apply(clone)
-                if (0 <= screen_pos[0] < SCREEN_WIDTH and 
-                    0 <= screen_pos[1] < SCREEN_HEIGHT):
-                    # Get clone direction safely
-                    direction = getattr(clone, 'facing', 'right')
-                    self.screen.blit(assets.get_image("clone", direction), screen_pos)
-            
-            # Render guards
-            for guard in self.guards:
-                screen_pos = self.camera.apply(guard)
-                if (0 <= screen_pos[0] < SCREEN_WIDTH and 
-                    0 <= screen_pos[1] < SCREEN_HEIGHT):
-                    # Choose image based on guard state
-                    if guard.state == GUARD_ALERTED:
-                        image = assets.get_image("guard_alerted")
-                    else:
-                        image = assets.get_image("guard")
-                    self.screen.blit(image, screen_pos)
-            
-            # Render player
-            if self.player:
-                player_pos = self.camera.apply(self.player)
-                # Get player direction safely
-                direction = getattr(self.player, 'facing', 'right')
-                self.screen.blit(assets.get_image("player", direction), player_pos)
+        # Only render if we have a world
+        if not self.world:
+            return
+        
+        # Render the world
+        cam_x = self.camera.x
+        cam_y = self.camera.y
+        self.world.render(self.screen, (cam_x, cam_y))
+        
+        # Look up the sprites once per frame rather than once per entity
+        screen = self.screen
+        paw_frames, clone_paw_frames, clone_images, guard_image, guard_alerted_image = \
+            self._entity_sprites()
+        # Entities outside this tile range would land off screen
+        min_x, min_y, max_x, max_y = self.camera.visible_tiles()
+        
+        # Render paw prints for player
+        if self.player and hasattr(self.player, 'paw_prints'):
+            for screen_x, screen_y, paw_frame in self.player.paw_prints.on_screen(cam_x, cam_y):
+                screen.blit(paw_frames[paw_frame], (screen_x, screen_y))
+        
+        # Render clones and their paw prints
+        for clone in self.clones:
+            # Render clone's paw prints if they exist
+            if hasattr(clone, 'paw_prints'):
+                for screen_x, screen_y, paw_frame in clone.paw_prints.on_screen(cam_x, cam_y):
+                    # Clone paw prints use the blue-tinted frames
+                    screen.blit(clone_paw_frames[paw_frame], (screen_x, screen_y))
             
-            # Render UI
-            self._render_ui()
-        except Exception as e:
-            # Print error but don't crash
-            print(f"Error in game rendering: {e}")
-            import traceback
-            traceback.print_exc()
+            # Only render clones that are in view
+            if min_x <= clone.x <= max_x and min_y <= clone.y <= max_y:
+                # Sprite for the way the clone is facing
+                screen.blit(clone_images[clone.facing],
+                            (clone.x * TILE_SIZE - cam_x, clone.y * TILE_SIZE - cam_y))
+        
+        # Render guards, letting the guard system pick the on-screen ones
+        guards = self.guards
+        system = self.guard_system
+        if system is not None and system.matches(guards):
+            guards = [guards[i] for i in system.on_screen(cam_x, cam_y)]
+        for guard in guards:
+            if min_x <= guard.x <= max_x and min_y <= guard.y <= max_y:
+                screen_pos = (guard.x * TILE_SIZE - cam_x, guard.y * TILE_SIZE - cam_y)
+                # Choose image based on guard state
+                if guard.state == GUARD_ALERTED:
+                    screen.blit(guard_alerted_image, screen_pos)
+                else:
+                    screen.blit(guard_image, screen_pos)
+        
+        # Render player
+        if self.player:
+            player_pos = self.camera.apply(self.player)
+            # Sprite for the way the player is facing
+            direction = self.player.facing
+            screen.blit(assets.get_image("player", direction), player_pos)
+        
+        # Render UI
+        self._render_ui()
+    
+    def _entity_sprites(self):
+        """
+        Look up the sprites drawn for paw prints, clones and guards.
+        
+        Returns:
+            tuple: (paw_frames, clone_paw_frames, clone_images, guard_image,
+                   guard_alerted_image). The frame lists are indexed by paw
+                   print frame and clone_images maps a facing to its sprite.
+        """
+        get_frame = assets.get_animation_frame
+        get_image = assets.get_image
+        return ([get_frame("paw_prints", i) for i in range(PAW_FRAME_COUNT)],
+                [get_frame("clone_paw_prints", i) for i in range(PAW_FRAME_COUNT)],
+                {facing: get_image("clone", facing) for facing in FACINGS},
+                get_image("guard"),
+                get_image("guard_alerted"))
     
     def _render_ui(self):
         """Render the game UI."""
@@ -725,24 +821,28 @@ class Game:
         # Draw doggy logo in UI
         self._draw_doggy_logo(SCREEN_WIDTH // 2 - 80, 10, 30)
         
-        # Add UI panel decorations (paw prints)
-        for i in range(3):
-            x_pos = 30 + i * 300
-            y_pos = 15
-            self._draw_decorative_paw(x_pos, y_pos, DOGGY_BROWN, 15)
-            self._draw_decorative_paw(SCREEN_WIDTH - x_pos, y_pos, DOGGY_BROWN, 15)
+        # Add UI panel decorations (paw prints), placed once and drawn in one call
+        if self._ui_paw_blits is None:
+            paw = self._decorative_paw_sprite(DOGGY_BROWN, 15)
+            self._ui_paw_blits = []
+            for i in range(3):
+                x_pos = 30 + i * 300
+                y_pos = 15
+                self._ui_paw_blits.append((paw, (x_pos - 15, y_pos - 15)))
+                self._ui_paw_blits.append((paw, (SCREEN_WIDTH - x_pos - 15, y_pos - 15)))
+        self.screen.blits(self._ui_paw_blits, False)
         
         # Info boxes with bone borders
         info_box_width = SCREEN_WIDTH // 4 - 20
         
         # Level indicator box
         self._draw_bone_box(10, 40, info_box_width, 80)
-        level_text = self.font.render(f"Level: {self.current_level}", True, UI_TEXT)
+        level_text = self._text(f"Level: {self.current_level}", UI_TEXT)
         self.screen.blit(level_text, (20, 50))
         
         # Energy indicator box
         self._draw_bone_box(info_box_width + 20, 40, info_box_width, 80)
-        energy_text = self.font.render(f"Energy: {self.player.energy}/{self.player.energy_max}", True, UI_TEXT)
+        energy_text = self._text(f"Energy: {self.player.energy}/{self.player.energy_max}", UI_TEXT)
         self.screen.blit(energy_text, (info_box_width + 30, 50))
         
         # Draw energy bones (visual indicator)
@@ -755,7 +855,7 @@ class Game:
         # Clone and keys box
         self._draw_bone_box(info_box_width*2 + 30, 40, info_box_width, 80)
         
-        keys_text = self.font.render(f"Keys: {self.player.keys}", True, UI_TEXT)
+        keys_text = self._text(f"Keys: {self.player.keys}", UI_TEXT)
         self.screen.blit(keys_text, (info_box_width*2 + 40, 50))
         
         # Draw key bones
@@ -764,7 +864,7 @@ class Game:
             key_y = 55
             self._draw_mini_bone(key_x, key_y, 15, DOGGY_YELLOW)
         
-        clones_text = self.font.render(f"Clones: {len(self.clones)}", True, UI_TEXT)
+        clones_text = self._text(f"Clones: {len(self.clones)}", UI_TEXT)
         self.screen.blit(clones_text, (info_box_width*2 + 40, 80))
         
         # Draw clone indicators (small pawprints)
@@ -780,119 +880,271 @@ class Game:
         
         pygame.draw.line(self.screen, UI_HIGHLIGHT, (0, SCREEN_HEIGHT - 36), (SCREEN_WIDTH, SCREEN_HEIGHT - 36), 2)
         
-        controls_text = self.font.render("WASD: Move | T: Time Travel | R: Restart | ESC: Pause | H: Help", True, UI_TEXT)
+        controls_text = self._text("WASD: Move | T: Time Travel | R: Restart | ESC: Pause | H: Help", UI_TEXT)
         controls_x = (SCREEN_WIDTH - controls_text.get_width()) // 2
         self.screen.blit(controls_text, (controls_x, SCREEN_HEIGHT - 30))
     
     def _draw_bone_box(self, x, y, width, height):
         """Draw a box with bone-themed border."""
-        # Box background
-        pygame.draw.rect(self.screen, UI_BG, (x, y, width, height))
+        bone_size = 15
+        key = ("bone_box", (width, height), UI_HIGHLIGHT)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._build_bone_box(width, height, bone_size)
+            self._sprite_cache[key] = sprite
+        self.screen.blit(sprite, (x - bone_size, y - bone_size))
+    
+    def _build_bone_box(self, width, height, bone_size):
+        """
+        Draw a bone box onto a sprite.
+        
+        Args:
+            width (int): Box width
+            height (int): Box height
+            bone_size (int): Size of the border bones and corner paws
+            
+        Returns:
+            pygame.Surface: Sprite with the box's top-left corner at
+            (bone_size, bone_size), leaving room for the border to stick out
+        """
+        sprite = pygame.Surface((width + 2 * bone_size + 1, height + 2 * bone_size + 1),
+                                pygame.SRCALPHA)
+        x = y = bone_size
+        
+        # Box background, opaque as it is when drawn straight to the screen
+        pygame.draw.rect(sprite, UI_BG[:3], (x, y, width, height))
         
         # Draw bone-themed border
-        bone_size = 15
         spacing = bone_size * 2
         
         # Top border
         for bx in range(x + bone_size, x + width - bone_size, spacing):
-            self._draw_mini_bone(bx, y, bone_size, UI_HIGHLIGHT)
+            self._draw_mini_bone(bx, y, bone_size, UI_HIGHLIGHT, sprite)
         
         # Bottom border
         for bx in range(x + bone_size, x + width - bone_size, spacing):
-            self._draw_mini_bone(bx, y + height, bone_size, UI_HIGHLIGHT)
+            self._draw_mini_bone(bx, y + height, bone_size, UI_HIGHLIGHT, sprite)
         
         # Left border
         for by in range(y + bone_size, y + height - bone_size, spacing):
-            self._draw_mini_bone(x, by, bone_size, UI_HIGHLIGHT)
+            self._draw_mini_bone(x, by, bone_size, UI_HIGHLIGHT, sprite)
         
         # Right border
         for by in range(y + bone_size, y + height - bone_size, spacing):
-            self._draw_mini_bone(x + width, by, bone_size, UI_HIGHLIGHT)
+            self._draw_mini_bone(x + width, by, bone_size, UI_HIGHLIGHT, sprite)
         
         # Corners (paw prints)
-        self._draw_decorative_paw(x, y, UI_HIGHLIGHT, bone_size)
-        self._draw_decorative_paw(x + width, y, UI_HIGHLIGHT, bone_size)
-        self._draw_decorative_paw(x, y + height, UI_HIGHLIGHT, bone_size)
-        self._draw_decorative_paw(x + width, y + height, UI_HIGHLIGHT, bone_size)
-    
-    def _draw_mini_bone(self, x, y, size, color):
-        """Draw a mini bone."""
-        # Draw the middle rectangle 
-        rect_width = size // 2
-        rect_height = size // 4
-        rect_x = x - rect_width // 2
-        rect_y = y - rect_height // 2
-        pygame.draw.rect(self.screen, color, (rect_x, rect_y, rect_width, rect_height))
-        
-        # Draw the circular ends
-        radius = size // 6
-        pygame.draw.circle(self.screen, color, (rect_x, rect_y + rect_height // 2), radius)
-        pygame.draw.circle(self.screen, color, (rect_x + rect_width, rect_y + rect_height // 2), radius)
-    
-    def _draw_decorative_paw(self, x, y, color, size):
-        """Draw a decorative paw print."""
-        # Main pad
-        pygame.draw.ellipse(self.screen, color, 
-                          (x - size // 2, y - size // 2, 
-                           size, size))
-        
-        # Toe pads - small circles above the main pad
-        toe_size = size // 3
-        for i in range(3):
-            toe_x = x - size // 2 + (i * toe_size)
-            toe_y = y - size // 2 - toe_size // 2
-            pygame.draw.circle(self.screen, color, (toe_x, toe_y), toe_size // 2)
+        self._draw_decorative_paw(x, y, UI_HIGHLIGHT, bone_size, sprite)
+        self._draw_decorative_paw(x + width, y, UI_HIGHLIGHT, bone_size, sprite)
+        self._draw_decorative_paw(x, y + height, UI_HIGHLIGHT, bone_size, sprite)
+        self._draw_decorative_paw(x + width, y + height, UI_HIGHLIGHT, bone_size, sprite)
+        return sprite
     
-    def _draw_doggy_logo(self, x, y, size):
-        """Draw a cute doggy logo."""
-        # Draw doggy head
-        pygame.draw.circle(self.screen, DOGGY_BROWN, (x + size, y + size), size)
+    def _build_mascot_sprite(self, size, tongue_out):
+        """
+        Draw the static parts of the menu mascot onto a sprite.
+        
+        Args:
+            size (int): Mascot size in pixels
+            tongue_out (bool): Whether to draw the tongue
+            
+        Returns:
+            pygame.Surface: size x size sprite with a transparent background
+        """
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        
+        # Proportions used throughout the drawing
+        half = size // 2
+        third = size // 3
+        quarter = size // 4
+        sixth = size // 6
+        eighth = size // 8
+        twentieth = size // 20
+        head_size = half
+        ear_size = head_size // 3
+        eye_size = head_size // 8
+        eye_offset = eye_size * 2
+        mouth_width = head_size // 2
+        paw_size = size // 12
+        
+        # Body (sitting dog)
+        body_color = DOGGY_BROWN
+        
+        # Draw dog body (oval)
+        pygame.draw.ellipse(sprite, body_color, (quarter, third, half, half))
+        
+        # Draw head (circle)
+        pygame.draw.circle(sprite, body_color, (half, third), head_size // 2)
         
         # Ears
-        ear_size = size // 3
-        pygame.draw.ellipse(self.screen, DOGGY_BROWN, 
-                          (x + size // 2, y + size // 4,
-                           ear_size * 2, ear_size))
-        pygame.draw.ellipse(self.screen, DOGGY_BROWN, 
-                          (x + size + size // 2, y + size // 4,
-                           ear_size * 2, ear_size))
+        pygame.draw.ellipse(sprite, body_color, 
+                          (third - ear_size, sixth, ear_size, ear_size*1.5))
+        pygame.draw.ellipse(sprite, body_color, 
+                          (half + sixth, sixth, ear_size, ear_size*1.5))
         
         # Eyes
-        eye_size = size // 5
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size - eye_size, y + size - 2), 
-                         eye_size // 2)
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size + eye_size, y + size - 2), 
-                         eye_size // 2)
+        pygame.draw.circle(sprite, DOGGY_BLACK, (half - eye_offset, third - 2), eye_size)
+        pygame.draw.circle(sprite, DOGGY_BLACK, (half + eye_offset, third - 2), eye_size)
+        
+        # Shine in eyes
+        shine_size = eye_size // 3
+        pygame.draw.circle(sprite, WHITE, (half - eye_offset + 2, third - 4), shine_size)
+        pygame.draw.circle(sprite, WHITE, (half + eye_offset + 2, third - 4), shine_size)
         
         # Nose
-        pygame.draw.circle(self.screen, DOGGY_BLACK, 
-                         (x + size, y + size + 5), 
-                         eye_size // 2)
+        pygame.draw.circle(sprite, DOGGY_BLACK, (half, third + eye_offset), eye_size)
         
         # Mouth
-        pygame.draw.arc(self.screen, DOGGY_BLACK, 
-                       (x + size - eye_size, y + size + 5, 
-                        eye_size * 2, eye_size), 
-                        0, math.pi, 1)
+        pygame.draw.arc(sprite, DOGGY_BLACK, 
+                       (half - mouth_width//2, third + eye_offset, 
+                        mouth_width, eye_size*3), 
+                        0, pi, 2)
+        
+        # Tongue
+        if tongue_out:
+            pygame.draw.circle(sprite, DOGGY_PINK, 
+                            (half, third + eye_size*4), eye_size*1.2)
+        
+        # Collar
+        pygame.draw.rect(sprite, DOGGY_BLUE, (third, half + 4, third, twentieth))
+        
+        # Tag
+        pygame.draw.circle(sprite, DOGGY_YELLOW, (half, half + 10), twentieth)
+        
+        # Paws
+        pygame.draw.ellipse(sprite, body_color, 
+                          (quarter, third + half, paw_size*2, paw_size))
+        pygame.draw.ellipse(sprite, body_color, 
+                          (half + eighth, third + half, paw_size*2, paw_size))
+        return sprite
+    
+    def _draw_mini_bone(self, x, y, size, color, surface=None):
+        """Draw a mini bone, on the screen unless another surface is given."""
+        if surface is None:
+            surface = self.screen
+        key = ("bone", size, color)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            # Drawn around the centre of a (2 * size + 1) square
+            sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            
+            # Draw the middle rectangle 
+            rect_width = size // 2
+            rect_height = size // 4
+            rect_x = size - rect_width // 2
+            rect_y = size - rect_height // 2
+            pygame.draw.rect(sprite, color, (rect_x, rect_y, rect_width, rect_height))
+            
+            # Draw the circular ends
+            radius = size // 6
+            pygame.draw.circle(sprite, color, (rect_x, rect_y + rect_height // 2), radius)
+            pygame.draw.circle(sprite, color, (rect_x + rect_width, rect_y + rect_height // 2), radius)
+            self._sprite_cache[key] = sprite
+        surface.blit(sprite, (x - size, y - size))
+    
+    def _draw_decorative_paw(self, x, y, color, size, surface=None):
+        """Draw a decorative paw print, on the screen unless another surface is given."""
+        if surface is None:
+            surface = self.screen
+        surface.blit(self._decorative_paw_sprite(color, size), (x - size, y - size))
+    
+    def _decorative_paw_sprite(self, color, size):
+        """
+        Get the cached sprite for a decorative paw print.
+        
+        Args:
+            color (tuple): Paw color
+            size (int): Main pad size in pixels
+            
+        Returns:
+            pygame.Surface: (2 * size + 1) square sprite with the paw centred
+        """
+        key = ("paw", size, color)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            # Drawn around the centre of a (2 * size + 1) square
+            sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            
+            # Main pad
+            pygame.draw.ellipse(sprite, color, 
+                              (size - size // 2, size - size // 2, 
+                               size, size))
+            
+            # Toe pads - small circles above the main pad
+            toe_size = size // 3
+            for i in range(3):
+                toe_x = size - size // 2 + (i * toe_size)
+                toe_y = size - size // 2 - toe_size // 2
+                pygame.draw.circle(sprite, color, (toe_x, toe_y), toe_size // 2)
+            self._sprite_cache[key] = sprite
+        return sprite
+    
+    def _draw_doggy_logo(self, x, y, size):
+        """Draw a cute doggy logo."""
+        key = ("logo", size, DOGGY_BROWN)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            # Wide enough for the right ear, which sticks out past the head
+            sprite = pygame.Surface((3 * size, 2 * size + 1), pygame.SRCALPHA)
+            
+            # Draw doggy head
+            pygame.draw.circle(sprite, DOGGY_BROWN, (size, size), size)
+            
+            # Ears
+            ear_size = size // 3
+            pygame.draw.ellipse(sprite, DOGGY_BROWN, 
+                              (size // 2, size // 4,
+                               ear_size * 2, ear_size))
+            pygame.draw.ellipse(sprite, DOGGY_BROWN, 
+                              (size + size // 2, size // 4,
+                               ear_size * 2, ear_size))
+            
+            # Eyes
+            eye_size = size // 5
+            pygame.draw.circle(sprite, DOGGY_BLACK, 
+                             (size - eye_size, size - 2), 
+                             eye_size // 2)
+            pygame.draw.circle(sprite, DOGGY_BLACK, 
+                             (size + eye_size, size - 2), 
+                             eye_size // 2)
+            
+            # Nose
+            pygame.draw.circle(sprite, DOGGY_BLACK, 
+                             (size, size + 5), 
+                             eye_size // 2)
+            
+            # Mouth
+            pygame.draw.arc(sprite, DOGGY_BLACK, 
+                           (size - eye_size, size + 5, 
+                            eye_size * 2, eye_size), 
+                            0, pi, 1)
+            self._sprite_cache[key] = sprite
+        self.screen.blit(sprite, (x, y))
         
         # Draw text
-        title_text = self.font.render("TEMPORAL MAZE", True, UI_TEXT)
+        title_text = self._text("TEMPORAL MAZE", UI_TEXT)
         self.screen.blit(title_text, (x + size*2 + 10, y + size - title_text.get_height()//2))
     
     def _render_pause_menu(self):
         """Render the pause menu overlay."""
+        self.screen.blits(self._overlay_blits("pause", self._layout_pause_menu), False)
+    
+    def _layout_pause_menu(self):
+        """
+        Lay out the pause menu overlay.
+        
+        Returns:
+            list: (surface, (x, y)) pairs, ready for Surface.blits
+        """
         # Semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((LAVENDER[0], LAVENDER[1], LAVENDER[2], 180))
-        self.screen.blit(overlay, (0, 0))
         
         # Pause menu text
-        pause_text = self.title_font.render("PAUSED", True, DARK_BLUE)
-        resume_text = self.font.render("Press ESC to Resume", True, BLUE)
-        rules_text = self.font.render("Press H for Help & Rules", True, BLUE)
-        quit_text = self.font.render("Press Q to Return to Main Menu", True, BLUE)
+        pause_text = self._text("PAUSED", DARK_BLUE, self.title_font)
+        resume_text = self._text("Press ESC to Resume", BLUE)
+        rules_text = self._text("Press H for Help & Rules", BLUE)
+        quit_text = self._text("Press Q to Return to Main Menu", BLUE)
         
         # Center the text
         pause_x = (SCREEN_WIDTH - pause_text.get_width()) // 2
@@ -907,11 +1159,11 @@ class Game:
         quit_x = (SCREEN_WIDTH - quit_text.get_width()) // 2
         quit_y = rules_y + rules_text.get_height() + 20
         
-        # Draw the text
-        self.screen.blit(pause_text, (pause_x, pause_y))
-        self.screen.blit(resume_text, (resume_x, resume_y))
-        self.screen.blit(rules_text, (rules_x, rules_y))
-        self.screen.blit(quit_text, (quit_x, quit_y))
+        return [(overlay, (0, 0)),
+                (pause_text, (pause_x, pause_y)),
+                (resume_text, (resume_x, resume_y)),
+                (rules_text, (rules_x, rules_y)),
+                (quit_text, (quit_x, quit_y))]
     
     def _render_dialogue_box(self):
         """Render a dialogue box for terminal messages."""
@@ -928,52 +1180,77 @@ class Game:
         # Add a title bar
         title_rect = (box_rect[0], box_rect[1], box_rect[2], 30)
         pygame.draw.rect(self.screen, UI_HIGHLIGHT, title_rect)
-        terminal_title = self.font.render("TERMINAL MESSAGE", True, WHITE)
+        terminal_title = self._text("TERMINAL MESSAGE", WHITE)
         self.screen.blit(terminal_title, 
                        (box_rect[0] + (box_rect[2] - terminal_title.get_width()) // 2, 
                         box_rect[1] + 5))
         
-        # Render the message with word wrapping
+        # Render the message with word wrapping, laid out once per message
         if self.message:
-            words = self.message.split(' ')
-            lines = []
-            line = ""
-            
-            for word in words:
-                test_line = line + word + " "
-                # Check if the line is too long
-                if self.font.size(test_line)[0] > SCREEN_WIDTH - 40:
-                    lines.append(line)
-                    line = word + " "
-                else:
-                    line = test_line
-            
-            # Add the last line
-            if line:
-                lines.append(line)
-            
-            # Render each line
-            for i, line in enumerate(lines):
-                text = self.font.render(line, True, UI_TEXT)
-                self.screen.blit(text, (20, SCREEN_HEIGHT - SCREEN_HEIGHT // 3 + 50 + i * 30))
+            wrapped = self._wrapped_message
+            if wrapped is None or wrapped[0] != self.message:
+                wrapped = self._wrapped_message = (self.message,
+                                                   self._wrap_message(self.message))
+            self.screen.blits(wrapped[1], False)
             
             # Continue prompt with pulsing effect
-            alpha = 128 + int(127 * abs(math.sin(time.time() * 3)))
-            continue_text = self.font.render("Press ENTER or SPACE to continue", True, UI_TEXT)
+            alpha = 128 + int(127 * abs(sin(pygame.time.get_ticks() * 0.003)))
+            continue_text = self._text("Press ENTER or SPACE to continue", UI_TEXT)
             continue_x = (SCREEN_WIDTH - continue_text.get_width()) // 2
             continue_y = SCREEN_HEIGHT - 40
             self.screen.blit(continue_text, (continue_x, continue_y))
     
+    def _wrap_message(self, message):
+        """
+        Word-wrap a dialogue message and render its lines.
+        
+        Args:
+            message (str): The message text
+            
+        Returns:
+            list: (surface, (x, y)) pairs for each line, ready for Surface.blits
+        """
+        words = message.split(' ')
+        lines = []
+        line = ""
+        
+        for word in words:
+            test_line = line + word + " "
+            # Check if the line is too long
+            if self.font.size(test_line)[0] > SCREEN_WIDTH - 40:
+                lines.append(line)
+                line = word + " "
+            else:
+                line = test_line
+        
+        # Add the last line
+        if line:
+            lines.append(line)
+        
+        # Render each line
+        top = SCREEN_HEIGHT - SCREEN_HEIGHT // 3 + 50
+        return [(self.font.render(line, True, UI_TEXT).convert_alpha(), (20, top + i * 30))
+                for i, line in enumerate(lines)]
+    
     def _render_level_complete(self):
         """Render the level complete overlay."""
+        self.screen.blits(self._overlay_blits("level_complete", self._layout_level_complete),
+                          False)
+    
+    def _layout_level_complete(self):
+        """
+        Lay out the level complete overlay.
+        
+        Returns:
+            list: (surface, (x, y)) pairs, ready for Surface.blits
+        """
         # Semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((MINT[0], MINT[1], MINT[2], 180))
-        self.screen.blit(overlay, (0, 0))
         
         # Level complete text
-        complete_text = self.title_font.render("LEVEL COMPLETE!", True, DARK_BLUE)
-        continue_text = self.font.render("Press ENTER to continue", True, BLUE)
+        complete_text = self._text("LEVEL COMPLETE!", DARK_BLUE, self.title_font)
+        continue_text = self._text("Press ENTER to continue", BLUE)
         
         # Center the text
         complete_x = (SCREEN_WIDTH - complete_text.get_width()) // 2
@@ -982,21 +1259,29 @@ class Game:
         continue_x = (SCREEN_WIDTH - continue_text.get_width()) // 2
         continue_y = complete_y + complete_text.get_height() + 30
         
-        # Draw the text
-        self.screen.blit(complete_text, (complete_x, complete_y))
-        self.screen.blit(continue_text, (continue_x, continue_y))
+        return [(overlay, (0, 0)),
+                (complete_text, (complete_x, complete_y)),
+                (continue_text, (continue_x, continue_y))]
     
     def _render_game_over(self):
         """Render the game over overlay."""
+        self.screen.blits(self._overlay_blits("game_over", self._layout_game_over), False)
+    
+    def _layout_game_over(self):
+        """
+        Lay out the game over overlay.
+        
+        Returns:
+            list: (surface, (x, y)) pairs, ready for Surface.blits
+        """
         # Semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((RED[0], RED[1], RED[2], 160))
-        self.screen.blit(overlay, (0, 0))
         
         # Game over text
-        over_text = self.title_font.render("GAME OVER", True, WHITE)
-        restart_text = self.font.render("Press ENTER to Restart Level", True, WHITE)
-        quit_text = self.font.render("Press Q to Return to Main Menu", True, WHITE)
+        over_text = self._text("GAME OVER", WHITE, self.title_font)
+        restart_text = self._text("Press ENTER to Restart Level", WHITE)
+        quit_text = self._text("Press Q to Return to Main Menu", WHITE)
         
         # Center the text
         over_x = (SCREEN_WIDTH - over_text.get_width()) // 2
@@ -1008,10 +1293,26 @@ class Game:
         quit_x = (SCREEN_WIDTH - quit_text.get_width()) // 2
         quit_y = restart_y + restart_text.get_height() + 20
         
-        # Draw the text
-        self.screen.blit(over_text, (over_x, over_y))
-        self.screen.blit(restart_text, (restart_x, restart_y))
-        self.screen.blit(quit_text, (quit_x, quit_y))
+        return [(overlay, (0, 0)),
+                (over_text, (over_x, over_y)),
+                (restart_text, (restart_x, restart_y)),
+                (quit_text, (quit_x, quit_y))]
+    
+    def _overlay_blits(self, name, layout):
+        """
+        Get a fixed overlay's surfaces and positions, laying it out on first use.
+        
+        Args:
+            name (str): Cache key for the overlay
+            layout (callable): Builds the (surface, (x, y)) list
+            
+        Returns:
+            list: (surface, (x, y)) pairs, ready for Surface.blits
+        """
+        blits = self._overlay_cache.get(name)
+        if blits is None:
+            blits = self._overlay_cache[name] = layout()
+        return blits
     
     def _render_message(self):
         """Render a temporary message."""
@@ -1019,7 +1320,7 @@ class Game:
             return
             
         # Create a semi-transparent background
-        message_surf = self.font.render(self.message, True, WHITE)
+        message_surf = self._text(self.message, WHITE)
         bg_width = message_surf.get_width() + 20
         bg_height = message_surf.get_height() + 10
         
@@ -1051,13 +1352,22 @@ class Game:
         # Background
         self.screen.fill(BG_COLOR)
         
+        # The rules never change, so they're rendered and laid out once
+        self.screen.blits(self._overlay_blits("rules", self._layout_rules), False)
+    
+    def _layout_rules(self):
+        """
+        Render the rules screen text and work out where each line goes.
+        
+        Returns:
+            list: (surface, (x, y)) pairs, ready for Surface.blits
+        """
         # Title
-        title = self.title_font.render("GAME RULES", True, DARK_BLUE)
+        title = self._text("GAME RULES", DARK_BLUE, self.title_font)
         title_x = (SCREEN_WIDTH - title.get_width()) // 2
         title_y = 40
-        self.screen.blit(title, (title_x, title_y))
+        layout = [(title, (title_x, title_y))]
         
-        # Rules content
         rules = [
             "OBJECTIVE:",
             "Navigate through time-bending mazes to reach the exit portal in each level.",
@@ -1090,7 +1400,7 @@ class Game:
             "- H: View this help screen"
         ]
         
-        # Render each line
+        # Lay out each line
         y_pos = title_y + 80
         for line in rules:
             if line == "":
@@ -1099,21 +1409,22 @@ class Game:
             
             if ":" in line and line.endswith(":"):
                 # Section headers
-                text = self.font.render(line, True, BLUE)
+                text = self.font.render(line, True, BLUE).convert_alpha()
                 text_x = 100
             else:
                 # Normal text
-                text = self.font.render(line, True, DARK_BLUE)
+                text = self.font.render(line, True, DARK_BLUE).convert_alpha()
                 text_x = 120
             
-            self.screen.blit(text, (text_x, y_pos))
+            layout.append((text, (text_x, y_pos)))
             y_pos += 25
         
         # Return to menu instruction
-        back_text = self.font.render("Press ESC or BACKSPACE to return to menu", True, BLUE)
+        back_text = self._text("Press ESC or BACKSPACE to return to menu", BLUE)
         back_x = (SCREEN_WIDTH - back_text.get_width()) // 2
         back_y = SCREEN_HEIGHT - 40
-        self.screen.blit(back_text, (back_x, back_y))
+        layout.append((back_text, (back_x, back_y)))
+        return layout
     
     def _handle_playing_input(self, key):
         """Handle input during gameplay."""
@@ -1183,8 +1494,16 @@ class Game:
         """Main game loop."""
         while self.running:
             self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
-            self.render()
+            
+            # One handler for the whole frame keeps try blocks out of the
+            # per-frame update and render code
+            try:
+                self.handle_events()
+                self.update()
+                self.render()
+            except Exception as e:
+                # Print error but don't crash
+                print(f"Error in main game loop: {e}")
+                traceback.print_exc()
             
         pygame.quit() 
\ No newline at end of file
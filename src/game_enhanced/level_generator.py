@@ -414,8 +414,9 @@ def load_level_from_file(file_path):
         file_path (str): Path to the level file.
 
     Returns:
-        tuple: (map_array, player_start, switches, doors, portals, guards, items, terminal_pos) 
-               or None if loading fails.
+        tuple: (map_array, player_start, switches, doors, portals, guards, items, terminal_pos,
+               key_doors) or None if loading fails. key_doors lists the doors ('L')
+               that open with a key.
     """
     try:
         with open(file_path, 'r') as f:
@@ -432,6 +433,7 @@ def load_level_from_file(file_path):
         player_start = None
         switches = []
         doors = []
+        key_doors = []
         portals = {}
         portal_list = [] # Store pairs
         guards = []
@@ -449,7 +451,9 @@ def load_level_from_file(file_path):
                 
                 if char == 'P': player_start = pos
                 elif char == 'S' or char == 'T': switches.append(pos)
-                elif char == 'D' or char == 'L' or char == 'C': doors.append(pos)
+                elif char == 'D' or char == 'L' or char == 'C':
+                    doors.append(pos)
+                    if char == 'L': key_doors.append(pos)
                 elif char == 'A': portals['A'] = pos
                 elif char == 'B': portals['B'] = pos
                 elif char == 'K': items.append((pos, TILE_ITEM_KEY))
@@ -470,7 +474,7 @@ def load_level_from_file(file_path):
 
         # Important: Return doors as a list of positions, not the dict needed by World
         # The conversion happens in OptimizedGame._convert_file_data_to_dict
-        return (level_map, player_start, switches, doors, portal_list, guards, items, terminal_pos)
+        return (level_map, player_start, switches, doors, portal_list, guards, items, terminal_pos, key_doors)
 
     except FileNotFoundError:
         print(f"Error: Level file not found: {file_path}")
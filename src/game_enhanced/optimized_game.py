@@ -4,9 +4,8 @@ Addresses potential performance bottlenecks that could cause freezing.
 """
 
 import pygame
-import time
-import math
 import random
+import numpy as np
 import gc
 import os
 import traceback
@@ -15,6 +14,7 @@ from .assets import assets
 from .world import World
 from .entities import Player, TimeClone, Guard, Terminal
 from .level_generator import LevelGenerator, load_level_from_file
+from ._guard_jit import warm_up as warm_up_guard_kernels
 
 # Import the original Game class to inherit from
 from .game import Game as OriginalGame
@@ -53,11 +53,22 @@ class OptimizedGame(OriginalGame):
         self.player = None
         self.clones = []
         self.guards = []
+        self.guard_system = None
+        warm_up_guard_kernels()
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Optimization: Use a render cache to avoid redrawing static elements
         self.render_cache = {}
         self.cache_valid = False
+        self._text_cache = {}  # (text, color, font) -> rendered surface, see _text
+        self._menu_bg_cache = {}  # Pattern size -> pre-rendered menu background
+        self._menu_paw_cells = None  # Background cells drawn as paws, picked once
+        self._menu_panel = None  # Menu panel with its border, built on first use
+        self._sprite_cache = {}  # (kind, size, color) -> pre-drawn decoration sprite
+        self._ui_paw_blits = None  # (sprite, position) pairs for the UI panel paws
+        self._rules_wrapped = {}  # (rule line, font) -> the line wrapped to fit the screen
+        self._wrapped_message = None  # (message, line blits) for the dialogue box
+        self._overlay_cache = {}  # Overlay name -> (surface, position) list, see _overlay_blits
         
         # Optimization: Track visible area for culling
         self.visible_area = (0, 0, 0, 0)  # (x, y, width, height) in tile coordinates
@@ -73,7 +84,9 @@ class OptimizedGame(OriginalGame):
         
         # Movement control
         self.last_move_time = 0
-        self.movement_delay = MOVEMENT_DELAY
+        self.movement_delay = MOVEMENT_DELAY_MS  # Milliseconds, compared against get_ticks
+        self._held_move_keys = set()  # Movement keys currently down
+        self._move_dir = (0, 0)       # Step for the held keys, see _update_move_dir
         
         # UI elements
         self.font = assets.get_font("medium")
@@ -93,7 +106,7 @@ class OptimizedGame(OriginalGame):
         # Debug info
         self.show_debug = False
         self.frame_times = []
-        self.last_gc_time = time.time()
+        self.last_gc_time = pygame.time.get_ticks()
         
         # Rules screen state
         self.rules_scroll_offset = 0
@@ -133,13 +146,13 @@ class OptimizedGame(OriginalGame):
         
         # Set maximum FPS
         MAX_FRAME_TIME = 1.0 / 30  # Cap at 30 FPS minimum
-        last_frame_time = time.time()
+        last_frame_time = pygame.time.get_ticks()
         frame_count = 0
         
         while self.running:
             # Measure frame time
-            current_time = time.time()
-            frame_time = current_time - last_frame_time
+            current_time = pygame.time.get_ticks()
+            frame_time = (current_time - last_frame_time) / 1000.0
             
             # Store frame time for debug display
             self.frame_times.append(frame_time)
@@ -147,7 +160,7 @@ class OptimizedGame(OriginalGame):
                 self.frame_times.pop(0)
             
             # Run periodic garbage collection to prevent memory buildup
-            if current_time - self.last_gc_time > 5.0:
+            if current_time - self.last_gc_time > 5000:
                 gc.collect()
                 self.last_gc_time = current_time
             
@@ -216,121 +229,98 @@ class OptimizedGame(OriginalGame):
         # Get delta time
         self.dt = min(self.clock.get_time() / 1000.0, 0.1)  # Cap at 100ms to prevent issues
         
-        try:
-            if self.state == STATE_PLAYING:
-                # Handle player movement with delay
-                current_time = time.time()
-                keys = pygame.key.get_pressed()
-                dx, dy = 0, 0
-                
-                if keys[pygame.K_UP] or keys[pygame.K_w]:
-                    dy = -1
-                elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                    dy = 1
-                elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                    dx = -1
-                elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                    dx = 1
-                    
-                if (dx != 0 or dy != 0) and current_time - self.last_move_time > self.movement_delay:
-                    if self.player:  # Make sure player exists
-                        # Invalidate render cache when player moves
-                        self.cache_valid = False
-                        self.player.move(dx, dy, self.world)
-                        self.last_move_time = current_time
-                
-                # Update clones with improved performance
-                active_clones = []
-                for clone in self.clones:
-                    if clone.update(self):
-                        active_clones.append(clone)
-                
-                # This is more efficient than repeatedly popping from the list
-                self.clones = active_clones
-                
-                # Update guards
-                for guard in self.guards:
-                    guard.update(self)
-                    
-                # Update player paw prints
-                if self.player:
-                    self.player.update(self)
-                
-                # Update camera to follow player
-                if self.player:
-                    self._update_camera()
-                
-                # Check for level completion
-                if self.world and getattr(self.world, 'level_completed', False):
-                    self.state = STATE_LEVEL_COMPLETE
-                    
-                # Check for player being caught
-                if self.player_caught:
-                    self.state = STATE_GAME_OVER
-                
-            # Update message timer
-            if self.message and self.message_timer > 0:
-                self.message_timer -= self.dt
-                if self.message_timer <= 0:
-                    self.message = None
+        if self.state == STATE_PLAYING:
+            # Handle player movement with delay
+            current_time = pygame.time.get_ticks()
+            dx, dy = self._move_dir
                 
-        except Exception as e:
-            # Print error but don't crash
-            print(f"Error in game update: {e}")
-            traceback.print_exc()
-    
-    def render(self):
-        """Render the game with performance optimizations."""
-        try:
-            # Clear screen with background color
-            self.screen.fill(BG_COLOR)
+            if (dx != 0 or dy != 0) and current_time - self.last_move_time > self.movement_delay:
+                if self.player:  # Make sure player exists
+                    # Invalidate render cache when player moves
+                    self.cache_valid = False
+                    self.player.move(dx, dy, self.world)
+                    self.last_move_time = current_time
+            
+            # Update clones with improved performance
+            active_clones = []
+            for clone in self.clones:
+                if clone.update(self):
+                    active_clones.append(clone)
             
-            # Adjust camera position to center on player before rendering anything
-            if self.state in [STATE_PLAYING, STATE_PAUSED, STATE_LEVEL_COMPLETE, STATE_GAME_OVER] and self.player:
-                # Camera is already updated in update method, don't force position here
-                pass
+            # This is more efficient than repeatedly popping from the list
+            self.clones = active_clones
             
-            if self.state == STATE_MAIN_MENU:
-                self._render_main_menu()
-            elif self.state == STATE_RULES:
-                self._render_rules()
-            elif self.state in [STATE_PLAYING, STATE_PAUSED, STATE_TIME_TRAVEL, STATE_DIALOGUE]:
-                self._render_game_optimized()
+            # Update guards
+            self._update_guards()
                 
-                if self.state == STATE_PAUSED:
-                    self._render_pause_menu()
-                elif self.state == STATE_DIALOGUE:
-                    self._render_dialogue_box()
-                elif self.state == STATE_TIME_TRAVEL:
-                    self._render_time_travel_prompt()
-            elif self.state == STATE_LEVEL_COMPLETE:
-                self._render_game_optimized()
-                self._render_level_complete()
-            elif self.state == STATE_GAME_OVER:
-                self._render_game_optimized()
-                self._render_game_over()
+            # Update player paw prints
+            if self.player:
+                self.player.update(self)
             
-            # Always render messages if there are any
-            if self.message:
-                self._render_message()
+            # Update camera to follow player
+            if self.player:
+                self._update_camera()
             
-            # Render debug info if enabled
-            if self.show_debug:
-                self._render_debug_info()
+            # Check for level completion
+            if self.world and self.world.level_completed:
+                self.state = STATE_LEVEL_COMPLETE
                 
-                # Display additional camera and player positioning info in debug mode
-                if self.player and self.world:
-                    debug_font = pygame.font.SysFont("monospace", 16)
-                    pos_text = f"Player: ({self.player.x}, {self.player.y}) | Camera: ({self.camera.x//TILE_SIZE}, {self.camera.y//TILE_SIZE})"
-                    text = debug_font.render(pos_text, True, (255, 255, 255))
-                    self.screen.blit(text, (15, 95))
+            # Check for player being caught
+            if self.player_caught:
+                self.state = STATE_GAME_OVER
+            
+        # Update message timer
+        if self.message and self.message_timer > 0:
+            self.message_timer -= self.dt
+            if self.message_timer <= 0:
+                self.message = None
+    
+    def render(self):
+        """Render the game with performance optimizations."""
+        # Clear screen with background color
+        self.screen.fill(BG_COLOR)
+        
+        # Adjust camera position to center on player before rendering anything
+        if self.state in [STATE_PLAYING, STATE_PAUSED, STATE_LEVEL_COMPLETE, STATE_GAME_OVER] and self.player:
+            # Camera is already updated in update method, don't force position here
+            pass
+        
+        if self.state == STATE_MAIN_MENU:
+            self._render_main_menu()
+        elif self.state == STATE_RULES:
+            self._render_rules()
+        elif self.state in [STATE_PLAYING, STATE_PAUSED, STATE_TIME_TRAVEL, STATE_DIALOGUE]:
+            self._render_game_optimized()
             
-            pygame.display.flip()
+            if self.state == STATE_PAUSED:
+                self._render_pause_menu()
+            elif self.state == STATE_DIALOGUE:
+                self._render_dialogue_box()
+            elif self.state == STATE_TIME_TRAVEL:
+                self._render_time_travel_prompt()
+        elif self.state == STATE_LEVEL_COMPLETE:
+            self._render_game_optimized()
+            self._render_level_complete()
+        elif self.state == STATE_GAME_OVER:
+            self._render_game_optimized()
+            self._render_game_over()
+        
+        # Always render messages if there are any
+        if self.message:
+            self._render_message()
+        
+        # Render debug info if enabled
+        if self.show_debug:
+            self._render_debug_info()
             
-        except Exception as e:
-            # Print error but don't crash
-            print(f"Error in game rendering: {e}")
-            traceback.print_exc()
+            # Display additional camera and player positioning info in debug mode
+            if self.player and self.world:
+                debug_font = pygame.font.SysFont("monospace", 16)
+                pos_text = f"Player: ({self.player.x}, {self.player.y}) | Camera: ({self.camera.x//TILE_SIZE}, {self.camera.y//TILE_SIZE})"
+                text = debug_font.render(pos_text, True, (255, 255, 255))
+                self.screen.blit(text, (15, 95))
+        
+        pygame.display.flip()
     
     def _render_game_optimized(self):
         """Optimized version of the game rendering with culling."""
@@ -402,7 +392,7 @@ class OptimizedGame(OriginalGame):
                 if tile_type == TILE_WALL:
                     image = assets.get_image("wall")
                 elif tile_type == TILE_FLOOR:
-                    image = assets.get_image("floor")
+                    image = assets.get_floor_tile(x, y)
                 elif tile_type == TILE_SWITCH:
                     image = assets.get_image("switch")
                 elif tile_type == TILE_DOOR_CLOSED:
@@ -455,12 +445,15 @@ class OptimizedGame(OriginalGame):
             )
             pygame.draw.rect(self.screen, (255, 255, 0, 128), highlight_rect, 2)
         
+        # Look up the sprites once per frame rather than once per entity
+        screen = self.screen
+        paw_frames, clone_paw_frames, clone_images, guard_image, guard_alerted_image = \
+            self._entity_sprites()
+        
         # Render paw prints for player
         if self.player and hasattr(self.player, 'paw_prints'):
-            for paw in self.player.paw_prints:
-                screen_x, screen_y = get_screen_pos(paw["x"], paw["y"])
-                frame = assets.get_animation_frame("paw_prints", paw["frame"])
-                self.screen.blit(frame, (screen_x, screen_y))
+            for screen_x, screen_y, paw_frame in self.player.paw_prints.on_screen(self.camera.x, self.camera.y):
+                screen.blit(paw_frames[paw_frame], (int(screen_x), int(screen_y)))
         
         # Render clones and their paw prints
         print(f"[Render] Clones list size: {len(self.clones)}") # DEBUG: Check if clones exist before rendering
@@ -468,36 +461,36 @@ class OptimizedGame(OriginalGame):
             print(f"[Render] Rendering Clone at ({clone.x}, {clone.y}), Active: {getattr(clone, 'active', 'N/A')}, Step: {getattr(clone, 'current_step', 'N/A')}") # DEBUG
             # Render clone's paw prints if they exist
             if hasattr(clone, 'paw_prints'):
-                for paw in clone.paw_prints:
-                    screen_x, screen_y = get_screen_pos(paw["x"], paw["y"])
-                    frame = assets.get_animation_frame("paw_prints", paw["frame"])
-                    # Make clone paw prints slightly different color
-                    paw_frame = frame.copy()
-                    paw_frame.fill((150, 150, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-                    self.screen.blit(paw_frame, (screen_x, screen_y))
+                for screen_x, screen_y, paw_frame in clone.paw_prints.on_screen(self.camera.x, self.camera.y):
+                    # Clone paw prints use the blue-tinted frames
+                    screen.blit(clone_paw_frames[paw_frame], (int(screen_x), int(screen_y)))
             
             # Render clones
             screen_x, screen_y = get_screen_pos(clone.x, clone.y)
-            # Get clone direction safely
-            direction = getattr(clone, 'facing', 'right')
-            self.screen.blit(assets.get_image("clone", direction), (screen_x, screen_y))
-        
-        # Render guards
-        for guard in self.guards:
+            # Sprite for the way the clone is facing
+            screen.blit(clone_images[clone.facing], (screen_x, screen_y))
+        
+        # Render guards; skip the ones entirely off screen when the guard
+        # system can pick them out in one pass
+        guards = self.guards
+        system = self.guard_system
+        if system is not None and system.matches(guards):
+            guards = [guards[i] for i in system.on_screen(self.camera.x, self.camera.y,
+                                                          margin=TILE_SIZE - 1)]
+        for guard in guards:
             screen_x, screen_y = get_screen_pos(guard.x, guard.y)
             # Choose image based on guard state
             if guard.state == GUARD_ALERTED:
-                image = assets.get_image("guard_alerted")
+                screen.blit(guard_alerted_image, (screen_x, screen_y))
             else:
-                image = assets.get_image("guard")
-            self.screen.blit(image, (screen_x, screen_y))
+                screen.blit(guard_image, (screen_x, screen_y))
         
         # Always render player last so it's on top
         if self.player:
             player_screen_x, player_screen_y = get_screen_pos(self.player.x, self.player.y)
-            # Get player direction safely
-            direction = getattr(self.player, 'facing', 'right')
-            self.screen.blit(assets.get_image("player", direction), (player_screen_x, player_screen_y))
+            # Sprite for the way the player is facing
+            direction = self.player.facing
+            screen.blit(assets.get_image("player", direction), (player_screen_x, player_screen_y))
     
     def _render_debug_info(self):
         """Render debug information overlay."""
@@ -528,39 +521,27 @@ class OptimizedGame(OriginalGame):
             text = debug_font.render(line, True, (255, 255, 255))
             self.screen.blit(text, (15, 15 + i * 20))
     
-    def handle_events(self):
-        """Handle user input events with additional debug controls."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                
-            elif event.type == pygame.KEYDOWN:
-                # Handle global keys first (like debug)
-                if event.key == pygame.K_F3:
-                    self.show_debug = not self.show_debug
-                elif event.key == pygame.K_F5:
-                    gc.collect()
-                elif event.key == pygame.K_F2:
-                    # Center camera logic...
-                    pass # Assume this logic is correct
-                
-                # Handle state-specific input
-                if self.state == STATE_MAIN_MENU:
-                    self._handle_main_menu_input(event.key)
-                elif self.state == STATE_PLAYING:
-                    self._handle_playing_input(event.key)
-                elif self.state == STATE_PAUSED:
-                    self._handle_paused_input(event.key)
-                elif self.state == STATE_TIME_TRAVEL:
-                    self._handle_time_travel_input(event.key)
-                elif self.state == STATE_LEVEL_COMPLETE:
-                    self._handle_level_complete_input(event.key)
-                elif self.state == STATE_GAME_OVER:
-                    self._handle_game_over_input(event.key)
-                elif self.state == STATE_DIALOGUE:
-                    self._handle_dialogue_input(event.key)
-                elif self.state == STATE_RULES:
-                    self._handle_rules_input(event.key)
+    def handle_key(self, key):
+        """
+        Handle a key press with additional debug controls.
+        
+        Args:
+            key (int): Pygame key code
+        """
+        # Handle global keys first (like debug)
+        if key == pygame.K_F3:
+            self.show_debug = not self.show_debug
+        elif key == pygame.K_F5:
+            gc.collect()
+        elif key == pygame.K_F2:
+            # Center camera logic...
+            pass # Assume this logic is correct
+        
+        # Handle state-specific input
+        if self.state == STATE_TIME_TRAVEL:
+            self._handle_time_travel_input(key)
+        else:
+            super().handle_key(key)
                     
     def _handle_time_travel_input(self, key):
         """Handle input when in time travel state."""
@@ -694,7 +675,7 @@ class OptimizedGame(OriginalGame):
     def _convert_file_data_to_dict(self, file_level_data):
         """Converts data loaded from file (likely tuple) to the dictionary format."""
         try:
-             map_array, p_start, switch_list, door_list, portal_list, guard_list, item_list, term_list_from_file = file_level_data
+             map_array, p_start, switch_list, door_list, portal_list, guard_list, item_list, term_list_from_file, key_door_list = file_level_data
              height, width = map_array.shape
              
              exit_pos = None
@@ -763,6 +744,7 @@ class OptimizedGame(OriginalGame):
                 "player_start": p_start, "exit_pos": exit_pos,
                 "switches": switch_list, # Pass the list of switch positions found
                 "doors": door_dict,       # Pass the dict of doors with empty requirements
+                "key_doors": key_door_list,
                 "portals": portal_list, "guards": guard_list, "items": item_list,
                 "terminal_pos": term_pos, "terminals": terminals
              }
@@ -783,12 +765,9 @@ class OptimizedGame(OriginalGame):
             self.world = World(width, height)
             
             # Fill with floor tiles, walls around the edge
-            for x in range(width):
-                for y in range(height):
-                    if x == 0 or y == 0 or x == width-1 or y == height-1:
-                        self.world.set_tile(x, y, TILE_WALL)
-                    else:
-                        self.world.set_tile(x, y, TILE_FLOOR)
+            tiles = np.full((height, width), TILE_FLOOR, dtype=np.int8)
+            tiles[0, :] = tiles[-1, :] = tiles[:, 0] = tiles[:, -1] = TILE_WALL
+            self.world.load_tiles_array(tiles)
             
             # Initialize world data structures
             self.world.switches = {}
@@ -898,6 +877,7 @@ class OptimizedGame(OriginalGame):
             
             # --- Process switches and doors --- 
             self.world.doors = door_data_dict
+            self.world.key_doors = set(level_data.get("key_doors", ()))
             for switch_pos in switch_positions:
                 self.world.switches[switch_pos] = [] 
             for door_pos, data in door_data_dict.items():
@@ -1072,17 +1052,17 @@ class OptimizedGame(OriginalGame):
         pygame.draw.rect(self.screen, UI_HIGHLIGHT, (box_x, box_y, box_width, box_height), 3)
         
         # Render prompt text
-        prompt_text_surface = self.font.render(self.time_travel_prompt, True, UI_TEXT)
+        prompt_text_surface = self._text(self.time_travel_prompt, UI_TEXT)
         prompt_rect = prompt_text_surface.get_rect(center=(box_x + box_width // 2, box_y + 40))
         self.screen.blit(prompt_text_surface, prompt_rect)
         
         # Render current input text
-        input_text_surface = self.font.render(self.time_travel_input, True, UI_TEXT)
+        input_text_surface = self._text(self.time_travel_input, UI_TEXT)
         input_rect = input_text_surface.get_rect(center=(box_x + box_width // 2, box_y + 80))
         self.screen.blit(input_text_surface, input_rect)
         
         # Blinking cursor effect
-        if int(time.time() * 2) % 2 == 0: # Blink roughly every half second
+        if pygame.time.get_ticks() // 500 % 2 == 0: # Blink roughly every half second
             cursor_x = input_rect.right + 5
             cursor_y = input_rect.top
             cursor_height = input_rect.height
@@ -1090,7 +1070,8 @@ class OptimizedGame(OriginalGame):
             
         # Instructions
         instr_font = assets.get_font("small")
-        instr_text = instr_font.render("Enter numbers, BACKSPACE to delete, ENTER to confirm, ESC to cancel", True, UI_TEXT)
+        instr_text = self._text("Enter numbers, BACKSPACE to delete, ENTER to confirm, ESC to cancel",
+                                UI_TEXT, instr_font)
         instr_rect = instr_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 20))
         self.screen.blit(instr_text, instr_rect) 
 
@@ -1119,7 +1100,7 @@ class OptimizedGame(OriginalGame):
         
         # Level indicator box
         self._draw_bone_box(10, 40, info_box_width, 80)
-        level_text = self.font.render(f"Level: {self.current_level}", True, UI_TEXT)
+        level_text = self._text(f"Level: {self.current_level}", UI_TEXT)
         self.screen.blit(level_text, (20, 50))
         
         # Energy indicator box
@@ -1127,7 +1108,7 @@ class OptimizedGame(OriginalGame):
         # Ensure player exists before accessing attributes
         player_energy = self.player.energy if self.player else 0
         player_energy_max = self.player.energy_max if self.player else PLAYER_START_ENERGY
-        energy_text = self.font.render(f"Energy: {player_energy}/{player_energy_max}", True, UI_TEXT)
+        energy_text = self._text(f"Energy: {player_energy}/{player_energy_max}", UI_TEXT)
         self.screen.blit(energy_text, (info_box_width + 30, 50))
         
         # Draw energy bones (visual indicator)
@@ -1141,7 +1122,7 @@ class OptimizedGame(OriginalGame):
         self._draw_bone_box(info_box_width*2 + 30, 40, info_box_width, 80)
         
         player_keys = self.player.keys if self.player else 0
-        keys_text = self.font.render(f"Keys: {player_keys}", True, UI_TEXT)
+        keys_text = self._text(f"Keys: {player_keys}", UI_TEXT)
         self.screen.blit(keys_text, (info_box_width*2 + 40, 50))
         
         # Draw key bones
@@ -1152,7 +1133,7 @@ class OptimizedGame(OriginalGame):
         
         # --- Clone Count --- 
         clone_count = len(self.clones)
-        clones_text = self.font.render(f"Clones: {clone_count}", True, UI_TEXT)
+        clones_text = self._text(f"Clones: {clone_count}", UI_TEXT)
         self.screen.blit(clones_text, (info_box_width*2 + 40, 80))
         
         # Draw clone indicators (small pawprints)
@@ -1169,7 +1150,7 @@ class OptimizedGame(OriginalGame):
         
         pygame.draw.line(self.screen, UI_HIGHLIGHT, (0, SCREEN_HEIGHT - 36), (SCREEN_WIDTH, SCREEN_HEIGHT - 36), 2)
         
-        controls_text = self.font.render("WASD: Move | T: Time Travel | R: Restart | ESC: Pause | H: Help", True, UI_TEXT)
+        controls_text = self._text("WASD: Move | T: Time Travel | R: Restart | ESC: Pause | H: Help", UI_TEXT)
         controls_x = (SCREEN_WIDTH - controls_text.get_width()) // 2
         self.screen.blit(controls_text, (controls_x, SCREEN_HEIGHT - 30))
 
@@ -1179,12 +1160,16 @@ class OptimizedGame(OriginalGame):
         pygame.draw.rect(self.screen, UI_HIGHLIGHT, (x,y,width,height), 1)
         pass 
 
-    def _draw_mini_bone(self, x, y, size, color):
-        pygame.draw.circle(self.screen, color, (x, y), size // 4)
+    def _draw_mini_bone(self, x, y, size, color, surface=None):
+        if surface is None:
+            surface = self.screen
+        pygame.draw.circle(surface, color, (x, y), size // 4)
         pass
 
-    def _draw_decorative_paw(self, x, y, color, size):
-        pygame.draw.circle(self.screen, color, (x, y), size // 2)
+    def _draw_decorative_paw(self, x, y, color, size, surface=None):
+        if surface is None:
+            surface = self.screen
+        pygame.draw.circle(surface, color, (x, y), size // 2)
         pass
         
     def _draw_doggy_logo(self, x, y, size):
@@ -1230,7 +1215,7 @@ class OptimizedGame(OriginalGame):
              bold_font = pygame.font.SysFont(None, FONT_MEDIUM, bold=True)
 
         # Title
-        title = title_font.render("GAME RULES & HELP", True, DARK_BLUE)
+        title = self._text("GAME RULES & HELP", DARK_BLUE, title_font)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 60))
         self.screen.blit(title, title_rect)
         
@@ -1264,26 +1249,29 @@ class OptimizedGame(OriginalGame):
             else:
                  font_to_use = medium_font
             
-            # Add wrapping for longer lines if needed (simple version)
-            max_width = SCREEN_WIDTH - text_x - 50 # Leave margin
-            words = line.split(' ')
-            lines_to_render = []
-            current_line = ""
-            for word in words:
-                 test_line = current_line + word + " "
-                 test_surface = font_to_use.render(test_line, True, text_color)
-                 if test_surface.get_width() < max_width:
-                      current_line = test_line
-                 else:
-                      lines_to_render.append(current_line)
-                      current_line = word + " "
-            lines_to_render.append(current_line) # Add the last line
+            # Add wrapping for longer lines if needed (simple version). The
+            # rules don't change, so each line is only wrapped once
+            lines_to_render = self._rules_wrapped.get((line, font_to_use))
+            if lines_to_render is None:
+                max_width = SCREEN_WIDTH - text_x - 50 # Leave margin
+                words = line.split(' ')
+                lines_to_render = []
+                current_line = ""
+                for word in words:
+                     test_line = current_line + word + " "
+                     if font_to_use.size(test_line)[0] < max_width:
+                          current_line = test_line
+                     else:
+                          lines_to_render.append(current_line)
+                          current_line = word + " "
+                lines_to_render.append(current_line) # Add the last line
+                self._rules_wrapped[(line, font_to_use)] = lines_to_render
                 
             # Render the potentially wrapped lines
             for render_line in lines_to_render:
                  if y_pos + line_height > text_area_y + text_area_height: # Prevent drawing below text area
                      break 
-                 text = font_to_use.render(render_line.strip(), True, text_color)
+                 text = self._text(render_line.strip(), text_color, font_to_use)
                  self.screen.blit(text, (text_x, y_pos))
                  y_pos += line_height
             if y_pos + line_height > text_area_y + text_area_height:
@@ -1305,7 +1293,7 @@ class OptimizedGame(OriginalGame):
                                  (indicator_x + 10, bottom_y - 10)])
         
         # Return to menu instruction
-        back_text = medium_font.render("Press ESC to return", True, UI_HIGHLIGHT)
+        back_text = self._text("Press ESC to return", UI_HIGHLIGHT, medium_font)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
         self.screen.blit(back_text, back_rect)
 
@@ -7,6 +7,10 @@ import numpy as np
 from .constants import *
 from .assets import assets
 
+# Tiles that can always be entered; doors depend on their open state
+WALKABLE_TILES = (TILE_FLOOR, TILE_SWITCH, TILE_EXIT, TILE_PORTAL_A, TILE_PORTAL_B,
+                  TILE_ITEM_KEY, TILE_ITEM_POTION, TILE_TERMINAL)
+
 class World:
     """Manages the game world, including the map, objects, and their states."""
     
@@ -22,9 +26,13 @@ class World:
         self.width = 0
         self.height = 0
         self.map = None
+        self.tiles_flat = None        # 1D view of map, index y * width + x
+        self.transparent_grid = None  # [y, x] -> bool, mirrors is_transparent
+        self.walkable_grid = None     # [y, x] -> bool, mirrors is_walkable
         self.player_start = (1, 1)
         self.switches = {}  # (x, y) -> List of door_positions it controls
         self.doors = {}     # (x, y) -> {"required_switches": set(), "is_open": bool}
+        self.key_doors = set()  # Door positions that open with a key
         self.portals = {}   # (x, y) -> (x2, y2) (paired portal)
         self.items = {}     # (x, y) -> item_type
         self.terminals = {} # (x, y) -> message
@@ -52,7 +60,8 @@ class World:
                 # Initialize with width and height
                 self.width = width_or_data
                 self.height = height
-                self.map = np.full((self.height, self.width), TILE_FLOOR, dtype=int)
+                self.map = np.full((self.height, self.width), TILE_FLOOR, dtype=np.int8)
+                self._rebuild_grids()
             else:
                 # Initialize with level data
                 self.load_from_data(width_or_data)
@@ -71,11 +80,11 @@ class World:
                 return
                 
             # Handle the original tuple format
-            level_map, player_start, switch_positions, door_positions, portals_data, guard_positions, items_data, terminal_pos = level_data
+            level_map, player_start, switch_positions, door_positions, portals_data, guard_positions, items_data, terminal_pos, key_door_positions = level_data
             
             # Set basic properties
-            self.map = level_map
-            self.height, self.width = level_map.shape
+            self.map = np.ascontiguousarray(level_map, dtype=np.int8)
+            self.height, self.width = self.map.shape
             self.player_start = player_start
             
             # Process switches and doors
@@ -88,11 +97,10 @@ class World:
                 # Associate with switches (each switch opens all doors in this simple implementation)
                 for switch_pos in switch_positions:
                     self.switches[switch_pos].append(door_pos)
+            self.key_doors = set(key_door_positions)
             
             # Process portals
-            for portal_a, portal_b in portals_data:
-                self.portals[portal_a] = portal_b
-                self.portals[portal_b] = portal_a
+            self.portals = self._pair_portals(portals_data)
             
             # Process items
             for item_pos, item_type in items_data:
@@ -108,6 +116,8 @@ class World:
                     if self.map[y][x] == TILE_EXIT:
                         self.exit_pos = (x, y)
                         break
+            
+            self._rebuild_grids()
         except Exception as e:
             print(f"Error loading level data: {e}")
             import traceback
@@ -119,14 +129,16 @@ class World:
         self.width = level_data.get("width", 20)
         self.height = level_data.get("height", 15)
         
-        # Create map
-        self.map = np.full((self.height, self.width), TILE_FLOOR, dtype=int)
-        
-        # Set walls and other tiles
-        for y in range(self.height):
-            for x in range(self.width):
-                tile_val = level_data.get("map", {}).get((x, y), TILE_FLOOR)
-                self.map[y][x] = tile_val
+        # Create map; the generator hands over a 2D array, older data a sparse dict
+        tiles = level_data.get("map", {})
+        if isinstance(tiles, dict):
+            self.map = np.full((self.height, self.width), TILE_FLOOR, dtype=np.int8)
+            for (x, y), tile_val in tiles.items():
+                if 0 <= x < self.width and 0 <= y < self.height:
+                    self.map[y, x] = tile_val
+        else:
+            self.map = np.array(tiles, dtype=np.int8)
+            self.height, self.width = self.map.shape
         
         # Set player start
         self.player_start = level_data.get("player_start", (1, 1))
@@ -134,9 +146,10 @@ class World:
         # Process switches and doors
         self.switches = level_data.get("switches", {})
         self.doors = level_data.get("doors", {})
+        self.key_doors = set(level_data.get("key_doors", ()))
         
-        # Process portals
-        self.portals = level_data.get("portals", {})
+        # Process portals (the generator stores them as a list of pairs)
+        self.portals = self._pair_portals(level_data.get("portals", {}))
         
         # Process items
         self.items = level_data.get("items", {})
@@ -154,6 +167,71 @@ class World:
                     if self.map[y][x] == TILE_EXIT:
                         self.exit_pos = (x, y)
                         break
+        
+        self._rebuild_grids()
+    
+    def load_tiles_array(self, tiles):
+        """
+        Replace the whole map with a 2D tile array.
+        
+        Args:
+            tiles: Array-like of tile types indexed [y, x]; it is copied
+        """
+        self.map = np.array(tiles, dtype=np.int8)
+        self.height, self.width = self.map.shape
+        self._rebuild_grids()
+    
+    def _rebuild_grids(self):
+        """Recompute the flat tile view and per-tile lookup grids from the whole map."""
+        level_map = self.map
+        # The map is C-contiguous, so this is a view that sees every write
+        self.tiles_flat = level_map.ravel()
+        self.transparent_grid = (level_map != TILE_WALL) & (level_map != TILE_DOOR_CLOSED)
+        self.walkable_grid = np.isin(level_map, WALKABLE_TILES)
+        for door_pos, door_data in self.doors.items():
+            door_x, door_y = door_pos
+            if 0 <= door_y < self.height and 0 <= door_x < self.width:
+                if level_map[door_y, door_x] in (TILE_DOOR_CLOSED, TILE_DOOR_OPEN):
+                    self.walkable_grid[door_y, door_x] = door_data["is_open"]
+    
+    def _write_tile(self, x, y, tile_type):
+        """
+        Write one in-bounds map cell and keep the lookup grids in sync.
+        
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+            tile_type (int): New tile type
+        """
+        self.tiles_flat[y * self.width + x] = tile_type
+        self.transparent_grid[y, x] = tile_type != TILE_WALL and tile_type != TILE_DOOR_CLOSED
+        if tile_type == TILE_DOOR_CLOSED or tile_type == TILE_DOOR_OPEN:
+            door_data = self.doors.get((x, y))
+            self.walkable_grid[y, x] = door_data["is_open"] if door_data else False
+        else:
+            self.walkable_grid[y, x] = tile_type in WALKABLE_TILES
+    
+    @staticmethod
+    def _pair_portals(portals_data):
+        """
+        Build the two-way portal lookup once at load time.
+        
+        Args:
+            portals_data: List of (portal_a, portal_b) pairs, or an existing
+                {pos: paired_pos} dict
+                
+        Returns:
+            dict: (x, y) -> paired (x, y), with both directions present
+        """
+        if isinstance(portals_data, dict):
+            pairs = portals_data.items()
+        else:
+            pairs = portals_data
+        portals = {}
+        for portal_a, portal_b in pairs:
+            portals[tuple(portal_a)] = tuple(portal_b)
+            portals[tuple(portal_b)] = tuple(portal_a)
+        return portals
     
     def get_tile(self, x, y):
         """Wrapper for get_tile_at for compatibility."""
@@ -162,7 +240,7 @@ class World:
     def set_tile(self, x, y, tile_type):
         """Set a tile at the specified position."""
         if 0 <= y < self.height and 0 <= x < self.width:
-            self.map[y][x] = tile_type
+            self._write_tile(x, y, tile_type)
             
             # Special case for exit
             if tile_type == TILE_EXIT:
@@ -180,7 +258,7 @@ class World:
             int: Tile type at the position or TILE_WALL if out of bounds
         """
         if 0 <= y < self.height and 0 <= x < self.width:
-            return self.map[y][x]
+            return self.tiles_flat[y * self.width + x]
         return TILE_WALL  # Outside the map is considered a wall
     
     def _update_doors(self):
@@ -193,7 +271,7 @@ class World:
                 door_data["is_open"] = is_open
                 door_x, door_y = door_pos
                 if 0 <= door_y < self.height and 0 <= door_x < self.width:
-                    self.map[door_y][door_x] = TILE_DOOR_OPEN if is_open else TILE_DOOR_CLOSED
+                    self._write_tile(door_x, door_y, TILE_DOOR_OPEN if is_open else TILE_DOOR_CLOSED)
     
     def activate_switch(self, x, y):
         """
@@ -227,7 +305,7 @@ class World:
         if door_pos in self.doors:
             self.doors[door_pos]["is_open"] = True
             if 0 <= y < self.height and 0 <= x < self.width:
-                self.map[y][x] = TILE_DOOR_OPEN
+                self._write_tile(x, y, TILE_DOOR_OPEN)
     
     def get_paired_portal(self, portal_pos):
         """
@@ -255,7 +333,7 @@ class World:
             
         # Update the map
         if 0 <= y < self.height and 0 <= x < self.width:
-            self.map[y][x] = TILE_FLOOR
+            self._write_tile(x, y, TILE_FLOOR)
     
     def activate_terminal(self, x, y):
         """
@@ -292,10 +370,12 @@ class World:
         end_y = min(self.height, (cam_y + screen_height) // TILE_SIZE + 1)
         
         # Render each tile
+        tiles_flat = self.tiles_flat
         for y in range(start_y, end_y):
+            row = y * self.width
             for x in range(start_x, end_x):
                 # Get the tile type
-                tile_type = self.map[y][x]
+                tile_type = tiles_flat[row + x]
                 
                 # Get the corresponding image
                 image = None
@@ -303,7 +383,7 @@ class World:
                 if tile_type == TILE_WALL:
                     image = assets.get_image("wall")
                 elif tile_type == TILE_FLOOR:
-                    image = assets.get_image("floor")
+                    image = assets.get_floor_tile(x, y)
                 elif tile_type == TILE_SWITCH:
                     image = assets.get_image("switch")
                 elif tile_type == TILE_DOOR_CLOSED:
@@ -341,28 +421,19 @@ class World:
     def is_walkable(self, x, y):
         """
         Check if a tile is walkable.
-        """
-        tile = self.get_tile_at(x, y)
         
-        # Basic walkable tiles
-        if tile in [TILE_FLOOR, TILE_SWITCH, TILE_EXIT, TILE_PORTAL_A, TILE_PORTAL_B, 
-                    TILE_ITEM_KEY, TILE_ITEM_POTION, TILE_TERMINAL]:
-            return True
-            
-        # Special case for doors - check internal state
-        if tile == TILE_DOOR_CLOSED or tile == TILE_DOOR_OPEN:
-            door_data = self.doors.get((x,y))
-            return door_data["is_open"] if door_data else False # Walkable only if door exists and is open
-            
+        Doors count as walkable only while open; see walkable_grid.
+        """
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return bool(self.walkable_grid[y, x])
         return False
 
     def is_transparent(self, x, y):
         """
         Check if a tile is transparent (allows line of sight).
+        
+        Walls and closed doors block sight; see transparent_grid.
         """
-        tile = self.get_tile_at(x, y)
-        # Open doors are transparent
-        if tile == TILE_DOOR_OPEN:
-            return True
-        # Walls and closed doors are not
-        return tile != TILE_WALL and tile != TILE_DOOR_CLOSED 
\ No newline at end of file
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return bool(self.transparent_grid[y, x])
+        return False
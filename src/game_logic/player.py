@@ -1,3 +1,6 @@
+from collections import deque
+from itertools import islice
+
 import pygame
 
 class Player:
@@ -16,7 +19,7 @@ class Player:
         """
         self.x = x
         self.y = y
-        self.history = []  # List of past positions [(x, y), ...]
+        self.history = deque(maxlen=self.MAX_HISTORY)  # Past positions [(x, y), ...], oldest dropped first
         self.collected_keys = 0
         self.can_time_travel = True
         
@@ -97,11 +100,8 @@ class Player:
             x (int): X-coordinate
             y (int): Y-coordinate
         """
+        # The deque's maxlen drops the oldest entry once history is full
         self.history.append((x, y))
-        
-        # Trim history if it gets too long
-        if len(self.history) > self.MAX_HISTORY:
-            self.history.pop(0)
     
     def get_history(self, steps_back=None):
         """
@@ -113,10 +113,12 @@ class Player:
         Returns:
             list: List of positions [(x, y), ...]
         """
-        if steps_back is None or steps_back >= len(self.history):
-            return self.history.copy()
+        history = self.history
+        if steps_back is None or steps_back >= len(history):
+            return list(history)
         else:
-            return self.history[-steps_back:]
+            # Copy only the tail instead of the whole history
+            return list(islice(history, len(history) - steps_back, None))
     
     def get_position(self):
         """
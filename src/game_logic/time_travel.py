@@ -60,6 +60,23 @@ class Clone:
         
         return True
     
+    def update_n(self, n, world):
+        """
+        Advance the clone several steps at once.
+        
+        Args:
+            n (int): Number of steps to advance
+            world (World): The game world
+            
+        Returns:
+            bool: True if the clone is still active after all n steps
+        """
+        update = self.update
+        for _ in range(n):
+            if not update(world):
+                return False
+        return True
+    
     def get_position(self):
         """
         Get the clone's current position.
@@ -123,15 +140,12 @@ class TimeManager:
         if len(self.clones) >= self.MAX_CLONES:
             return False
         
-        # Get the player's history
-        history = player.get_history()
-        
         # Ensure there's enough history
-        if steps_back > len(history):
+        if steps_back > len(player.history):
             return False
         
         # Create a new clone starting from the selected point
-        path = history[-(steps_back):]
+        path = player.get_history(steps_back)
         clone = Clone(path)
         self.clones.append(clone)
         
@@ -0,0 +1,30 @@
+"""
+Small helpers shared by the Temporal Maze launcher scripts.
+"""
+
+import sys
+from importlib import import_module
+
+
+def cached_import(module_path, class_name):
+    """
+    Return an attribute from a module, importing the module only if needed.
+    
+    Reads sys.modules once and only falls back to the import machinery when
+    the module is missing or still being initialized.
+    
+    Args:
+        module_path (str): Dotted path of the module
+        class_name (str): Name of the attribute to fetch from the module
+        
+    Returns:
+        The requested attribute
+    """
+    modules = sys.modules
+    module = modules.get(module_path)
+    if module is None or (
+        getattr(module, "__spec__", None) is not None
+        and getattr(module.__spec__, "_initializing", False) is not False
+    ):
+        import_module(module_path)
+    return getattr(sys.modules[module_path], class_name)